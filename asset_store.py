@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Asset Store - Content-addressed shared storage for files staged into outputs
+
+Every output directory needs the same fonts, icons, profile photo and CSS.
+Instead of copying them per version, each file is stored once under its hash
+and linked into place (hardlink, then reflink, then plain copy as fallbacks).
+Destinations that already hold identical content are left untouched, so warm
+runs do almost no I/O.
+
+Staged files are shared between output trees: never modify one in place.
+Writers that change a staged file must write a new file and rename it over.
+"""
+
+import hashlib
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+
+# Linux FICLONE ioctl: copy-on-write clone on btrfs/xfs
+FICLONE = 0x40049409
+
+
+def sha256_file(path: Path) -> str:
+    """Hash a file without any memoization"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class AssetStore:
+    """
+    Content-addressed file store that links assets into output directories.
+
+    Args:
+        store_dir: Where stored objects live (same filesystem as the outputs,
+            so hardlinks work)
+        hash_file: Hash function; pass a memoized one (e.g. BuildCache.hash_file)
+            to avoid re-reading unchanged files
+    """
+
+    def __init__(self, store_dir: Path, hash_file: Optional[Callable[[Path], str]] = None):
+        self.store_dir = Path(store_dir)
+        self.hash_file = hash_file or sha256_file
+        self.stats: Dict[str, int] = {"unchanged": 0, "hardlink": 0, "reflink": 0, "copy": 0}
+
+    def put(self, src: Path) -> Path:
+        """Store a file under its content hash and return the stored path"""
+        src = Path(src)
+        sha = self.hash_file(src)
+        stored = self.store_dir / sha[:2] / f"{sha}{src.suffix}"
+        if not stored.exists():
+            stored.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = stored.with_name(stored.name + f".{os.getpid()}.{threading.get_ident()}.tmp")
+            shutil.copy2(src, tmp_path)
+            tmp_path.replace(stored)
+        return stored
+
+    def put_bytes(self, data: bytes, suffix: str = "") -> Path:
+        """Store generated content (e.g. subset fonts, generated CSS)"""
+        sha = hashlib.sha256(data).hexdigest()
+        stored = self.store_dir / sha[:2] / f"{sha}{suffix}"
+        if not stored.exists():
+            stored.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = stored.with_name(stored.name + f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(data)
+            tmp_path.replace(stored)
+        return stored
+
+    def _is_identical(self, dest: Path, stored: Path) -> bool:
+        try:
+            if os.path.samefile(dest, stored):
+                return True
+        except OSError:
+            return False
+        return (
+            dest.stat().st_size == stored.stat().st_size
+            and self.hash_file(dest) == self.hash_file(stored)
+        )
+
+    def _link_or_copy(self, stored: Path, dest: Path) -> str:
+        """Materialize a stored object at dest using the cheapest method available"""
+        try:
+            os.link(stored, dest)
+            return "hardlink"
+        except OSError:
+            pass
+
+        try:
+            import fcntl
+
+            with open(stored, "rb") as src_file, open(dest, "wb") as dest_file:
+                fcntl.ioctl(dest_file.fileno(), FICLONE, src_file.fileno())
+            shutil.copystat(stored, dest)
+            return "reflink"
+        except (OSError, ImportError):
+            dest.unlink(missing_ok=True)
+
+        shutil.copy2(stored, dest)
+        return "copy"
+
+    def stage_stored(self, stored: Path, dest: Path) -> str:
+        """Place an already stored object at dest, skipping if identical"""
+        dest = Path(dest)
+        if dest.exists() and self._is_identical(dest, stored):
+            self.stats["unchanged"] += 1
+            return "unchanged"
+
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        # Link to a temp name and rename, so a shared file is never rewritten in place
+        tmp_path = dest.with_name(f".{dest.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.unlink(missing_ok=True)
+        method = self._link_or_copy(stored, tmp_path)
+        tmp_path.replace(dest)
+        self.stats[method] += 1
+        return method
+
+    def stage(self, src: Path, dest: Path) -> str:
+        """Stage one source file at dest; returns the method used"""
+        return self.stage_stored(self.put(src), dest)
+
+    def stage_tree(self, src_dir: Path, dest_dir: Path) -> None:
+        """Mirror a directory, removing destination files the source no longer has"""
+        src_dir, dest_dir = Path(src_dir), Path(dest_dir)
+        wanted = set()
+        for src in sorted(p for p in src_dir.rglob("*") if p.is_file()):
+            relative = src.relative_to(src_dir)
+            wanted.add(relative)
+            self.stage(src, dest_dir / relative)
+
+        if dest_dir.exists():
+            for dest in [p for p in dest_dir.rglob("*") if p.is_file()]:
+                if dest.relative_to(dest_dir) not in wanted:
+                    dest.unlink()
+
+    def summary(self) -> str:
+        """One-line staging summary, e.g. '3 hardlink, 20 unchanged'"""
+        return ", ".join(f"{count} {method}" for method, count in self.stats.items() if count)
+
+    def reset_stats(self) -> None:
+        for method in self.stats:
+            self.stats[method] = 0
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Async Build - Overlap version/template builds on one event loop
+
+Build stages stay the synchronous code of CVBuilder; each version runs its
+stages on a worker thread while every external tool (pandoc, Chrome,
+WeasyPrint, PDF engines) is launched as an asyncio subprocess on the loop.
+That gives one place to bound each backend with a semaphore (eight pandoc
+runs may overlap while only two Chrome instances start at once), to enforce
+per-target timeouts and to cancel work: a cancelled or timed-out target has
+its running tools killed, and any tool it would start next raises
+CancelledError in its thread so the stage unwinds.
+
+Targets sharing a version share an output directory, so they run one after
+the other inside the same task (as in build_parallel); different versions
+overlap.
+
+Usage:
+    results = asyncio.run(builder.abuild([("ai", "francois"), ("general", "francois")], "pdf"))
+"""
+
+import asyncio
+import concurrent.futures
+import contextvars
+import os
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from cancel_scope import CancelScope, current_scope, enter_scope, exit_scope
+
+
+def default_limits() -> Dict[str, int]:
+    """Concurrent processes allowed per backend, scaled to the machine"""
+    cpus = os.cpu_count() or 2
+    return {
+        "pandoc": cpus,
+        "chrome": max(1, cpus // 2),  # Browser processes (or session tabs) are memory-hungry
+        "weasyprint": max(1, cpus // 2),
+    }
+
+
+def backend_of(tool: str) -> str:
+    """Backend whose limit applies to a tool name as passed to CVBuilder._run_tool"""
+    for backend in ("pandoc", "chrome", "weasyprint"):
+        if tool.startswith(backend):
+            return backend
+    return tool
+
+
+class ToolRunner:
+    """
+    Runs a builder's external tools as asyncio subprocesses, bounded per backend.
+
+    Stage threads call run() and slot(); the work itself happens on the loop.
+
+    Args:
+        loop: Event loop the subprocesses run on
+        limits: Concurrent processes per backend (see default_limits)
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, limits: Dict[str, int]):
+        self.loop = loop
+        self.limits = limits
+        self.semaphores = {backend: asyncio.Semaphore(limit) for backend, limit in limits.items()}
+
+    def run(self, tool: str, cmd: List[str], **kwargs: Any) -> subprocess.CompletedProcess:
+        """subprocess.run replacement for stage threads (same arguments and errors)"""
+        scope = current_scope()
+        if scope is not None:
+            scope.check()
+
+        future = asyncio.run_coroutine_threadsafe(self.run_async(tool, cmd, **kwargs), self.loop)
+        if scope is not None:
+            scope.running.add(future)
+            if scope.cancelled:  # Cancelled between the check and registering
+                future.cancel()
+        try:
+            return future.result()
+        except concurrent.futures.CancelledError:
+            # Not an Exception subclass, so stage error handling does not swallow it
+            raise asyncio.CancelledError()
+        finally:
+            if scope is not None:
+                scope.running.discard(future)
+
+    async def run_async(
+        self,
+        tool: str,
+        cmd: List[str],
+        check: bool = False,
+        capture_output: bool = False,
+        text: bool = False,
+        timeout: Optional[float] = None,
+        env: Optional[Dict[str, str]] = None,
+    ) -> subprocess.CompletedProcess:
+        """Run one command once its backend has a free slot; killed on timeout or cancel"""
+        pipe = subprocess.PIPE if capture_output else None
+        async with self._semaphore(tool):
+            process = await asyncio.create_subprocess_exec(*cmd, stdout=pipe, stderr=pipe, env=env)
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+            except asyncio.TimeoutError:
+                await self._kill(process)
+                raise subprocess.TimeoutExpired(cmd, timeout)
+            except asyncio.CancelledError:
+                await self._kill(process)
+                raise
+
+        if text:
+            stdout = stdout.decode("utf-8", "replace") if stdout is not None else None
+            stderr = stderr.decode("utf-8", "replace") if stderr is not None else None
+        result = subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
+        if check:
+            result.check_returncode()
+        return result
+
+    @contextmanager
+    def slot(self, backend: str) -> Iterator[None]:
+        """Hold one of a backend's slots from a stage thread (in-process renderers)"""
+        asyncio.run_coroutine_threadsafe(self._semaphore(backend).acquire(), self.loop).result()
+        try:
+            yield
+        finally:
+            self.loop.call_soon_threadsafe(self._semaphore(backend).release)
+
+    def _semaphore(self, tool: str) -> asyncio.Semaphore:
+        backend = backend_of(tool)
+        if backend not in self.semaphores:
+            self.semaphores[backend] = asyncio.Semaphore(1)  # Unknown tools run one at a time
+        return self.semaphores[backend]
+
+    @staticmethod
+    async def _kill(process: asyncio.subprocess.Process) -> None:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+
+
+async def build_async(
+    builder: Any,
+    targets: List[Tuple[str, str]],
+    mode: str = "pdf",
+    no_enrich: bool = False,
+    from_existing: bool = False,
+    timeout: Optional[float] = None,
+    limits: Optional[Dict[str, int]] = None,
+    max_tasks: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Build version/template targets concurrently with one builder.
+
+    Args:
+        builder: CVBuilder whose stages run the targets
+        targets: (version, template) pairs
+        mode: One of 'markdown', 'html' or 'pdf' (see CVBuilder.build_target)
+        timeout: Seconds each target may take before it is cancelled
+        limits: Concurrent processes per backend (merged over default_limits)
+        max_tasks: Versions building at the same time (default: all)
+
+    Returns:
+        One result dict per target with 'version', 'template', 'success',
+        'duration' and 'error' keys, in the order of targets
+    """
+    loop = asyncio.get_running_loop()
+    runner = ToolRunner(loop, {**default_limits(), **(limits or {})})
+
+    targets_by_version: Dict[str, List[Tuple[str, str]]] = {}
+    for version, template in targets:
+        targets_by_version.setdefault(version, []).append((version, template))
+
+    workers = max(1, min(max_tasks or len(targets_by_version), len(targets_by_version)))
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="abuild")
+    # Stage threads share one manifest; save it once at the end
+    autosave, builder.build_cache.autosave = builder.build_cache.autosave, False
+    previous_runner, builder.tool_runner = builder.tool_runner, runner
+    results: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+    async def build_one(version: str, template: str) -> None:
+        scope = CancelScope(f"{version}:{template}")
+        token = enter_scope(scope)
+        try:
+            thread_context = contextvars.copy_context()
+        finally:
+            exit_scope(token)
+
+        start = time.perf_counter()
+        work = loop.run_in_executor(
+            executor, thread_context.run, builder.build_target, version, template, mode, no_enrich, from_existing
+        )
+        error = None
+        try:
+            await asyncio.wait_for(asyncio.shield(work), timeout)
+        except asyncio.TimeoutError:
+            error = f"Timed out after {timeout:.0f}s"
+        except asyncio.CancelledError:
+            scope.cancel()
+            await asyncio.gather(work, return_exceptions=True)
+            raise
+        except Exception as e:
+            error = str(e)
+        finally:
+            if error is not None and not work.done():
+                # Kill its running tools and wait for the thread to unwind, so
+                # the next target of this version does not race on its files
+                scope.cancel()
+                await asyncio.gather(work, return_exceptions=True)
+
+        results[(version, template)] = {
+            "version": version, "template": template, "success": error is None,
+            "duration": time.perf_counter() - start, "error": error,
+        }
+        print(f"{'✅' if error is None else '❌'} {scope.name} finished in "
+              f"{results[(version, template)]['duration']:.2f}s" + (f": {error}" if error else ""))
+
+    # Timeouts start once a version has a thread, not while it waits for one
+    tasks = asyncio.Semaphore(workers)
+
+    async def build_version(version_targets: List[Tuple[str, str]]) -> None:
+        async with tasks:
+            for version, template in version_targets:
+                await build_one(version, template)
+
+    try:
+        await asyncio.gather(*(build_version(group) for group in targets_by_version.values()))
+    finally:
+        builder.tool_runner = previous_runner
+        builder.build_cache.autosave = autosave
+        builder.build_cache.save()
+        executor.shutdown(wait=False)
+
+    return [results[target] for target in targets if target in results]
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Backend Registry - Lazy, cached probing of PDF/HTML rendering backends
+
+Probing a backend means resolving its binary and asking it for a version,
+which spawns a process (Chrome alone takes hundreds of milliseconds). Results
+are probed only when a backend is first needed and cached on disk, so later
+runs skip the probe entirely. A cached result is discarded when it is older
+than the TTL, when PATH changed, or when the probed binary was replaced.
+"""
+
+import hashlib
+import importlib.util
+import json
+import os
+import shutil
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Any, List, Optional
+
+from chrome_renderer import find_chrome
+
+
+REGISTRY_VERSION = 1
+DEFAULT_TTL = 24 * 3600
+# Missing backends are re-checked sooner, so a fresh install is noticed
+NEGATIVE_TTL = 10 * 60
+
+# PDF engines pandoc can drive while keeping the HTML/CSS layout
+PANDOC_PDF_ENGINES = ["weasyprint", "wkhtmltopdf", "prince", "pagedjs-cli"]
+
+
+def _binary_version(binary: str, args: Optional[List[str]] = None) -> Optional[str]:
+    """First line of `binary --version`, or None if it does not run"""
+    try:
+        result = subprocess.run(
+            [binary] + (args or ["--version"]), capture_output=True, text=True, timeout=15
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+    lines = (result.stdout or result.stderr).strip().splitlines()
+    return lines[0].strip() if lines else ""
+
+
+def probe_chrome() -> Dict[str, Any]:
+    path = find_chrome()
+    version = _binary_version(path) if path else None
+    return {
+        "available": version is not None,
+        "path": path,
+        "version": version,
+        "capabilities": ["devtools-pipe", "print-to-pdf"] if version is not None else [],
+    }
+
+
+def probe_weasyprint_python() -> Dict[str, Any]:
+    # Locate the package without importing it (the import loads Pango/Cairo)
+    spec = importlib.util.find_spec("weasyprint")
+    if spec is None:
+        return {"available": False, "path": None, "version": None, "capabilities": []}
+    try:
+        from importlib.metadata import version as package_version
+        version = package_version("weasyprint")
+    except Exception:
+        version = None
+    return {"available": True, "path": spec.origin, "version": version, "capabilities": ["in-process"]}
+
+
+def probe_weasyprint_cmd() -> Dict[str, Any]:
+    path = shutil.which("weasyprint")
+    version = _binary_version(path) if path else None
+    return {
+        "available": version is not None,
+        "path": path,
+        "version": version,
+        "capabilities": ["cli"] if version is not None else [],
+    }
+
+
+def probe_pandoc() -> Dict[str, Any]:
+    path = shutil.which("pandoc")
+    version = _binary_version(path) if path else None
+    engines = [engine for engine in PANDOC_PDF_ENGINES if shutil.which(engine)]
+    return {
+        "available": version is not None,
+        "path": path,
+        "version": version,
+        "capabilities": (["html"] + [f"pdf-engine:{engine}" for engine in engines]) if version is not None else [],
+    }
+
+
+# Probe functions in --check-deps display order
+PROBES: Dict[str, Callable[[], Dict[str, Any]]] = {
+    "pandoc": probe_pandoc,
+    "chrome": probe_chrome,
+    "weasyprint_cmd": probe_weasyprint_cmd,
+    "weasyprint_python": probe_weasyprint_python,
+}
+
+
+def _path_env_hash() -> str:
+    return hashlib.sha256(os.environ.get("PATH", "").encode("utf-8")).hexdigest()
+
+
+def _mtime_ns(path: Optional[str]) -> Optional[int]:
+    if not path:
+        return None
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+class BackendRegistry:
+    """
+    Probe results per backend, resolved on first use and cached on disk.
+
+    Each entry holds 'available', 'path', 'version', 'capabilities' and
+    'probe_ms' (latency of the probe that produced it); 'cached' tells whether
+    this process reused a stored result.
+
+    Args:
+        cache_path: JSON file holding probe results between runs
+        ttl: Seconds before a cached result is probed again
+        probes: Backend name → probe function (defaults to PROBES)
+    """
+
+    def __init__(
+        self,
+        cache_path: Path,
+        ttl: float = DEFAULT_TTL,
+        probes: Optional[Dict[str, Callable[[], Dict[str, Any]]]] = None,
+    ):
+        self.cache_path = Path(cache_path)
+        self.ttl = ttl
+        self.probes = probes if probes is not None else PROBES
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._stored: Optional[Dict[str, Dict[str, Any]]] = None
+
+    def _load_stored(self) -> Dict[str, Dict[str, Any]]:
+        """Read cached probe results once, ignoring an unreadable or outdated file"""
+        if self._stored is None:
+            self._stored = {}
+            try:
+                with open(self.cache_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") == REGISTRY_VERSION:
+                    self._stored = data.get("backends", {})
+            except (OSError, ValueError, AttributeError):
+                pass
+        return self._stored
+
+    def _is_valid(self, entry: Dict[str, Any]) -> bool:
+        """A stored result holds while young, on the same PATH, with the same binary"""
+        ttl = self.ttl if entry.get("available") else min(self.ttl, NEGATIVE_TTL)
+        return (
+            time.time() - entry.get("probed_at", 0) < ttl
+            and entry.get("path_env") == _path_env_hash()
+            and entry.get("binary_mtime") == _mtime_ns(entry.get("path"))
+        )
+
+    def get(self, name: str, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Probe result for one backend, probing only if nothing valid is cached.
+
+        Raises:
+            KeyError: Unknown backend name
+        """
+        if name not in self.probes:
+            raise KeyError(f"Unknown backend: {name}")
+
+        if not refresh:
+            if name in self._entries:
+                return self._entries[name]
+            stored = self._load_stored().get(name)
+            if stored and self._is_valid(stored):
+                self._entries[name] = dict(stored, cached=True)
+                return self._entries[name]
+
+        start = time.perf_counter()
+        try:
+            entry = self.probes[name]()
+        except Exception as e:
+            entry = {"available": False, "path": None, "version": None, "capabilities": [], "error": str(e)}
+        entry.update({
+            "probe_ms": (time.perf_counter() - start) * 1000,
+            "probed_at": time.time(),
+            "path_env": _path_env_hash(),
+            "binary_mtime": _mtime_ns(entry.get("path")),
+        })
+
+        self._entries[name] = dict(entry, cached=False)
+        self._load_stored()[name] = entry
+        self.save()
+        return self._entries[name]
+
+    def available(self, name: str) -> bool:
+        return self.get(name)["available"]
+
+    def path(self, name: str) -> Optional[str]:
+        """Resolved binary (or module) path, None when unavailable"""
+        entry = self.get(name)
+        return entry["path"] if entry["available"] else None
+
+    def capabilities(self, name: str) -> List[str]:
+        return self.get(name).get("capabilities", [])
+
+    def probe_all(self, refresh: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Results for every backend, in display order"""
+        return {name: self.get(name, refresh=refresh) for name in self.probes}
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Forget one backend (or all) so it is probed again on next use"""
+        names = [name] if name else list(self.probes)
+        stored = self._load_stored()
+        for backend in names:
+            self._entries.pop(backend, None)
+            stored.pop(backend, None)
+        self.save()
+
+    def save(self) -> None:
+        """Write probe results atomically (best effort)"""
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_name(
+                f"{self.cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+            )
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"version": REGISTRY_VERSION, "backends": self._load_stored()},
+                    f,
+                    indent=2,
+                    sort_keys=True,
+                )
+            tmp_path.replace(self.cache_path)
+        except OSError as e:
+            print(f"Warning: could not save backend cache: {e}")
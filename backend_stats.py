@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Backend Stats - Outcome history that orders PDF backends adaptively
+
+The PDF stage used to try Chrome, WeasyPrint and pandoc in a fixed order, so
+a machine where Chrome keeps failing paid for a failed Chrome attempt on every
+PDF, and one where WeasyPrint is much faster never used it first. Each attempt
+now records its outcome and duration here (a small JSON file in the cache
+directory), and backends are tried by observed success rate, then median
+latency.
+
+A circuit breaker skips a backend after several consecutive failures until a
+cooldown has passed; the next attempt after that is a trial, and one more
+failure opens the circuit again. An attempt cancelled because another backend
+won a hedged race is neither: it is kept as a latency sample (the time it had
+run), so a slow backend drops in the order without its circuit opening.
+
+Builders in one process share one instance per file (get_backend_stats), and
+saving replays this process's new outcomes onto the file's current contents,
+so processes sharing a cache directory do not overwrite each other's history.
+"""
+
+import json
+import os
+import statistics
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+# Outcomes kept per backend (older ones stop influencing the order)
+WINDOW = 20
+
+# Consecutive failures that open a backend's circuit, and for how long
+FAILURE_THRESHOLD = 3
+COOLDOWN_SECONDS = 15 * 60
+
+STATS_VERSION = 1
+
+
+class BackendStats:
+    """
+    Per-backend outcome history with a circuit breaker.
+
+    Args:
+        path: JSON file the history is kept in
+        window: Outcomes kept per backend
+        failure_threshold: Consecutive failures that open the circuit
+        cooldown: Seconds an open circuit skips the backend
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        window: int = WINDOW,
+        failure_threshold: int = FAILURE_THRESHOLD,
+        cooldown: float = COOLDOWN_SECONDS,
+    ):
+        self.path = Path(path)
+        self.window = window
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.backends: Dict[str, Dict[str, Any]] = self._load()
+        self._pending: List[Dict[str, Any]] = []  # Recorded here, exported to the parent
+        self._unsaved: List[Dict[str, Any]] = []  # Not in the file yet
+        # Stages record from several threads (abuild, hedged races, render server)
+        self._lock = threading.RLock()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != STATS_VERSION:
+            return {}
+        return data.get("backends", {})
+
+    def _apply(self, backends: Dict[str, Dict[str, Any]], outcome: Dict[str, Any]) -> None:
+        """Add an outcome to a history and update the backend's circuit"""
+        entry = backends.setdefault(
+            outcome["backend"], {"outcomes": [], "consecutive_failures": 0, "open_until": 0.0}
+        )
+        # Lost races are kept with success None: a latency sample, not a success or failure
+        success = None if outcome["lost"] else outcome["success"]
+        entry["outcomes"] = (
+            entry["outcomes"] + [[success, round(outcome["duration"], 4), outcome["at"]]]
+        )[-self.window:]
+        if outcome["lost"]:
+            return
+        if outcome["success"]:
+            entry["consecutive_failures"] = 0
+            entry["open_until"] = 0.0
+        else:
+            entry["consecutive_failures"] += 1
+            if entry["consecutive_failures"] >= self.failure_threshold:
+                entry["open_until"] = outcome["at"] + self.cooldown
+
+    def record(
+        self, backend: str, success: bool, duration: float, at: Optional[float] = None, lost: bool = False
+    ) -> None:
+        """
+        Add one attempt's outcome and update the backend's circuit.
+
+        lost=True records an attempt cancelled when another backend won a
+        hedged race: its duration counts toward the median latency only.
+        """
+        outcome = {
+            "backend": backend, "success": bool(success), "duration": duration,
+            "at": time.time() if at is None else at, "lost": bool(lost),
+        }
+        with self._lock:
+            self._apply(self.backends, outcome)
+            self._pending.append(outcome)
+            self._unsaved.append(outcome)
+
+    def allowed(self, backend: str, now: Optional[float] = None) -> bool:
+        """False while the backend's circuit is open"""
+        entry = self.backends.get(backend)
+        if entry is None:
+            return True
+        return (time.time() if now is None else now) >= entry["open_until"]
+
+    def success_rate(self, backend: str) -> float:
+        """Smoothed success rate (0.5 for a backend without history); lost races are left out"""
+        outcomes = [outcome for outcome in self.backends.get(backend, {}).get("outcomes", []) if outcome[0] is not None]
+        successes = sum(1 for success, _, _ in outcomes if success)
+        return (successes + 1) / (len(outcomes) + 2)
+
+    def median_latency(self, backend: str) -> Optional[float]:
+        """Median duration of successful attempts and lost races, None without any"""
+        durations = [
+            duration for success, duration, _ in self.backends.get(backend, {}).get("outcomes", [])
+            if success is not False
+        ]
+        return statistics.median(durations) if durations else None
+
+    def order(self, backends: List[str]) -> List[str]:
+        """
+        Backends by success rate, then median latency.
+
+        Rates are compared in steps of 0.1 so a slightly less reliable but much
+        faster backend is not ranked behind a slow one; ties keep the given
+        (default) order. Backends with an open circuit are not removed (see
+        allowed()).
+        """
+        def key(indexed):
+            index, backend = indexed
+            latency = self.median_latency(backend)
+            return (
+                -round(self.success_rate(backend), 1),
+                latency if latency is not None else float("inf"),
+                index,
+            )
+
+        return [backend for _, backend in sorted(enumerate(backends), key=key)]
+
+    def export_changes(self) -> List[Dict[str, Any]]:
+        """Return and forget the outcomes recorded by this instance"""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        return pending
+
+    def merge(self, outcomes: List[Dict[str, Any]]) -> None:
+        """Replay outcomes recorded by another (worker) instance"""
+        with self._lock:
+            for outcome in sorted(outcomes, key=lambda outcome: outcome["at"]):
+                self._apply(self.backends, outcome)
+                self._unsaved.append(outcome)
+
+    def describe(self, backend: str, now: Optional[float] = None) -> str:
+        """One-line summary, e.g. '18/20 ok, median 0.42s'"""
+        entry = self.backends.get(backend)
+        if not entry or not entry["outcomes"]:
+            return "no history"
+        successes = sum(1 for success, _, _ in entry["outcomes"] if success)
+        lost = sum(1 for success, _, _ in entry["outcomes"] if success is None)
+        latency = self.median_latency(backend)
+        text = f"{successes}/{len(entry['outcomes']) - lost} ok"
+        if lost:
+            text += f", {lost} races lost"
+        if latency is not None:
+            text += f", median {latency:.2f}s"
+        if not self.allowed(backend, now):
+            remaining = entry["open_until"] - (time.time() if now is None else now)
+            text += f", skipped for {remaining / 60:.0f} more min after {entry['consecutive_failures']} failures"
+        return text
+
+    def save(self) -> None:
+        """
+        Persist new outcomes atomically.
+
+        They are replayed onto the file as it is now, not onto the history
+        loaded at start, so outcomes saved meanwhile by other processes stay.
+        """
+        with self._lock:
+            if not self._unsaved:
+                return
+            backends = self._load()
+            for outcome in self._unsaved:
+                self._apply(backends, outcome)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(self.path.name + f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": STATS_VERSION, "backends": backends}, f, indent=1, sort_keys=True)
+            tmp_path.replace(self.path)
+            self.backends = backends
+            self._unsaved = []
+
+
+_stats: Dict[str, BackendStats] = {}
+_stats_lock = threading.Lock()
+
+
+def _reset_after_fork() -> None:
+    # Forked workers start from the file, not from the parent's unsaved outcomes
+    global _stats_lock
+    _stats.clear()
+    _stats_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def get_backend_stats(path: Path) -> BackendStats:
+    """Return the shared history for a stats file (one per process)"""
+    key = str(Path(path).absolute())
+    with _stats_lock:
+        if key not in _stats:
+            _stats[key] = BackendStats(path)
+        return _stats[key]
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Batch Build - Build CVs for many people in one process
+
+Each person has their own content directory holding versions.yaml and the
+'<person>-*.yaml' content files; the person is detected from the
+'<person>-personal.yaml' file name unless the manifest names it. Outputs go to
+<output-root>/<person>/<version>/<person>-<version>.<ext>.
+
+Everything that does not depend on the person is shared: every worker keeps
+one builder and switches it from person to person, so templates are
+discovered once and the markdown enricher, content cache and PDF renderers
+(Chrome session, WeasyPrint fonts) stay warm; all people link assets from one
+content-addressed store and reuse one font-subset cache, so identical CSS,
+fonts and icons are stored once.
+
+People are built across a pool of worker processes (one person per job, so a
+person's versions never race on their output directory). Each person's
+console output is captured and printed as one block, followed by a summary of
+per-person success and timings.
+
+Manifest (YAML or JSON):
+
+    people:
+      - content_dir: people/jane/content
+        person: jane              # optional, detected from jane-personal.yaml
+        versions: [ai, general]   # optional, default: every version
+      - people/*/content          # plain entries and globs work too
+
+Usage:
+    python batch_build.py people/*/content --html --jobs 4
+    python batch_build.py --manifest batch.yaml --pdf --output-root output/people
+"""
+
+import argparse
+import contextlib
+import glob
+import io
+import multiprocessing.util
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import yaml
+
+from build_system import CVBuilder, detect_person
+
+
+# Per-process state shared by every person a worker builds
+_WORKER_SHARED: Dict[str, Any] = {}
+
+
+def load_manifest(path: Path) -> List[Any]:
+    """Entries of a batch manifest: a list, or a mapping with a 'people' list"""
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml.safe_load(f)  # JSON is valid YAML
+    if isinstance(data, dict):
+        data = data.get("people", [])
+    if not isinstance(data, list):
+        raise ValueError(f"{path}: expected a list of people or a 'people' list")
+    return data
+
+
+def resolve_people(entries: List[Any]) -> List[Dict[str, Any]]:
+    """
+    Expand manifest entries (paths, globs or dicts) into one job per person.
+
+    Returns:
+        Dicts with 'person', 'content_dir' and 'versions' (None for all).
+        Two directories detected as the same person get distinct names
+        ('jane', 'jane-2') so their outputs do not collide.
+    """
+    people = []
+    seen: Dict[str, int] = {}
+
+    for entry in entries:
+        if isinstance(entry, str):
+            entry = {"content_dir": entry}
+        pattern = str(entry["content_dir"])
+        content_dirs = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+
+        for content_dir in content_dirs:
+            if not Path(content_dir).is_dir():
+                print(f"⚠️  Skipping {content_dir}: not a directory")
+                continue
+            person = entry.get("person") or detect_person(Path(content_dir))
+            seen[person] = seen.get(person, 0) + 1
+            people.append({
+                "person": person,
+                "name": person if seen[person] == 1 else f"{person}-{seen[person]}",
+                "content_dir": content_dir,
+                "versions": entry.get("versions"),
+            })
+
+    return people
+
+
+def _init_batch_worker(
+    output_root: str, cache_dir: str, force: bool, subset_fonts: bool,
+    prune_css: bool = True, single_file: bool = False, hedge_delay: Optional[float] = None,
+) -> None:
+    """Record the build options; the worker's builder is created for its first person"""
+    _WORKER_SHARED.clear()
+    _WORKER_SHARED.update({
+        "output_root": output_root,
+        "cache_dir": cache_dir,
+        "force": force,
+        "subset_fonts": subset_fonts,
+        "prune_css": prune_css,
+        "single_file": single_file,
+        "hedge_delay": hedge_delay,
+    })
+    if multiprocessing.parent_process() is not None:
+        # Pool workers exit without running atexit handlers
+        multiprocessing.util.Finalize(None, _close_worker_builder, exitpriority=10)
+
+
+def _close_worker_builder() -> None:
+    """Release the worker's renderers and persist its caches"""
+    builder = _WORKER_SHARED.pop("builder", None)
+    if builder is not None:
+        builder.close()
+
+
+def _person_builder(job: Dict[str, Any]) -> CVBuilder:
+    """The worker's builder, switched to one person's content and output directory"""
+    shared = _WORKER_SHARED
+    output_root = Path(shared["output_root"])
+    output_dir = str(output_root / job["name"])
+    builder = shared.get("builder")
+    if builder is not None:
+        builder.use_person(job["content_dir"], output_dir, job["person"])
+        return builder
+
+    shared["builder"] = CVBuilder(
+        job["content_dir"],
+        output_dir,
+        force=shared["force"],
+        cache_dir=shared["cache_dir"],
+        subset_fonts=shared["subset_fonts"],
+        person=job["person"],
+        asset_dir=str(output_root / ".assets"),
+        prune_css=shared["prune_css"],
+        single_file=shared["single_file"],
+        hedge_delay=shared["hedge_delay"],
+    )
+    return shared["builder"]
+
+
+def _build_person(job: Dict[str, Any], mode: str, template: str, no_enrich: bool) -> Dict[str, Any]:
+    """Build every requested version of one person, capturing console output"""
+    buffer = io.StringIO()
+    start = time.perf_counter()
+    result = {"name": job["name"], "content_dir": job["content_dir"], "versions": [], "error": None}
+
+    with contextlib.redirect_stdout(buffer):
+        builder = None
+        try:
+            builder = _person_builder(job)
+            versions = job["versions"] or list(builder.versions)
+            unknown = [version for version in versions if version not in builder.versions]
+            if unknown:
+                raise ValueError(f"Unknown versions: {', '.join(unknown)}")
+
+            for version in versions:
+                builder.build_target(version, template, mode, no_enrich=no_enrich)
+                result["versions"].append(version)
+        except Exception as e:
+            traceback.print_exc(file=buffer)
+            result["error"] = str(e)
+        finally:
+            if builder is not None:
+                # Caches are saved per person; renderers stay up for the next one
+                builder.build_cache.save()
+                builder.content_cache.save()
+                builder.backend_stats.save()
+
+    result.update({
+        "success": result["error"] is None,
+        "duration": time.perf_counter() - start,
+        "output": buffer.getvalue(),
+    })
+    return result
+
+
+def build_batch(
+    people: List[Dict[str, Any]],
+    output_root: Path,
+    mode: str = "markdown",
+    template: str = "francois",
+    jobs: int = 1,
+    no_enrich: bool = False,
+    force: bool = False,
+    cache_dir: str = ".cv-cache",
+    subset_fonts: bool = True,
+    prune_css: bool = True,
+    single_file: bool = False,
+    hedge_delay: Optional[float] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Build every person's CVs, in worker processes when jobs > 1.
+
+    Returns:
+        One result dict per person with 'name', 'content_dir', 'versions'
+        (built), 'success', 'duration', 'error' and 'output' keys
+    """
+    init_args = (str(output_root), cache_dir, force, subset_fonts, prune_css, single_file, hedge_delay)
+    results = []
+
+    def report(result: Dict[str, Any]) -> None:
+        print(f"\n── {result['name']} " + "─" * 40)
+        print(result["output"], end="")
+        results.append(result)
+
+    if jobs <= 1:
+        _init_batch_worker(*init_args)
+        try:
+            for job in people:
+                report(_build_person(job, mode, template, no_enrich))
+        finally:
+            _close_worker_builder()
+        return results
+
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(people)), initializer=_init_batch_worker, initargs=init_args
+    ) as executor:
+        futures = {
+            executor.submit(_build_person, job, mode, template, no_enrich): job for job in people
+        }
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                # Worker process died before it could report
+                job = futures[future]
+                result = {
+                    "name": job["name"], "content_dir": job["content_dir"], "versions": [],
+                    "success": False, "duration": 0.0, "error": f"Worker crashed: {e}", "output": "",
+                }
+            report(result)
+
+    return results
+
+
+def print_summary(results: List[Dict[str, Any]], elapsed: float) -> None:
+    print(f"\n{'person':<20} {'versions':>8} {'seconds':>8}  status")
+    for result in sorted(results, key=lambda result: result["name"]):
+        status = "✅" if result["success"] else f"❌ {result['error']}"
+        print(f"{result['name']:<20} {len(result['versions']):>8} {result['duration']:>8.2f}  {status}")
+
+    succeeded = sum(1 for result in results if result["success"])
+    print(f"\n📊 {succeeded}/{len(results)} people built in {elapsed:.2f}s")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Build CVs for many people in one process")
+    parser.add_argument("content_dirs", nargs="*", help="Content directories or globs (one person each)")
+    parser.add_argument("--manifest", type=Path, help="YAML/JSON manifest of people")
+    parser.add_argument(
+        "--output-root", type=Path, default=Path("output") / "people",
+        help="Outputs go to <output-root>/<person>/ (default: output/people)",
+    )
+    parser.add_argument("--template", default="francois", help="CSS template to use")
+    parser.add_argument("--html", action="store_true", help="Generate HTML output")
+    parser.add_argument("--pdf", action="store_true", help="Generate HTML and PDF output")
+    parser.add_argument("--no-enrich", action="store_true", help="Skip markdown enrichment")
+    parser.add_argument("--force", action="store_true", help="Ignore the incremental build caches")
+    parser.add_argument("--no-subset-fonts", action="store_true", help="Ship full font files")
+    parser.add_argument("--no-prune-css", action="store_true", help="Ship the full template CSS")
+    parser.add_argument("--single-file", action="store_true", help="Inline CSS, fonts and images into the HTML")
+    parser.add_argument(
+        "--hedge", nargs="?", type=float, const=2.0, default=None, metavar="DELAY",
+        help="Race the two most reliable PDF backends (see build_system.py --hedge)",
+    )
+    parser.add_argument("--jobs", "-j", type=int, default=1, help="Worker processes")
+    args = parser.parse_args(argv)
+
+    entries: List[Any] = list(args.content_dirs)
+    if args.manifest:
+        entries.extend(load_manifest(args.manifest))
+    people = resolve_people(entries)
+    if not people:
+        parser.error("no content directories given (pass paths/globs or --manifest)")
+
+    mode = "pdf" if args.pdf else "html" if args.html else "markdown"
+    print(f"🚀 Building {len(people)} people ({mode}) with {args.jobs} worker(s)...")
+
+    start = time.perf_counter()
+    results = build_batch(
+        people,
+        args.output_root,
+        mode=mode,
+        template=args.template,
+        jobs=args.jobs,
+        no_enrich=args.no_enrich,
+        force=args.force,
+        subset_fonts=not args.no_subset_fonts,
+        prune_css=not args.no_prune_css,
+        single_file=args.single_file,
+        hedge_delay=args.hedge,
+    )
+    print_summary(results, time.perf_counter() - start)
+
+    return 0 if all(result["success"] for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Enricher Benchmark - Check that MarkdownEnricher scales linearly
+
+Generates CV markdown of increasing size (every section grows with it) and
+times enrich_markdown on each, both as a full CV and as a headerless fragment
+(sections only, the shape that used to make header wrapping quadratic).
+Linear scaling shows up as a flat time per line. It also compares the peak
+memory of building the whole HTML string with streaming it to a file.
+
+Usage:
+    python benchmark_enricher.py                 # 1k → 10k lines
+    python benchmark_enricher.py --lines 10000 20000 40000 --repeat 5
+"""
+
+import argparse
+import os
+import time
+import tracemalloc
+from typing import List
+
+from html_writer import render_standalone_html, iter_standalone_html
+from markdown_enricher import MarkdownEnricher
+
+
+HEADER = """![Jane Doe](assets/profile.jpeg)
+
+# **Jane Doe**
+### Senior Engineer
+
+_Lausanne, Switzerland_
+
+📞 +41 00 000 00 00 | ✉️ [jane@example.com](mailto:jane@example.com) | 🔗 [GitHub](https://github.com/jane) | 💼 [LinkedIn](https://linkedin.com/in/jane)
+
+**English (Native) • French (C1)**
+_Engineer with a long record of shipping **reliable** systems across many teams._
+"""
+
+
+def generate_cv_markdown(target_lines: int, header: bool = True) -> str:
+    """
+    Synthetic CV markdown of roughly target_lines lines.
+
+    Experience grows fastest (as in real CVs); skills rows, projects, education
+    and certifications grow proportionally so every section handler is timed.
+    """
+    scale = max(1, target_lines // 100)
+
+    parts: List[str] = [HEADER] if header else []
+    parts.append("## Skills\n")
+    parts.append("| **Software Engineering** | **ML & LLMs** | **Data Science** |")
+    parts.append("| :----------------------- | :------------ | :--------------- |")
+    for row in range(3 * scale):
+        parts.append(f"| ✓ Language {row} | ✓ Model {row} | ✓ Tool {row} |")
+    parts.append("\n## Work Experience\n")
+
+    for company in range(4 * scale):
+        parts.append(f"### Company {company}\n_City {company}_<br>\n_2020 - 2024_\n")
+        parts.append(f"**Engineer {company}** · _Ref {company}_\n")
+        for achievement in range(8):
+            parts.append(f"* Shipped **feature {achievement}** in *{company}* with `code` and 40% gains")
+        parts.append(f"\n_Python, Rust, Kubernetes {company}_\n")
+
+    parts.append("## Projects\n")
+    for project in range(scale):
+        parts.append(f"### Project {project}\n_2023_\n")
+        parts.append(f"[Github](https://github.com/jane/p{project}) | [Demo](https://demo/{project})\n")
+        parts.append(f"- Built **thing** {project}\n- Measured *impact* {project}\n")
+        parts.append(f"_Go, SQL {project}_\n")
+
+    parts.append("## Education\n")
+    for school in range(scale):
+        parts.append(f"### School {school}\n_Town {school}_<br>\n_2010 - 2014_\n")
+        parts.append(f"**MSc Topic {school}**\nThesis on subject {school}\n")
+
+    parts.append("## Training & Certifications\n")
+    for cert in range(scale):
+        parts.append(f"### Certificate {cert}\n_Org {cert}_ | _2021_\n\nCovers **topic** {cert}\n")
+
+    return "\n".join(parts)
+
+
+def time_enrichment(markdown: str, repeat: int) -> float:
+    """Best-of-repeat seconds for one enrich_markdown call"""
+    enricher = MarkdownEnricher()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        enricher.enrich_markdown(markdown)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def peak_memory(markdown: str, streaming: bool) -> int:
+    """Peak bytes allocated while producing the standalone document"""
+    enricher = MarkdownEnricher()
+    tracemalloc.start()
+    try:
+        with open(os.devnull, "w", encoding="utf-8") as sink:
+            if streaming:
+                for chunk in iter_standalone_html(enricher.iter_enriched_html(markdown), "bench"):
+                    sink.write(chunk)
+            else:
+                sink.write(render_standalone_html(enricher.enrich_markdown(markdown), "bench"))
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark MarkdownEnricher scaling")
+    parser.add_argument(
+        "--lines", type=int, nargs="+", default=[1000, 2500, 5000, 10000],
+        help="Document sizes to generate (lines)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per size (best is kept)")
+    args = parser.parse_args()
+
+    for header in (True, False):
+        print(f"\n{'Full CV' if header else 'Headerless fragment'}")
+        print(f"{'lines':>8} {'ms':>10} {'µs/line':>10}")
+        per_line = []
+        for target in args.lines:
+            markdown = generate_cv_markdown(target, header=header)
+            lines = markdown.count("\n") + 1
+            seconds = time_enrichment(markdown, args.repeat)
+            per_line.append(seconds / lines * 1e6)
+            print(f"{lines:>8} {seconds * 1000:>10.1f} {per_line[-1]:>10.2f}")
+
+        # Linear scaling keeps time per line flat across sizes
+        print(f"Time per line, largest vs smallest: {per_line[-1] / per_line[0]:.2f}x")
+
+    markdown = generate_cv_markdown(args.lines[-1])
+    print(f"\nPeak memory ({len(markdown) / 1024:.0f} KB of markdown)")
+    for streaming in (False, True):
+        label = "streamed to file" if streaming else "whole string"
+        print(f"  {label:<18} {peak_memory(markdown, streaming) / 1024:>8.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
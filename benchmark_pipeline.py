@@ -0,0 +1,505 @@
+#!/usr/bin/env python3
+"""
+Pipeline Benchmark - Time every build stage on synthetic content
+
+Generates a content directory at a configurable scale (experiences,
+achievements per experience, versions, skills, ...) and runs the build
+pipeline stage by stage on it, for every version:
+
+    yaml_load    parse the content files (cold content cache)
+    sections     select and filter content into CVDocuments
+    markdown     render the clean markdown
+    enrichment   enrich the markdown into semantic HTML
+    assets       stage assets into fresh output directories
+    html_write   write the standalone HTML files
+    pdf          PDF stage with a stub backend (fingerprinting and dispatch,
+                 no browser)
+
+Each stage reports p50/p90/p99 wall time over the repeated runs and its peak
+traced memory (measured in one extra run, since tracing slows timing down).
+Results can be saved as a baseline and are compared against it on later runs;
+the exit status is 1 when a stage's p50 regressed beyond the threshold.
+
+Baselines are machine-specific, so they live in the (untracked) cache dir.
+
+Usage:
+    python benchmark_pipeline.py --save-baseline
+    python benchmark_pipeline.py --experiences 200 --achievements 20 --repeat 10
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import yaml
+
+from build_system import CVBuilder
+from content_cache import ContentCache
+from content_index import ContentIndex
+from cv_renderers import MarkdownRenderer
+from html_writer import DEFAULT_STYLESHEETS, write_standalone_html
+from markdown_enricher import MarkdownEnricher
+
+
+STAGES = ["yaml_load", "sections", "markdown", "enrichment", "assets", "html_write", "pdf"]
+
+DEFAULT_BASELINE = Path(".cv-cache") / "benchmarks" / "baseline.json"
+
+# Smallest valid-looking PDF written by the stub backend
+STUB_PDF = b"%PDF-1.4\n1 0 obj<</Type/Catalog>>endobj\ntrailer<</Root 1 0 R>>\n%%EOF\n"
+
+
+@dataclass
+class ContentScale:
+    """Size of the generated content"""
+
+    experiences: int = 40
+    achievements: int = 10  # Per experience
+    versions: int = 6
+    skills: int = 200  # Per technical skills column
+    projects: int = 20
+    education: int = 4
+    certifications: int = 20
+
+
+def _version_names(scale: ContentScale) -> List[str]:
+    return [f"v{index}" for index in range(scale.versions)]
+
+
+def _layout(index: int) -> str:
+    # Every fourth version is executive, so both skills layouts are exercised
+    return "executive" if index % 4 == 3 else "technical"
+
+
+def _text(kind: str, index: int, words: int = 18) -> str:
+    """Achievement-like sentence with inline markdown"""
+    filler = " ".join(f"{kind}{(index * 7 + word) % 97}" for word in range(words))
+    return f"**{kind.title()} {index}:** Delivered *measurable* results with `tooling` {filler}"
+
+
+def generate_content(content_dir: Path, scale: ContentScale, person: str = "jane") -> List[str]:
+    """
+    Write a synthetic content directory (the five '<person>-*.yaml' content
+    files and versions.yaml).
+
+    Items are spread over versions so filtering has real work to do: each
+    experience and project belongs to about half the versions, and priorities
+    cycle through 1-3.
+
+    Returns:
+        The generated version names
+    """
+    content_dir = Path(content_dir)
+    content_dir.mkdir(parents=True, exist_ok=True)
+    names = _version_names(scale)
+
+    def subset(index: int) -> List[str]:
+        selected = [name for offset, name in enumerate(names) if (index + offset) % 2 == 0]
+        return selected or ["all"]
+
+    def per_version(value: Callable[[str], Any]) -> Dict[str, Any]:
+        # Pairs of versions share a multi-version key ('v0,v1'), as in real content
+        return {",".join(names[i:i + 2]): value(names[i]) for i in range(0, len(names), 2)}
+
+    versions = {
+        name: {
+            "name": name.upper(),
+            "tagline": f"Engineer {name}",
+            "toggles": [name],
+            "max_priority": 2 + index % 2,
+            "layout": _layout(index),
+            "show_executive_summary": index % 2 == 0,
+            "show_certifications": True,
+        }
+        for index, name in enumerate(names)
+    }
+
+    personal = {
+        "name": {"first": "Jane", "last": "DOE", "full": "Jane DOE"},
+        "contact": {
+            "phone": "+41 00 000 00 00",
+            "email": "jane@example.com",
+            "github": "jane",
+            "linkedin": "jane-doe/",
+            "formatted": "Rue du Test 1, 1000 Lausanne, Switzerland",
+        },
+        "languages": [
+            {"language": "English", "proficiency": "Native"},
+            {"language": "French", "proficiency": "Fluent"},
+        ],
+        "taglines": per_version(lambda name: f"Senior Engineer ({name})"),
+        "executive_summaries": per_version(lambda name: _text("summary", len(name), 60)),
+        "certifications": [
+            {
+                "name": f"Certification {index}",
+                "issuing_organization": f"Board {index % 5}",
+                "year": 2000 + index % 25,
+                "description": _text("course", index),
+                "versions": subset(index),
+                "priority": 1 + index % 3,
+            }
+            for index in range(scale.certifications)
+        ],
+    }
+
+    experiences = [
+        {
+            "company": f"Company {index}",
+            "location": f"City {index}, Country",
+            "period": f"{2000 + index % 25} - {2001 + index % 25}",
+            "reference": f"(Ref. Person {index})",
+            "versions": subset(index),
+            "position_base": f"Engineer {index}",
+            "position_variants": {name: f"Senior Engineer {index}" for name in names[::3]},
+            "skills_tags": per_version(
+                lambda name, index=index: ", ".join(f"Skill {index}-{tag}" for tag in range(12))
+            ),
+            "achievements": [
+                {
+                    "text": _text("achievement", index * scale.achievements + number),
+                    "versions": subset(number),
+                    "priority": 1 + number % 3,
+                    "type": "base",
+                }
+                for number in range(scale.achievements)
+            ],
+        }
+        for index in range(scale.experiences)
+    ]
+
+    projects = [
+        {
+            "name": f"Project {index}",
+            "period": str(2010 + index % 15),
+            "links": {"github": f"https://github.com/jane/p{index}", "demo": f"https://demo.example/{index}"},
+            "versions": subset(index),
+            "priority": 1 + index % 3,
+            "descriptions": per_version(
+                lambda name, index=index: [_text("project", index * 4 + line) for line in range(4)]
+            ),
+            "skills_tags": per_version(lambda name, index=index: f"Go, SQL, Project {index}"),
+        }
+        for index in range(scale.projects)
+    ]
+
+    education = [
+        {
+            "institution": f"University {index}",
+            "degree": f"MSc Topic {index}",
+            "start_date": str(1990 + index),
+            "end_date": str(1992 + index),
+            "location": f"Town {index}",
+            "technical_highlight": per_version(lambda name, index=index: f"Thesis {index} for {name}"),
+            "notable_achievements": [
+                {"achievement": f"Award {index}-{number}", "versions": subset(number)}
+                for number in range(3)
+            ],
+        }
+        for index in range(scale.education)
+    ]
+
+    def skills(column: str) -> Dict[str, List[str]]:
+        return per_version(lambda name: [f"{column} {number}" for number in range(scale.skills)])
+
+    skills_data = {
+        "executive": {
+            f"category_{number}": [
+                {"skill": f"Leadership {number}-{item}", "metric": f"{item + 1}x" if item % 2 else None}
+                for item in range(max(1, scale.skills // 20))
+            ]
+            for number in range(3)
+        },
+        "technical": {
+            "programming_languages": skills("Language"),
+            "core_technologies": skills("Technology"),
+            "tools_platforms": skills("Tool"),
+            "project_management": skills("Practice"),
+            "domain_expertise": per_version(
+                lambda name: {"skills": [f"Domain {number}" for number in range(scale.skills)]}
+            ),
+        },
+    }
+
+    files = {
+        "versions.yaml": {"versions": versions},
+        f"{person}-personal.yaml": {"personal": personal},
+        f"{person}-skills.yaml": skills_data,
+        f"{person}-experience.yaml": {"experiences": experiences},
+        f"{person}-projects.yaml": {"projects": projects},
+        f"{person}-education.yaml": {"education": education},
+    }
+    for filename, data in files.items():
+        with open(content_dir / filename, "w", encoding="utf-8") as f:
+            yaml.safe_dump(data, f, allow_unicode=True, sort_keys=False)
+
+    return names
+
+
+class StubPdfBuilder(CVBuilder):
+    """Builder whose first PDF backend writes a stub file instead of printing"""
+
+    def _try_chrome_headless_pdf(self, html_path: Path, pdf_path: Path, target_version: str) -> bool:
+        html_path.read_bytes()  # A real backend reads the whole document
+        pdf_path.write_bytes(STUB_PDF)
+        return True
+
+
+def percentile(samples: List[float], q: float) -> float:
+    """q-th percentile (0-100) with linear interpolation between samples"""
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+class PipelineBenchmark:
+    """
+    Runs the build stages on generated content in a scratch directory.
+
+    Args:
+        work_dir: Scratch directory (content, output and cache are created in it)
+        scale: Size of the generated content
+    """
+
+    def __init__(self, work_dir: Path, scale: ContentScale):
+        self.work_dir = Path(work_dir)
+        self.scale = scale
+        self.content_dir = self.work_dir / "content"
+        self.output_dir = self.work_dir / "output"
+        self.version_names = generate_content(self.content_dir, scale)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.builder = StubPdfBuilder(
+                str(self.content_dir),
+                str(self.output_dir),
+                force=True,
+                cache_dir=str(self.work_dir / "cache"),
+                subset_fonts=False,
+            )
+
+    def _stages(self) -> List[Callable[[Dict[str, Any]], None]]:
+        """One callable per entry of STAGES, passing results along in a state dict"""
+        builder = self.builder
+
+        def yaml_load(state: Dict[str, Any]) -> None:
+            cache = ContentCache()
+            builder.content_snapshot = {
+                filename: cache.load(self.content_dir / filename) for filename in builder.content_files
+            }
+
+        def sections(state: Dict[str, Any]) -> None:
+            builder.content_index = ContentIndex(builder.versions)
+            builder.personal = None
+            state["documents"] = {name: builder.build_document(name) for name in self.version_names}
+
+        def markdown(state: Dict[str, Any]) -> None:
+            renderer = MarkdownRenderer()
+            state["markdown"] = {name: renderer.render(doc) for name, doc in state["documents"].items()}
+
+        def enrichment(state: Dict[str, Any]) -> None:
+            enricher = MarkdownEnricher()
+            state["html"] = {name: enricher.enrich_markdown(md) for name, md in state["markdown"].items()}
+
+        def assets(state: Dict[str, Any]) -> None:
+            for name in self.version_names:
+                builder._copy_assets(name)
+
+        def html_write(state: Dict[str, Any]) -> None:
+            for name, body in state["html"].items():
+                write_standalone_html(
+                    builder.output_path(name, ".html"),
+                    body,
+                    title=f"{builder.person}-{name}",
+                    stylesheets=DEFAULT_STYLESHEETS,
+                )
+
+        def pdf(state: Dict[str, Any]) -> None:
+            for name in self.version_names:
+                builder._process_pdf_generation(name)
+
+        return [yaml_load, sections, markdown, enrichment, assets, html_write, pdf]
+
+    def _reset_outputs(self) -> None:
+        """Fresh version directories (the shared asset store is kept, as in real builds)"""
+        for name in self.version_names:
+            shutil.rmtree(self.output_dir / name, ignore_errors=True)
+
+    def run_once(self, trace_memory: bool = False) -> Dict[str, float]:
+        """
+        Run every stage once.
+
+        Returns:
+            Stage name → seconds, or → peak traced bytes with trace_memory
+        """
+        self._reset_outputs()
+        state: Dict[str, Any] = {}
+        results: Dict[str, float] = {}
+
+        for name, stage in zip(STAGES, self._stages()):
+            with contextlib.redirect_stdout(io.StringIO()):
+                if trace_memory:
+                    tracemalloc.start()
+                    try:
+                        stage(state)
+                        results[name] = tracemalloc.get_traced_memory()[1]
+                    finally:
+                        tracemalloc.stop()
+                else:
+                    start = time.perf_counter()
+                    stage(state)
+                    results[name] = time.perf_counter() - start
+
+        return results
+
+    def run(self, repeat: int, warmup: int = 1) -> Dict[str, Dict[str, float]]:
+        """
+        Time every stage over `repeat` runs and trace memory in one more.
+
+        Returns:
+            Stage name → {'p50', 'p90', 'p99' (milliseconds), 'peak_kb'}
+        """
+        for _ in range(warmup):
+            self.run_once()
+
+        samples: Dict[str, List[float]] = {name: [] for name in STAGES}
+        for _ in range(repeat):
+            for name, seconds in self.run_once().items():
+                samples[name].append(seconds * 1000)
+
+        peaks = self.run_once(trace_memory=True)
+        return {
+            name: {
+                "p50": percentile(samples[name], 50),
+                "p90": percentile(samples[name], 90),
+                "p99": percentile(samples[name], 99),
+                "peak_kb": peaks[name] / 1024,
+            }
+            for name in STAGES
+        }
+
+
+def compare(
+    results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], threshold: float
+) -> List[str]:
+    """
+    Stages whose p50 time or peak memory grew beyond `threshold` × baseline.
+
+    Returns:
+        Human-readable regressions, empty if none
+    """
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        for metric, unit in (("p50", "ms"), ("peak_kb", "KB")):
+            # Ignore noise on stages too small to measure reliably
+            if previous[metric] > 0 and current[metric] > max(previous[metric] * threshold, 0.05):
+                regressions.append(
+                    f"{name} {metric}: {previous[metric]:.2f} → {current[metric]:.2f} {unit} "
+                    f"({current[metric] / previous[metric]:.2f}x)"
+                )
+    return regressions
+
+
+def load_baseline(path: Path) -> Optional[Dict[str, Any]]:
+    """Saved baseline, or None if missing or unreadable"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_baseline(path: Path, scale: ContentScale, results: Dict[str, Dict[str, float]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "created": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "scale": asdict(scale),
+                "stages": results,
+            },
+            f,
+            indent=2,
+        )
+
+
+def print_results(results: Dict[str, Dict[str, float]], baseline: Optional[Dict[str, Any]]) -> None:
+    previous = baseline["stages"] if baseline else {}
+    print(f"{'stage':<12} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'peak KB':>9} {'vs base':>8}")
+    for name in STAGES:
+        current = results[name]
+        ratio = ""
+        if previous.get(name, {}).get("p50"):
+            ratio = f"{current['p50'] / previous[name]['p50']:.2f}x"
+        print(
+            f"{name:<12} {current['p50']:>9.2f} {current['p90']:>9.2f} {current['p99']:>9.2f} "
+            f"{current['peak_kb']:>9.0f} {ratio:>8}"
+        )
+    total = sum(results[name]["p50"] for name in STAGES)
+    print(f"{'total':<12} {total:>9.2f}")
+
+
+def main() -> int:
+    defaults = ContentScale()
+    parser = argparse.ArgumentParser(description="Benchmark each build stage on synthetic content")
+    for field_name, value in asdict(defaults).items():
+        parser.add_argument(
+            f"--{field_name}", type=int, default=value, help=f"Content scale (default: {value})"
+        )
+    parser.add_argument("--repeat", type=int, default=7, help="Timed runs per stage (default: 7)")
+    parser.add_argument(
+        "--baseline", type=Path, default=DEFAULT_BASELINE, help=f"Baseline file (default: {DEFAULT_BASELINE})"
+    )
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the new baseline")
+    parser.add_argument(
+        "--threshold", type=float, default=1.25,
+        help="Ratio to baseline reported as a regression (default: 1.25)",
+    )
+    args = parser.parse_args()
+
+    scale = ContentScale(**{field_name: getattr(args, field_name) for field_name in asdict(defaults)})
+    print(f"Scale: {', '.join(f'{key}={value}' for key, value in asdict(scale).items())}")
+
+    with tempfile.TemporaryDirectory(prefix="cv-bench-") as work_dir:
+        results = PipelineBenchmark(Path(work_dir), scale).run(args.repeat)
+
+    baseline = load_baseline(args.baseline)
+    if baseline and baseline.get("scale") != asdict(scale):
+        print(f"Baseline {args.baseline} was recorded at another scale, not comparing")
+        baseline = None
+
+    print()
+    print_results(results, baseline)
+
+    regressions = compare(results, baseline["stages"], args.threshold) if baseline else []
+    if regressions:
+        print(f"\n❌ Regressions beyond {args.threshold:.2f}x baseline:")
+        for regression in regressions:
+            print(f"  - {regression}")
+
+    if args.save_baseline:
+        save_baseline(args.baseline, scale, results)
+        print(f"\n💾 Baseline saved: {args.baseline}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
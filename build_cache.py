@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Build Cache - Persistent content-hash manifest for incremental CV builds
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, List, Any, Iterable, Optional
+
+
+MANIFEST_VERSION = 1
+
+
+class BuildCache:
+    """
+    Persistent build manifest keyed on hashes of every input of a build stage.
+
+    Each target (``version:template``) records, per stage (markdown, html, pdf),
+    the fingerprint of its inputs and the stat signature of the files it wrote.
+    A stage is skipped when its input fingerprint is unchanged and all of its
+    outputs are still on disk exactly as the last build left them.
+
+    File hashes are memoized by (mtime, size) so warm runs only stat inputs
+    instead of re-reading fonts and images.
+    """
+
+    def __init__(self, manifest_path: Path, force: bool = False, autosave: bool = True):
+        self.manifest_path = Path(manifest_path)
+        self.force = force  # Rebuild everything but keep recording fingerprints
+        self.autosave = autosave  # Worker processes leave saving to the parent
+        self._dirty = False
+        self._touched_targets = set()
+        self.manifest = self._load_manifest()
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        """Load manifest from disk, discarding it if unreadable or outdated"""
+        empty = {"version": MANIFEST_VERSION, "files": {}, "targets": {}}
+        if not self.manifest_path.exists():
+            return empty
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return empty
+        if manifest.get("version") != MANIFEST_VERSION:
+            return empty
+        manifest.setdefault("files", {})
+        manifest.setdefault("targets", {})
+        return manifest
+
+    @staticmethod
+    def _stat_signature(path: Path) -> Optional[List[int]]:
+        """Cheap change detector: [mtime_ns, size] or None if missing"""
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def hash_file(self, path: Path) -> str:
+        """Return sha256 of a file, reusing the memoized hash if its stat is unchanged"""
+        path = Path(path)
+        signature = self._stat_signature(path)
+        if signature is None:
+            return "missing"
+
+        key = str(path)
+        memo = self.manifest["files"].get(key)
+        if memo and memo["stat"] == signature:
+            return memo["sha256"]
+
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        sha = digest.hexdigest()
+
+        self.manifest["files"][key] = {"stat": signature, "sha256": sha}
+        self._dirty = True
+        return sha
+
+    def hash_tree(self, root: Path) -> str:
+        """Hash every file below a directory (names and contents)"""
+        root = Path(root)
+        if not root.exists():
+            return "missing"
+        if root.is_file():
+            return self.hash_file(root)
+
+        digest = hashlib.sha256()
+        for path in sorted(p for p in root.rglob("*") if p.is_file()):
+            digest.update(str(path.relative_to(root)).encode("utf-8"))
+            digest.update(self.hash_file(path).encode("ascii"))
+        return digest.hexdigest()
+
+    def fingerprint(
+        self, paths: Iterable[Path], extra: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Combine input files/directories and extra parameters into one hash.
+
+        Args:
+            paths: Files or directories the stage reads
+            extra: Non-file inputs (flags, template name, in-memory text)
+
+        Returns:
+            Hex digest identifying this exact set of inputs
+        """
+        digest = hashlib.sha256()
+        for path in paths:
+            digest.update(str(path).encode("utf-8"))
+            digest.update(self.hash_tree(Path(path)).encode("ascii"))
+        if extra:
+            digest.update(json.dumps(extra, sort_keys=True, default=str).encode("utf-8"))
+        return digest.hexdigest()
+
+    def is_fresh(self, target: str, stage: str, fingerprint: str) -> bool:
+        """Check whether a stage can be skipped for a target"""
+        if self.force:
+            return False
+
+        entry = self.manifest["targets"].get(target, {}).get(stage)
+        if not entry or entry["inputs"] != fingerprint:
+            return False
+
+        for output, signature in entry["outputs"].items():
+            if self._stat_signature(Path(output)) != signature:
+                return False
+        return True
+
+    def record(
+        self, target: str, stage: str, fingerprint: str, outputs: List[Path]
+    ) -> None:
+        """Record a successful stage build with the files it produced"""
+        signatures = {}
+        for output in outputs:
+            signature = self._stat_signature(Path(output))
+            if signature is None:
+                # Never record a stage whose outputs were not all written
+                return
+            signatures[str(output)] = signature
+
+        self.manifest["targets"].setdefault(target, {})[stage] = {
+            "inputs": fingerprint,
+            "outputs": signatures,
+        }
+        self._touched_targets.add(target)
+        self._dirty = True
+        if self.autosave:
+            self.save()
+
+    def export_changes(self) -> Dict[str, Any]:
+        """Return the file hashes and targets recorded by this instance"""
+        return {
+            "files": self.manifest["files"],
+            "targets": {
+                target: self.manifest["targets"][target]
+                for target in self._touched_targets
+                if target in self.manifest["targets"]
+            },
+        }
+
+    def merge(self, changes: Dict[str, Any]) -> None:
+        """Merge changes exported by another (worker) instance"""
+        self.manifest["files"].update(changes.get("files", {}))
+        for target, stages in changes.get("targets", {}).items():
+            self.manifest["targets"].setdefault(target, {}).update(stages)
+            self._touched_targets.add(target)
+        self._dirty = True
+
+    def invalidate(self, target: str, stage: Optional[str] = None) -> None:
+        """Drop a target (or a single stage of it) from the manifest"""
+        stages = self.manifest["targets"].get(target)
+        if not stages:
+            return
+        if stage is None:
+            del self.manifest["targets"][target]
+        else:
+            stages.pop(stage, None)
+        self._dirty = True
+
+    def save(self) -> None:
+        """Persist manifest atomically if anything changed"""
+        if not self._dirty:
+            return
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, indent=1, sort_keys=True)
+        tmp_path.replace(self.manifest_path)
+        self._dirty = False
@@ -4,12 +4,52 @@ Arthur Passuello CV Build System
 Converts YAML content to markdown with conditional logic preserving LaTeX system behavior
 """
 
-import yaml
 import re
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterable, Optional, Tuple
 import subprocess
 import argparse
+import asyncio
+import hashlib
+import contextlib
+import io
+import os
+import queue
+import threading
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from build_cache import BuildCache
+from content_cache import ContentParseError, get_content_cache
+from content_index import ContentIndex
+from cv_document import (
+    CVDocument,
+    CertificationEntry,
+    Contact,
+    EducationEntry,
+    ExperienceEntry,
+    Header,
+    Link,
+    ProjectEntry,
+    SkillCategory,
+    SkillsSection,
+)
+from cv_renderers import HTMLRenderer, MarkdownRenderer
+from asset_store import AssetStore
+from async_build import build_async
+from backend_registry import BackendRegistry
+from backend_stats import get_backend_stats
+from cancel_scope import CancelScope, current_scope, enter_scope, exit_scope, run_process
+from font_subsetter import FontSubsetter, fonttools_available
+from chrome_renderer import ChromeSession, ChromeSessionError
+from css_pruner import CSSPruner
+from weasyprint_renderer import WeasyPrintRenderer
+from html_inliner import write_single_file
+from html_writer import DEFAULT_STYLESHEETS, write_standalone_html
+from profiler import DISABLED as PROFILER_DISABLED, Profiler
+from skills_stylesheet import SKILLS_STYLESHEET, skills_css
+from watch import ChangeWatcher, describe
 
 # Add dynamic skills processor with fallback
 try:
@@ -20,19 +60,156 @@ except ImportError:
     print("Warning: Dynamic skills processor not available, using legacy mode")
 
 
+# Person-specific content files are named '<person>-<section>.yaml'
+CONTENT_SECTIONS = ["personal", "skills", "experience", "projects", "education"]
+
+# Person used when a content directory does not identify one
+DEFAULT_PERSON = "arthur"
+
+# Profile photos found beside a person's content as '<person>-profile<suffix>'
+PROFILE_PHOTO_SUFFIXES = [".jpeg", ".jpg", ".png"]
+
+
+def detect_person(content_dir: Path) -> str:
+    """Person prefix of a content directory, from its '<person>-personal.yaml'"""
+    candidates = sorted(Path(content_dir).glob("*-personal.yaml"))
+    if len(candidates) == 1:
+        return candidates[0].name[: -len("-personal.yaml")]
+    # None or several people in one directory: fall back unless told explicitly
+    return DEFAULT_PERSON
+
+
+def _is_pdf(path: Path) -> bool:
+    """True if path exists and starts like a PDF (backends can exit 0 without one)"""
+    try:
+        with open(path, "rb") as f:
+            return f.read(5) == b"%PDF-"
+    except OSError:
+        return False
+
+
 class CVBuilder:
-    def __init__(self, content_dir: str = "content", output_dir: str = "output"):
+    # Created on first use by _get_enricher()
+    _enricher = None
+
+    # PDF backends by name (as recorded in the outcome history), default order first
+    PDF_BACKENDS = {
+        "chrome_headless": "_try_chrome_headless_pdf",
+        "weasyprint": "_try_weasyprint_pdf",
+        "pandoc": "_try_pandoc_pdf",
+    }
+
+    def __init__(
+        self,
+        content_dir: str = "content",
+        output_dir: str = "output",
+        force: bool = False,
+        content_snapshot: Optional[Dict[str, Any]] = None,
+        cache_dir: str = ".cv-cache",
+        subset_fonts: bool = True,
+        profiler: Optional[Profiler] = None,
+        person: Optional[str] = None,
+        asset_dir: Optional[str] = None,
+        templates: Optional[Dict[str, str]] = None,
+        prune_css: bool = True,
+        single_file: bool = False,
+        hedge_delay: Optional[float] = None,
+    ):
         self.content_dir = Path(content_dir)
         self.output_dir = Path(output_dir)
+        self.cache_dir = Path(cache_dir)
+
+        # Whose CV this is: names the content files and every output file
+        self.person = person or detect_person(self.content_dir)
+
+        # Content files read when building any version
+        self.content_files = ["versions.yaml"] + [self.content_file(section) for section in CONTENT_SECTIONS]
+
+        # Stage spans for --profile (a disabled profiler records nothing)
+        self.profiler = profiler or PROFILER_DISABLED
+
+        # Parsed YAML shared by every builder in this process (and across runs)
+        self.content_cache = get_content_cache(self.cache_dir / "content.pickle")
+
+        # Pre-parsed content shared read-only with parallel build workers
+        self.content_snapshot = content_snapshot or {}
+        self.local_content = True
+
+        # Incremental build manifest (skips stages whose inputs are unchanged)
+        self.build_cache = BuildCache(self.output_dir / ".build-manifest.json", force=force)
+
+        # Shared content-addressed store; assets are linked into each output tree
+        self.asset_store = AssetStore(
+            Path(asset_dir) if asset_dir else self.output_dir / ".assets", hash_file=self.build_cache.hash_file
+        )
+
+        # Per-version font subsets (full fonts are staged when fontTools is missing)
+        self.font_subsetter: Optional[FontSubsetter] = None
+        if subset_fonts and fonttools_available():
+            self.font_subsetter = FontSubsetter(
+                self.cache_dir / "font-subsets", self.asset_store, hash_file=self.build_cache.hash_file
+            )
+
+        # Template CSS pruned to the selectors each version's HTML uses
+        self.css_pruner: Optional[CSSPruner] = None
+        if prune_css:
+            self.css_pruner = CSSPruner(
+                self.cache_dir / "pruned-css", self.asset_store, hash_file=self.build_cache.hash_file
+            )
+
+        # Fold stylesheets, fonts and images into the HTML file itself
+        self.single_file = single_file
 
         # Load version configuration from YAML
         self.versions = self._load_version_config()
 
+        # Per-version inclusion lists, built once per content revision
+        self.content_index = ContentIndex(self.versions)
+
         # Personal information loaded from YAML
         self.personal = None  # Will be loaded when needed
         
-        # Template configuration
-        self.available_templates = self.discover_templates()
+        # Template configuration (batch builds discover templates once for everyone)
+        self.available_templates = templates if templates is not None else self.discover_templates()
+
+        # Rendering backends, probed lazily and cached between runs
+        self.backends = BackendRegistry(self.cache_dir / "backends.json")
+
+        # PDF backend outcome history: orders attempts and skips failing backends
+        # (shared by every builder in this process)
+        self.backend_stats = get_backend_stats(self.cache_dir / "backend-stats.json")
+
+        # Seconds before a second PDF backend races a slow first one (None: one at a time)
+        self.hedge_delay = hedge_delay
+
+        # Persistent Chrome session shared by every PDF built in this process
+        self._chrome_session: Optional[ChromeSession] = None
+        self._chrome_session_failed = False
+
+        # In-process WeasyPrint renderer (created on first use)
+        self._weasyprint_renderer: Optional[WeasyPrintRenderer] = None
+
+        # Set by abuild: runs external tools on its event loop, bounded per backend
+        self.tool_runner = None
+
+        # Guards the shared renderers when abuild runs stages on several threads
+        self._renderer_lock = threading.Lock()
+
+    def content_file(self, section: str) -> str:
+        """Content file name of a section for this person (e.g. 'jane-skills.yaml')"""
+        return f"{self.person}-{section}.yaml"
+
+    def output_path(self, target_version: str, suffix: str) -> Path:
+        """Output file of a version, e.g. output/ai/jane-ai.html for suffix '.html'"""
+        return self.output_dir / target_version / f"{self.person}-{target_version}{suffix}"
+
+    def close(self) -> None:
+        """Release long-lived renderers (headless Chrome) and persist caches"""
+        self.content_cache.save()
+        self.backend_stats.save()
+        if self._chrome_session is not None:
+            self._chrome_session.close()
+            self._chrome_session = None
 
     def _load_version_config(self) -> Dict[str, Any]:
         """Load version configuration from YAML file"""
@@ -71,7 +248,8 @@ class CVBuilder:
                 }
             }
 
-    def discover_templates(self) -> Dict[str, str]:
+    @staticmethod
+    def discover_templates() -> Dict[str, str]:
         """Discover available CSS templates for François-style markdown pipeline"""
         templates_dir = Path("templates")
         template_map = {}
@@ -104,97 +282,34 @@ class CVBuilder:
         """Get list of available template names"""
         return list(self.discover_templates().keys())
 
-    def check_dependencies(self) -> Dict[str, bool]:
-        """Check availability of PDF generation dependencies"""
-        deps = {
-            "pandoc": False,
-            "chrome": False,
-            "weasyprint_cmd": False,
-            "weasyprint_python": False,
+    def check_dependencies(self, refresh: bool = False) -> Dict[str, bool]:
+        """Check availability of PDF generation dependencies (cached probes)"""
+        return {
+            name: entry["available"]
+            for name, entry in self.backends.probe_all(refresh=refresh).items()
         }
 
-        # Check pandoc
-        try:
-            subprocess.run(["pandoc", "--version"], capture_output=True, check=True)
-            deps["pandoc"] = True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            pass
-
-        # Check Chrome/Chromium
-        chrome_commands = [
-            "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
-            "google-chrome",
-            "chromium",
-            "google-chrome-stable",
-        ]
-        for chrome_cmd in chrome_commands:
-            try:
-                if chrome_cmd.startswith("/"):
-                    if Path(chrome_cmd).exists():
-                        deps["chrome"] = True
-                        break
-                else:
-                    subprocess.run(
-                        [chrome_cmd, "--version"], capture_output=True, check=True
-                    )
-                    deps["chrome"] = True
-                    break
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                continue
-
-        # Check WeasyPrint command line
-        try:
-            env = subprocess.os.environ.copy()
-            env["PKG_CONFIG_PATH"] = (
-                "/opt/homebrew/lib/pkgconfig:/opt/homebrew/opt/libffi/lib/pkgconfig"
-            )
-            env["DYLD_LIBRARY_PATH"] = (
-                "/opt/homebrew/lib:/opt/homebrew/Cellar/glib/2.84.3/lib"
-            )
-            subprocess.run(
-                ["weasyprint", "--help"], capture_output=True, check=True, env=env
-            )
-            deps["weasyprint_cmd"] = True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            pass
-
-        # Check WeasyPrint Python module
-        try:
-            import os
-
-            old_env = {}
-            env_vars = {
-                "PKG_CONFIG_PATH": "/opt/homebrew/lib/pkgconfig:/opt/homebrew/opt/libffi/lib/pkgconfig",
-                "DYLD_LIBRARY_PATH": "/opt/homebrew/lib:/opt/homebrew/Cellar/glib/2.84.3/lib",
-            }
-            for key, value in env_vars.items():
-                old_env[key] = os.environ.get(key)
-                os.environ[key] = value
-
-            try:
-                import weasyprint
-
-                deps["weasyprint_python"] = True
-            finally:
-                for key, old_value in old_env.items():
-                    if old_value is None:
-                        os.environ.pop(key, None)
-                    else:
-                        os.environ[key] = old_value
-        except ImportError:
-            pass
-
-        return deps
-
-    def print_dependency_status(self) -> None:
-        """Print status of all dependencies"""
-        deps = self.check_dependencies()
+    def print_dependency_status(self, refresh: bool = False) -> None:
+        """Print status of all dependencies with probe latency"""
+        start = time.perf_counter()
+        entries = self.backends.probe_all(refresh=refresh)
+        elapsed = time.perf_counter() - start
+        deps = {name: entry["available"] for name, entry in entries.items()}
+
+        labels = {
+            "pandoc": "Pandoc",
+            "chrome": "Chrome/Chromium",
+            "weasyprint_cmd": "WeasyPrint (command)",
+            "weasyprint_python": "WeasyPrint (Python)",
+        }
 
         print("📋 PDF Generation Dependencies Status:")
-        print(f"  Pandoc: {'✅' if deps['pandoc'] else '❌'}")
-        print(f"  Chrome/Chromium: {'✅' if deps['chrome'] else '❌'}")
-        print(f"  WeasyPrint (command): {'✅' if deps['weasyprint_cmd'] else '❌'}")
-        print(f"  WeasyPrint (Python): {'✅' if deps['weasyprint_python'] else '❌'}")
+        for name, entry in entries.items():
+            details = ""
+            if entry["available"]:
+                details = f" {entry.get('version') or ''} [{entry.get('path')}]"
+            timing = "cached" if entry.get("cached") else f"probed in {entry['probe_ms']:.0f} ms"
+            print(f"  {labels.get(name, name)}: {'✅' if entry['available'] else '❌'}{details} ({timing})")
 
         if not any(deps.values()):
             print("\n⚠️  No PDF generation tools available!")
@@ -208,23 +323,82 @@ class CVBuilder:
         else:
             print(f"\n✅ PDF generation available")
 
+        print("\n📈 PDF backend order (from past builds):")
+        for backend in self.backend_stats.order(list(self.PDF_BACKENDS)):
+            print(f"  {backend}: {self.backend_stats.describe(backend)}")
+
+        if not fonttools_available():
+            print("ℹ️  fontTools not installed - full fonts are shipped (pip install fonttools to subset)")
+
+        print(f"⏱️  Dependency check took {elapsed * 1000:.0f} ms (--force to re-probe)")
+
     def load_yaml_file(self, filename: str) -> Dict[str, Any]:
         """Load YAML file with error handling"""
+        if filename in self.content_snapshot:
+            return self.content_snapshot[filename]
+
         file_path = self.content_dir / filename
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                return yaml.safe_load(f)
+            with self.profiler.span("yaml_load", file=filename):
+                return self.content_cache.load(file_path)
         except FileNotFoundError:
             print(f"Warning: {filename} not found, using empty dict")
             return {}
-        except yaml.YAMLError as e:
+        except ContentParseError as e:
             print(f"Error parsing {filename}: {e}")
             return {}
 
+    def use_content(
+        self, content_snapshot: Dict[str, Any], person: Optional[str] = None, local: bool = True
+    ) -> None:
+        """
+        Switch to other parsed content, keeping templates, caches and renderers warm.
+
+        Args:
+            content_snapshot: Parsed content by file name; files missing from
+                it are read from the content directory
+            person: Whose content it is (default: detected from the content directory)
+            local: False for content from elsewhere (render requests), which
+                never picks up files such as a profile photo from the content directory
+        """
+        self.person = person or detect_person(self.content_dir)
+        self.local_content = local
+        self.content_files = ["versions.yaml"] + [self.content_file(section) for section in CONTENT_SECTIONS]
+        self.content_snapshot = content_snapshot
+        self.personal = None
+        self.versions = self._load_version_config()
+        self.content_index = ContentIndex(self.versions)
+
+    def use_person(self, content_dir: str, output_dir: str, person: Optional[str] = None) -> None:
+        """
+        Switch to another person's content directory and output tree, keeping
+        templates, caches and renderers warm (batch builds).
+
+        Args:
+            content_dir: The person's content directory
+            output_dir: Directory their outputs (and build manifest) go to
+            person: Whose content it is (default: detected from content_dir)
+        """
+        self.build_cache.save()
+        self.output_dir = Path(output_dir)
+        self.build_cache = BuildCache(
+            self.output_dir / ".build-manifest.json", force=self.build_cache.force, autosave=self.build_cache.autosave
+        )
+        # Memoize file hashes in the manifest now in use
+        for component in (self.asset_store, self.font_subsetter, self.css_pruner):
+            if component is not None:
+                component.hash_file = self.build_cache.hash_file
+        self.content_dir = Path(content_dir)
+        self.use_content({}, person)
+
+    def load_content_snapshot(self) -> Dict[str, Any]:
+        """Parse every content file once so parallel workers can share the result"""
+        return {filename: self.load_yaml_file(filename) for filename in self.content_files}
+
     def load_personal_data(self, target_version: str) -> Dict[str, Any]:
         """Load and process personal information with version-specific content"""
         if self.personal is None:
-            personal_data = self.load_yaml_file("arthur-personal.yaml")
+            personal_data = self.load_yaml_file(self.content_file("personal"))
             personal_info = personal_data.get("personal", {})
 
             # Process contact information
@@ -236,21 +410,24 @@ class CVBuilder:
                 [f"{lang['language']} ({lang['proficiency']})" for lang in languages]
             )
 
+            # Fields the person's YAML leaves out stay empty and drop out of the header
+            name = personal_info.get("name", {}).get("full", "")
+            address = contact.get("address", {})
+            if isinstance(address, dict):
+                address = address.get("formatted", "")
+            photo_source = self._profile_photo_source(personal_info)
+
             self.personal = {
-                "name": personal_info.get("name", {}).get("full", "Arthur PASSUELLO"),
-                "phone": contact.get("phone", "+(41) 79 176 24 84"),
-                "email": contact.get("email", "apassuello@protonmail.com"),
-                "address": contact.get(
-                    "formatted",
-                    "Chemin du Parc-de-Valency 1, 1004 Lausanne, Switzerland",
-                ),
-                "github": contact.get("github", "apassuello"),
-                "linkedin": contact.get("linkedin", "arthur-passuello"),
-                "linkedin_name": personal_info.get("name", {}).get(
-                    "full", "Arthur Passuello"
-                ),
+                "name": name,
+                "phone": contact.get("phone", ""),
+                "email": contact.get("email", ""),
+                "address": contact.get("formatted", address),
+                "github": contact.get("github", ""),
+                "linkedin": contact.get("linkedin", ""),
+                "linkedin_name": name,
                 "languages": languages_formatted,
-                "profile_photo": "assets/profile.jpeg",
+                "profile_photo": f"assets/profile{photo_source.suffix.lower()}" if photo_source else "",
+                "profile_photo_source": photo_source,
                 "taglines": personal_info.get("taglines", {}),
                 "executive_summaries": personal_info.get("executive_summaries", {}),
                 "certifications": personal_info.get("certifications", []),
@@ -259,6 +436,22 @@ class CVBuilder:
 
         return self.personal
 
+    def _profile_photo_source(self, personal_info: Dict[str, Any]) -> Optional[Path]:
+        """
+        The person's profile photo: 'photo' in their personal YAML (relative
+        to the content directory), else '<person>-profile.<ext>' beside their
+        content. None when there is none, or the content is not from the
+        content directory (render requests).
+        """
+        if not self.local_content:
+            return None
+        photo = personal_info.get("photo")
+        if photo:
+            candidates = [self.content_dir / photo]
+        else:
+            candidates = [self.content_dir / f"{self.person}-profile{suffix}" for suffix in PROFILE_PHOTO_SUFFIXES]
+        return next((path for path in candidates if path.is_file()), None)
+
     def check_version_condition(
         self, item_versions: List[str], target_version: str
     ) -> bool:
@@ -272,17 +465,54 @@ class CVBuilder:
     def _get_content_for_version(self, content_dict: Dict, target_version: str) -> Any:
         """Get content supporting both single keys ('ai') and multi-version keys ('ai,ds')"""
         if not content_dict:
-            return [] if any(isinstance(v, list) for v in content_dict.values() if content_dict) else ""
+            return ""
+        
+        # Keys are split and resolved once per content dict, then looked up directly
+        return self.content_index.version_value(content_dict, target_version)
+
+    def validate_content(self) -> List[str]:
+        """
+        Check every version-keyed content field against versions.yaml.
+        
+        Also pre-resolves the multi-version key tables, so later lookups during
+        the build are plain dictionary hits.
+        
+        Returns:
+            Human-readable problems (unknown version names), empty if content is valid
+        """
+        fields = []  # (location, version-keyed dict)
+        
+        personal = self.load_yaml_file(self.content_file("personal")).get("personal", {})
+        for field in ("taglines", "executive_summaries"):
+            fields.append((f"{self.content_file('personal')}: {field}", personal.get(field)))
+        
+        for exp in self.load_yaml_file(self.content_file("experience")).get("experiences", []):
+            for field in ("skills_tags", "position_variants"):
+                fields.append((f"{self.content_file('experience')}: {exp.get('company')} {field}", exp.get(field)))
         
-        for key, value in content_dict.items():
-            # Split comma-separated keys and check if target_version is included
-            versions_in_key = [v.strip() for v in key.split(',')]
-            if target_version in versions_in_key:
-                return value
+        for project in self.load_yaml_file(self.content_file("projects")).get("projects", []):
+            for field in ("descriptions", "skills_tags"):
+                fields.append((f"{self.content_file('projects')}: {project.get('name')} {field}", project.get(field)))
         
-        # Return appropriate empty value based on content type
-        sample_value = next(iter(content_dict.values())) if content_dict else ""
-        return [] if isinstance(sample_value, list) else ""
+        for education in self.load_yaml_file(self.content_file("education")).get("education", []):
+            for field in ("technical_highlight", "relevant_coursework"):
+                fields.append((f"{self.content_file('education')}: {education.get('institution')} {field}", education.get(field)))
+        
+        technical = self.load_yaml_file(self.content_file("skills")).get("technical", {})
+        for field in ("programming_languages", "core_technologies", "tools_platforms",
+                      "project_management", "domain_expertise"):
+            fields.append((f"{self.content_file('skills')}: technical.{field}", technical.get(field)))
+        
+        problems = []
+        for location, content_dict in fields:
+            if not isinstance(content_dict, dict) or not content_dict:
+                continue
+            for version in self.content_index.unknown_version_keys(content_dict):
+                problems.append(f"{location} uses unknown version '{version}'")
+            # Warm the version → value table used by _get_content_for_version
+            self.content_index.version_value(content_dict, "")
+        
+        return problems
 
     def format_skill_tags(self, skills_tags_text: str) -> str:
         """
@@ -351,8 +581,9 @@ class CVBuilder:
             
             # Use new dynamic processor
             try:
-                processor = DynamicSkillsProcessor(skills_data)
-                result = processor.process_skills_for_version(target_version)
+                with self.profiler.span("dynamic_skills", version=target_version):
+                    processor = DynamicSkillsProcessor(skills_data)
+                    result = processor.process_skills_for_version(target_version)
                 
                 # Add debug flag if in development mode
                 if hasattr(self, 'debug_mode') and self.debug_mode:
@@ -410,18 +641,10 @@ class CVBuilder:
         self, experience_data: Dict, target_version: str
     ) -> List[Dict]:
         """Process experience section with version-specific logic"""
-        version_config = self.versions[target_version]
-        experiences = experience_data.get("experiences", [])
-
         filtered_experiences = []
 
-        for exp in experiences:
-            # Check if experience should be included for this version
-            if not self.check_version_condition(
-                exp.get("versions", []), target_version
-            ):
-                continue
-
+        # Experiences and achievements pre-filtered by version and priority
+        for exp, achievements in self.content_index.experiences(experience_data, target_version):
             # Process experience with version-specific content
             processed_exp = {
                 "company": exp["company"],
@@ -435,19 +658,7 @@ class CVBuilder:
                 "achievements": [],
             }
 
-            # Filter achievements by version and priority
-            achievements = exp.get("achievements", [])
             for achievement in achievements:
-                # Check version condition
-                if not self.check_version_condition(
-                    achievement.get("versions", []), target_version
-                ):
-                    continue
-
-                # Check priority condition
-                if achievement.get("priority", 1) > version_config["max_priority"]:
-                    continue
-
                 # Add achievement text
                 processed_exp["achievements"].append(
                     {
@@ -472,16 +683,9 @@ class CVBuilder:
         if version_config.get("layout") == "executive":
             return []
 
-        projects = projects_data.get("projects", [])
         filtered_projects = []
 
-        for project in projects:
-            # Check if project should be included for this version
-            if not self.check_version_condition(
-                project.get("versions", []), target_version
-            ):
-                continue
-
+        for project in self.content_index.projects(projects_data, target_version):
             # Process project with version-specific content
             processed_project = {
                 "name": project["name"],
@@ -495,328 +699,82 @@ class CVBuilder:
 
         return filtered_projects
 
-    def generate_skills_markdown(self, skills_data: Dict, target_version: str) -> str:
-        """Generate clean markdown for skills section"""
+    def build_skills_section(self, skills_data: Dict, target_version: str) -> SkillsSection:
+        """Skills of a version as a typed section (executive, legacy technical or dynamic)"""
         processed_skills = self.process_skills_section(skills_data, target_version)
 
         if processed_skills["layout"] == "executive":
-            # Executive format - clean paragraph style
-            markdown = "## Skills\n\n"
+            categories = []
             for category, skills in processed_skills["categories"].items():
-                formatted_category = category.replace("_", " ").title()
-                
                 skill_items = []
                 for skill in skills:
                     skill_text = skill["skill"]
                     if skill.get("metric"):
                         skill_text += f" ({skill['metric']})"
                     skill_items.append(skill_text)
+                categories.append(SkillCategory(category.replace("_", " ").title(), skill_items))
+            return SkillsSection("executive", categories)
 
-                markdown += f"**{formatted_category}**: {' • '.join(skill_items)}\n\n"
-
-            return markdown
-            
-        elif processed_skills["layout"] == "technical_dynamic":
+        if processed_skills["layout"] == "technical_dynamic":
             # Dynamic format - supports 2-6+ columns automatically
-            return self._generate_dynamic_skills_markdown_clean(processed_skills, target_version)
-            
-        else:
-            # Technical format - clean markdown table
-            markdown = "## Skills\n\n"
-
-            # Software Engineering category
-            col1_items = processed_skills.get(
-                "programming_languages", []
-            ) + processed_skills.get("core_technologies", [])
-            
-            # Domain expertise (AI & LLMs)
-            col2_items = []
-            domain_exp = processed_skills.get("domain_expertise", {})
-            if domain_exp:
-                col2_items.extend(domain_exp.get("skills", []))
-                col2_items.extend(domain_exp.get("secondary_skills", []))
-
-            # Tools and platforms (Data Science)
-            col3_items = processed_skills.get(
-                "tools_platforms", []
-            ) + processed_skills.get("project_management", [])
-
-            if col1_items or col2_items or col3_items:
-                # Generate table header
-                markdown += "| **Software Engineering** | **ML & LLMs** | **Data Science** |\n"
-                markdown += "| :----------------------- | :------------ | :--------------- |\n"
-                
-                # Create table rows
-                max_items = max(len(col1_items), len(col2_items), len(col3_items))
-
-                for i in range(max_items):
-                    col1 = f"✓ {col1_items[i]}" if i < len(col1_items) else ""
-                    col2 = f"✓ {col2_items[i]}" if i < len(col2_items) else ""
-                    col3 = f"✓ {col3_items[i]}" if i < len(col3_items) else ""
-
-                    markdown += f"| {col1} | {col2} | {col3} |\n"
-
-            return markdown + "\n"
-
-    def _generate_dynamic_skills_markdown(self, processed_skills: Dict, target_version: str) -> str:
-        """Generate dynamic skills markdown with 2-6+ column support"""
-        markdown = '<section class="cv-section cv-skills">\n<h2 class="cv-section-header" id="skills">Skills</h2>\n\n'
-        
-        categories = processed_skills.get("categories", [])
-        column_count = processed_skills.get("column_count", len(categories))
-        column_width = processed_skills.get("column_width", f"{100/column_count:.2f}%")
-        
-        if categories and column_count <= 6:
-            # Table layout for 2-6 columns
-            markdown += '<div class="cv-skills-table-container">\n'
-            markdown += f'<table class="cv-skills-table cv-skills-dynamic" data-columns="{column_count}">\n'
-            markdown += "<thead>\n<tr>\n"
-            
-            # Generate headers
-            for category in categories:
-                markdown += f'<th class="cv-skills-header" style="width: {column_width};"><strong>{category["name"]}</strong></th>\n'
-            
-            markdown += "</tr>\n</thead>\n<tbody>\n"
-            
-            # Calculate maximum number of skills across all categories
-            max_skills = max(len(category["skills"]) for category in categories) if categories else 0
-            
-            # Generate rows dynamically based on max skills
-            for i in range(max_skills):
-                markdown += '<tr class="cv-skills-row">\n'
-                for category in categories:
-                    if i < len(category["skills"]):
-                        skill = category["skills"][i]
-                        markdown += f'<td class="cv-skill-item"><span class="cv-skill-bullet">✓</span> {skill}</td>\n'
-                    else:
-                        markdown += '<td class="cv-skill-item"></td>\n'
-                markdown += "</tr>\n"
-            
-            markdown += "</tbody>\n</table>\n</div>\n\n"
-            
-            # Add responsive CSS for dynamic columns
-            markdown += self._generate_dynamic_skills_css(column_count, column_width)
-            
-        elif categories and column_count > 6:
-            # List layout for 7+ columns (too many for table)
-            markdown += '<div class="cv-skills-list-container">\n'
-            for category in categories:
-                markdown += f'<div class="cv-skill-category">\n'
-                markdown += f'<h3 class="cv-skill-category-header">{category["name"]}</h3>\n'
-                markdown += '<div class="cv-skill-items">\n'
-                for skill in category["skills"]:
-                    markdown += f'<span class="cv-skill-tag">{skill}</span>\n'
-                markdown += '</div>\n</div>\n'
-            markdown += '</div>\n\n'
-            
-            # Add list layout CSS
-            markdown += self._generate_list_skills_css()
-        else:
-            # Fallback when no categories are available
-            markdown += f'''<div class="cv-skills-notice">
-    <p class="cv-notice-text">
-        <em>Skills configuration not available for {target_version} version.</em>
-    </p>
-</div>
-
-'''
-        
-        markdown += "</section>\n\n"
-        return markdown
-
-    def _generate_dynamic_skills_css(self, column_count: int, column_width: str) -> str:
-        """Generate responsive CSS for dynamic skills table"""
-        css = f'''<style>
-/* Dynamic Skills CSS */
-.cv-skills-dynamic {{
-    table-layout: fixed;
-    width: 100%;
-    border-collapse: collapse;
-}}
-
-.cv-skills-dynamic th,
-.cv-skills-dynamic td {{
-    width: {column_width};
-    overflow-wrap: break-word;
-    vertical-align: top;
-    padding: 0.3rem 0.5rem;
-}}
-
-.cv-skills-dynamic th {{
-    background-color: var(--color-accent, #e53e3e);
-    color: white;
-    font-weight: bold;
-    text-align: center;
-}}
-
-.cv-skill-bullet {{
-    color: var(--color-accent, #e53e3e);
-    font-weight: bold;
-    margin-right: 0.3rem;
-}}
-
-'''
-
-        # Add responsive font sizing based on column count
-        if column_count >= 5:
-            css += '''/* 5+ columns: smaller font for better fit */
-@media print {
-    .cv-skills-dynamic {
-        font-size: 8pt;
-    }
-    .cv-skill-item {
-        font-size: 7pt;
-    }
-}
-
-@media screen {
-    .cv-skills-dynamic {
-        font-size: 0.8rem;
-    }
-    .cv-skill-item {
-        font-size: 0.75rem;
-    }
-}
-
-'''
-        elif column_count == 4:
-            css += '''/* 4 columns: medium font */
-@media print {
-    .cv-skills-dynamic {
-        font-size: 9pt;
-    }
-    .cv-skill-item {
-        font-size: 8pt;
-    }
-}
+            categories = processed_skills.get("categories", [])
+            return SkillsSection(
+                "technical_dynamic",
+                [
+                    SkillCategory(category["name"], [self._skill_name(skill) for skill in category["skills"]])
+                    for category in categories
+                ],
+                column_count=processed_skills.get("column_count", len(categories)),
+                notice=f"Skills configuration not available for {target_version} version.",
+            )
 
-@media screen {
-    .cv-skills-dynamic {
-        font-size: 0.85rem;
-    }
-    .cv-skill-item {
-        font-size: 0.8rem;
-    }
-}
-
-'''
-        else:  # 2-3 columns
-            css += '''/* 2-3 columns: normal font */
-@media print {
-    .cv-skills-dynamic {
-        font-size: 10pt;
-    }
-    .cv-skill-item {
-        font-size: 9pt;
-    }
-}
+        # Technical format - Software Engineering, ML & LLMs, Data Science columns
+        col1_items = processed_skills.get(
+            "programming_languages", []
+        ) + processed_skills.get("core_technologies", [])
+
+        col2_items = []
+        domain_exp = processed_skills.get("domain_expertise", {})
+        if domain_exp:
+            col2_items.extend(domain_exp.get("skills", []))
+            col2_items.extend(domain_exp.get("secondary_skills", []))
+
+        col3_items = processed_skills.get(
+            "tools_platforms", []
+        ) + processed_skills.get("project_management", [])
+
+        return SkillsSection(
+            "technical",
+            [
+                SkillCategory("Software Engineering", [str(item) for item in col1_items]),
+                SkillCategory("ML & LLMs", [str(item) for item in col2_items]),
+                SkillCategory("Data Science", [str(item) for item in col3_items]),
+            ],
+            column_count=3,
+        )
 
-'''
-        
-        css += '''</style>
-
-'''
-        return css
-
-    def _generate_list_skills_css(self) -> str:
-        """Generate CSS for list layout (7+ columns)"""
-        return '''<style>
-/* List layout styling (for 7+ columns) */
-.cv-skills-list-container {
-    display: grid;
-    grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-    gap: 1rem;
-    margin: 1rem 0;
-}
-
-.cv-skill-category {
-    margin-bottom: 1rem;
-}
-
-.cv-skill-category-header {
-    font-size: 1rem;
-    font-weight: bold;
-    color: var(--color-accent, #e53e3e);
-    margin-bottom: 0.5rem;
-    border-bottom: 1px solid var(--color-accent, #e53e3e);
-    padding-bottom: 0.2rem;
-}
-
-.cv-skill-items {
-    display: flex;
-    flex-wrap: wrap;
-    gap: 0.3rem;
-}
-
-.cv-skill-tag {
-    background-color: var(--color-light-gray, #f5f5f5);
-    color: var(--color-text, #2d3748);
-    padding: 0.2rem 0.5rem;
-    border-radius: 3px;
-    font-size: 0.8rem;
-    border: 1px solid var(--color-border, #e2e8f0);
-}
-
-@media print {
-    .cv-skill-tag {
-        background-color: transparent;
-        border: 1px solid #ccc;
-    }
-}
-</style>
+    @staticmethod
+    def _skill_name(skill: Any) -> str:
+        """Skill display name; dynamic skills may be plain strings or dicts"""
+        if isinstance(skill, dict):
+            return skill.get('name', skill.get('skill', str(skill)))
+        return str(skill)
 
-'''
+    def generate_skills_markdown(self, skills_data: Dict, target_version: str) -> str:
+        """Generate clean markdown for skills section"""
+        return MarkdownRenderer().skills(self.build_skills_section(skills_data, target_version))
 
-    def _generate_dynamic_skills_markdown_clean(self, processed_skills: Dict, target_version: str) -> str:
-        """Generate clean markdown for dynamic skills (2-6+ columns)"""
-        markdown = "## Skills\n\n"
-        
-        categories = processed_skills.get("categories", [])
-        column_count = processed_skills.get("column_count", len(categories))
+    def get_executive_summary(self, personal_data: Dict, target_version: str) -> str:
+        """Version-specific executive summary, or "" if the version does not show one"""
+        version_config = self.versions[target_version]
         
-        if categories and column_count <= 6:
-            # Table layout for 2-6 columns
-            # Generate table header
-            headers = [f"**{cat['name']}**" for cat in categories]
-            markdown += "| " + " | ".join(headers) + " |\n"
-            markdown += "| " + " | ".join([":--" for _ in headers]) + " |\n"
-            
-            # Calculate maximum number of skills across all categories
-            max_skills = max(len(category["skills"]) for category in categories) if categories else 0
-            
-            # Generate rows
-            for i in range(max_skills):
-                row = []
-                for category in categories:
-                    if i < len(category["skills"]):
-                        skill = category["skills"][i]
-                        # Handle different skill formats
-                        if isinstance(skill, dict):
-                            skill_name = skill.get('name', skill.get('skill', str(skill)))
-                        else:
-                            skill_name = str(skill)
-                        row.append(f"✓ {skill_name}")
-                    else:
-                        row.append("")
-                markdown += "| " + " | ".join(row) + " |\n"
-            
-        elif categories and column_count > 6:
-            # For 7+ columns, use a different format (categories as paragraphs)
-            for category in categories:
-                markdown += f"**{category['name']}**: "
-                skills = []
-                for skill in category["skills"]:
-                    if isinstance(skill, dict):
-                        skill_name = skill.get('name', skill.get('skill', str(skill)))
-                    else:
-                        skill_name = str(skill)
-                    skills.append(skill_name)
-                markdown += " • ".join(skills) + "\n\n"
-        else:
-            # Fallback when no categories are available
-            markdown += f"*Skills configuration not available for {target_version} version.*\n"
+        # Check if this version should show executive summary
+        if not version_config.get("show_executive_summary", False):
+            return ""
         
-        return markdown + "\n"
+        # Get version-specific executive summary
+        executive_summaries = personal_data.get("executive_summaries", {})
+        return executive_summaries.get(target_version, "")
 
     def generate_executive_summary_markdown(self, personal_data: Dict, target_version: str) -> str:
         """
@@ -827,23 +785,27 @@ class CVBuilder:
             target_version: CV version being built (affects content selection)
             
         Returns:
-            Clean markdown string with executive summary section, or empty string if not applicable
+            Summary as italic text (no section header), or empty string if not applicable
         """
-        version_config = self.versions[target_version]
-        
-        # Check if this version should show executive summary
-        if not version_config.get("show_executive_summary", False):
-            return ""
-        
-        # Get version-specific executive summary
-        executive_summaries = personal_data.get("executive_summaries", {})
-        summary = executive_summaries.get(target_version, "")
-        
-        if not summary:
-            return ""
-        
-        # Return just the summary text without section header (styled as italic text)
-        return f"_{summary}_\n\n"
+        summary = self.get_executive_summary(personal_data, target_version)
+        return f"_{summary}_\n\n" if summary else ""
+
+    def build_experience_entries(
+        self, experience_data: Dict, target_version: str
+    ) -> List[ExperienceEntry]:
+        """Experience entries of a version with filtered achievements"""
+        return [
+            ExperienceEntry(
+                company=exp["company"],
+                location=exp["location"],
+                period=exp["period"],
+                position=exp["position"],
+                reference=exp.get("reference") or "",
+                achievements=[achievement["text"] for achievement in exp["achievements"]],
+                tags=exp.get("skills_tags") or "",
+            )
+            for exp in self.process_experience_section(experience_data, target_version)
+        ]
 
     def generate_experience_markdown(
         self, experience_data: Dict, target_version: str
@@ -868,33 +830,30 @@ class CVBuilder:
             
             _Skills, Tags, Here_
         """
-        experiences = self.process_experience_section(experience_data, target_version)
-
-        markdown = "## Work Experience\n\n"
-
-        for exp in experiences:
-            # Company header with location/date
-            markdown += f"### {exp['company']}\n"
-            markdown += f"_{exp['location']}_<br>\n"
-            markdown += f"_{exp['period']}_\n\n"
-            
-            # Position with optional reference
-            position = f"**{exp['position']}**"
-            if exp.get('reference'):
-                position += f" · _{exp['reference']}_"
-            markdown += f"{position}\n\n"
-            
-            # Achievements as bullet list
-            if exp['achievements']:
-                for achievement in exp['achievements']:
-                    markdown += f"* {achievement['text']}\n"
-                markdown += "\n"
-            
-            # Skills tags as italic text
-            if exp.get('skills_tags'):
-                markdown += f"_{exp['skills_tags']}_\n\n"
+        return MarkdownRenderer().experience(
+            self.build_experience_entries(experience_data, target_version)
+        )
 
-        return markdown
+    def build_project_entries(
+        self, projects_data: Dict, target_version: str
+    ) -> List[ProjectEntry]:
+        """Project entries of a version (links limited to GitHub, demo and website)"""
+        link_labels = {"github": "Github", "demo": "Demo", "website": "Website"}
+
+        return [
+            ProjectEntry(
+                name=project["name"],
+                period=project["period"],
+                links=[
+                    Link(link_type, link_labels[link_type], url)
+                    for link_type, url in (project.get("links") or {}).items()
+                    if link_type in link_labels
+                ],
+                descriptions=list(project.get("descriptions") or []),
+                tags=project.get("skills_tags") or "",
+            )
+            for project in self.process_projects_section(projects_data, target_version)
+        ]
 
     def generate_projects_markdown(
         self, projects_data: Dict, target_version: str
@@ -909,43 +868,9 @@ class CVBuilder:
         Returns:
             Clean markdown string, or empty string if no projects
         """
-        projects = self.process_projects_section(projects_data, target_version)
-
-        if not projects:
-            return ""
-
-        markdown = "## Projects\n\n"
-
-        for project in projects:
-            # Project name with period
-            markdown += f"### {project['name']}\n"
-            markdown += f"_{project['period']}_\n\n"
-
-            # Add links if available
-            if project.get("links"):
-                link_parts = []
-                for link_type, url in project["links"].items():
-                    if link_type == "github":
-                        link_parts.append(f"[Github]({url})")
-                    elif link_type == "demo":
-                        link_parts.append(f"[Demo]({url})")
-                    elif link_type == "website":
-                        link_parts.append(f"[Website]({url})")
-                
-                if link_parts:
-                    markdown += " | ".join(link_parts) + "\n\n"
-
-            # Add descriptions as bullet points
-            if project.get("descriptions"):
-                for desc in project["descriptions"]:
-                    markdown += f"- {desc}\n"
-                markdown += "\n"
-
-            # Add skills tags if available
-            if project.get("skills_tags"):
-                markdown += f"_{project['skills_tags']}_\n\n"
-
-        return markdown
+        return MarkdownRenderer().projects(
+            self.build_project_entries(projects_data, target_version)
+        )
 
     def process_education_section(
         self, education_data: Dict, target_version: str
@@ -970,79 +895,49 @@ class CVBuilder:
                 "location": education.get("location", ""),
                 "technical_highlight": self._get_content_for_version(education.get("technical_highlight", {}), target_version),
                 "relevant_coursework": self._get_content_for_version(education.get("relevant_coursework", {}), target_version),
-                "achievements": [],
+                # Notable achievements then practical experience, filtered by version
+                "achievements": self.content_index.education_achievements(education, target_version),
             }
 
-            # Filter achievements by version (notable_achievements)
-            for achievement in education.get("notable_achievements", []):
-                achievement_versions = achievement.get("versions", [])
-                if self.check_version_condition(achievement_versions, target_version):
-                    processed_education["achievements"].append(
-                        achievement["achievement"]
-                    )
-
-            # Filter practical experience by version
-            for experience in education.get("practical_experience", []):
-                experience_versions = experience.get("versions", [])
-                if self.check_version_condition(experience_versions, target_version):
-                    processed_education["achievements"].append(experience["experience"])
-
             filtered_education.append(processed_education)
 
         return filtered_education
 
+    def build_education_entries(
+        self, education_data: Dict, target_version: str
+    ) -> List[EducationEntry]:
+        """Education entries of a version"""
+        entries = []
+        for education in self.process_education_section(education_data, target_version):
+            period = ""
+            if education["start_date"] and education["end_date"]:
+                period = f"{education['start_date']} - {education['end_date']}"
+            entries.append(EducationEntry(
+                institution=education["institution"],
+                location=education["location"],
+                period=period,
+                degree=education["degree"],
+                highlight=education.get("technical_highlight") or "",
+            ))
+        return entries
+
     def generate_education_markdown(
         self, education_data: Dict, target_version: str
     ) -> str:
         """Generate clean markdown for education section"""
-        processed_education = self.process_education_section(
-            education_data, target_version
+        return MarkdownRenderer().education(
+            self.build_education_entries(education_data, target_version)
         )
 
-        if not processed_education:
-            return ""
-
-        markdown = "## Education\n\n"
-
-        for education in processed_education:
-            # Institution header
-            markdown += f"### {education['institution']}\n"
-            markdown += f"_{education['location']}_<br>\n"
-            
-            # Date range
-            if education["start_date"] and education["end_date"]:
-                markdown += f"_{education['start_date']} - {education['end_date']}_\n\n"
-            
-            # Degree
-            markdown += f"**{education['degree']}**\n"
-            
-            # Technical highlight if available
-            if education.get("technical_highlight"):
-                markdown += f"{education['technical_highlight']}\n"
-            
-            markdown += "\n"
-
-        return markdown
-
     def process_certifications_section(self, personal_data: Dict, target_version: str) -> List[Dict]:
         """Process certifications section with version-specific filtering"""
-        version_config = self.versions[target_version]
-        certifications = personal_data.get("certifications", [])
-        
-        if not certifications:
+        if not personal_data.get("certifications", []):
             return []
         
         filtered_certifications = []
         
-        for cert in certifications:
-            # Check if certification should be included for this version
-            if not self.check_version_condition(cert.get("versions", []), target_version):
-                continue
-            
-            # Check priority condition  
-            if cert.get("priority", 1) > version_config["max_priority"]:
-                continue
-            
+        # Certifications pre-filtered by version and priority
+        for cert in self.content_index.certifications(personal_data, target_version):
             # Process certification with all metadata
             processed_cert = {
                 "name": cert.get("name", ""),
@@ -1060,6 +955,26 @@ class CVBuilder:
         
         return filtered_certifications
 
+    def build_certification_entries(
+        self, personal_data: Dict, target_version: str
+    ) -> List[CertificationEntry]:
+        """Certification entries, empty if the version does not show certifications"""
+        version_config = self.versions[target_version]
+        
+        # Check if this version should show certifications
+        if not version_config.get("show_certifications", False):
+            return []
+        
+        return [
+            CertificationEntry(
+                name=cert["name"],
+                organization=cert["issuing_organization"] or "",
+                year=str(cert["year"]) if cert["year"] else "",
+                description=cert["description"] or "",
+            )
+            for cert in self.process_certifications_section(personal_data, target_version)
+        ]
+
     def generate_certifications_markdown(self, personal_data: Dict, target_version: str) -> str:
         """
         Generate clean markdown for certifications section.
@@ -1071,52 +986,73 @@ class CVBuilder:
         Returns:
             Clean markdown string with certifications, or empty string if none
         """
-        version_config = self.versions[target_version]
-        
-        # Check if this version should show certifications
-        if not version_config.get("show_certifications", False):
-            return ""
-        
-        processed_certifications = self.process_certifications_section(personal_data, target_version)
-        
-        if not processed_certifications:
-            return ""
-        
-        markdown = "## Training & Certifications\n\n"
-        
-        for cert in processed_certifications:
-            # Certification name
-            markdown += f"### {cert['name']}\n"
-            
-            # Organization and year
-            org_year_parts = []
-            if cert["issuing_organization"]:
-                org_year_parts.append(f"_{cert['issuing_organization']}_")
-            if cert["year"]:
-                org_year_parts.append(f"_{cert['year']}_")
-            
-            if org_year_parts:
-                markdown += " | ".join(org_year_parts) + "\n\n"
-            
-            # Description if available
-            if cert["description"]:
-                markdown += f"{cert['description']}\n\n"
-        
-        return markdown
+        return MarkdownRenderer().certifications(
+            self.build_certification_entries(personal_data, target_version)
+        )
 
-    def build_version(self, target_version: str, template_name: str = "francois") -> None:
+    def build_version(self, target_version: str, template_name: str = "francois") -> bool:
         """Build a specific CV version using François-style markdown generation"""
-        self._build_markdown(target_version)
+        with self.profiler.span("markdown_stage", version=target_version) as span:
+            span["written"] = self._build_markdown(target_version)
+            return span["written"]
+
+    def _build_markdown(self, target_version: str) -> bool:
+        """
+        Generate markdown with embedded semantic HTML (François method).
+
+        Returns:
+            True if the markdown file was (re)written, False if it was already
+            up to date
+        """
+        output_path = self.output_path(target_version, ".md")
+
+        # Skip when neither content nor build code changed since the last build
+        code = [Path(__file__).with_name(name) for name in ("cv_document.py", "cv_renderers.py", "content_index.py")]
+        fingerprint = self.build_cache.fingerprint(
+            [self.content_dir / name for name in self.content_files] + [Path(__file__)] + code,
+            {"version": target_version, "dynamic_skills": DYNAMIC_SKILLS_AVAILABLE},
+        )
+        if self.build_cache.is_fresh(target_version, "markdown", fingerprint):
+            print(f"⏭️  {target_version} markdown up to date")
+            return False
 
-    def _build_markdown(self, target_version: str) -> None:
-        """Generate markdown with embedded semantic HTML (François method)"""
         print(f"Building {target_version} version...")
+        markdown_content = self.render_markdown(target_version)
+
+        # Leave the file untouched when a content edit does not affect this version
+        written = True
+        if output_path.exists() and output_path.read_text(encoding="utf-8") == markdown_content:
+            written = False
+        else:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(output_path, "w", encoding="utf-8") as f:
+                f.write(markdown_content)
+
+        self.build_cache.record(target_version, "markdown", fingerprint, [output_path])
+
+        if written:
+            print(f"✅ {target_version} version built successfully")
+            print(f"📄 Output: {output_path}")
+        else:
+            print(f"⏭️  {target_version} markdown unchanged")
+        return written
+
+    def build_document(self, target_version: str) -> CVDocument:
+        """
+        Select and filter the content of a version into a CVDocument.
+
+        This is the single place where YAML content is interpreted; the
+        markdown file and the semantic HTML are both rendered from the result.
+        """
+        with self.profiler.span("build_document", version=target_version):
+            return self._build_document(target_version)
 
+    def _build_document(self, target_version: str) -> CVDocument:
         # Load content files
-        skills_data = self.load_yaml_file("arthur-skills.yaml")
-        experience_data = self.load_yaml_file("arthur-experience.yaml")
-        projects_data = self.load_yaml_file("arthur-projects.yaml")
-        education_data = self.load_yaml_file("arthur-education.yaml")
+        skills_data = self.load_yaml_file(self.content_file("skills"))
+        experience_data = self.load_yaml_file(self.content_file("experience"))
+        projects_data = self.load_yaml_file(self.content_file("projects"))
+        education_data = self.load_yaml_file(self.content_file("education"))
 
         # Load personal data with version-specific content
         personal_info = self.load_personal_data(target_version)
@@ -1125,73 +1061,352 @@ class CVBuilder:
         version_config = self.versions[target_version]
         tagline = self._get_content_for_version(personal_info.get("taglines", {}), target_version) or version_config["tagline"]
 
-        # =====================================================================
-        # SEMANTIC HTML GENERATION - Enhanced CV Structure
-        #
-        # This section generates HTML with semantic CSS classes for reliable,
-        # maintainable styling across all templates. Each CV element now has:
-        # 1. Semantic class (cv-*) for reliable targeting
-        # 2. Legacy class for backward compatibility
-        # 3. Semantic ID for unique element identification
-        #
-        # Benefits:
-        # - Eliminates fragile CSS selectors like h1+h3+p
-        # - Enables consistent styling across templates
-        # - Maintains backward compatibility with existing CSS
-        # - Provides semantic structure for accessibility
-        # =====================================================================
+        header = Header(
+            name=personal_info["name"],
+            profile_photo=personal_info["profile_photo"],
+            tagline=tagline,
+            address=personal_info["address"],
+            contact=Contact(
+                phone=personal_info["phone"],
+                email=personal_info["email"],
+                github=personal_info["github"],
+                linkedin=personal_info["linkedin"],
+            ),
+            languages=personal_info["languages"],
+            executive_summary=self.get_executive_summary(personal_info, target_version),
+        )
 
-        # Build semantic HTML structure for CSS Grid (guide.md method)
-        markdown_content = f"""![{personal_info['name']}]({personal_info['profile_photo']})
+        return CVDocument(
+            version=target_version,
+            header=header,
+            skills=self.build_skills_section(skills_data, target_version),
+            experience=self.build_experience_entries(experience_data, target_version),
+            projects=self.build_project_entries(projects_data, target_version),
+            education=self.build_education_entries(education_data, target_version),
+            certifications=self.build_certification_entries(personal_info, target_version),
+        )
 
-# **{personal_info['name']}**
-### {tagline}
+    def render_markdown(self, target_version: str) -> str:
+        """Render the markdown document of a version from the loaded content"""
+        document = self.build_document(target_version)
+        with self.profiler.span("markdown_renderer", version=target_version):
+            return MarkdownRenderer().render(document)
 
-_{personal_info['address']}_
+    def render_html_body(self, target_version: str) -> str:
+        """Render the semantic HTML body of a version directly from its content"""
+        document = self.build_document(target_version)
+        with self.profiler.span("html_renderer", version=target_version):
+            return HTMLRenderer().render(document)
 
-📞 {personal_info['phone']} | ✉️ [{personal_info['email']}](mailto:{personal_info['email']}) | 🔗 [GitHub](https://github.com/{personal_info['github']}) | 💼 [LinkedIn](https://linkedin.com/in/{personal_info['linkedin']})
+    def build_all_versions(self, template_name: str = "francois", jobs: int = 1) -> None:
+        """Build all CV versions using markdown generation"""
+        print("Building all CV versions...")
 
-**{personal_info['languages']}**
-{self.generate_executive_summary_markdown(personal_info, target_version)}
-{self.generate_skills_markdown(skills_data, target_version)}
+        if jobs > 1:
+            targets = [(version, template_name) for version in self.versions.keys()]
+            results = self.build_parallel(targets, "markdown", jobs)
+            if any(not result["success"] for result in results):
+                return
+        else:
+            for version in self.versions.keys():
+                self.build_target(version, template_name)
 
-{self.generate_experience_markdown(experience_data, target_version)}
+        print("🎉 All versions built successfully!")
 
-{self.generate_projects_markdown(projects_data, target_version)}
+    def build_target(
+        self,
+        target_version: str,
+        template: str = "francois",
+        mode: str = "markdown",
+        no_enrich: bool = False,
+        from_existing: bool = False,
+    ) -> None:
+        """
+        Build one version/template target in the requested mode.
 
-{self.generate_education_markdown(education_data, target_version)}
+        Args:
+            target_version: CV version to build
+            template: CSS template name
+            mode: One of 'markdown', 'html', 'pdf' (all formats) or 'test'
+            no_enrich: Skip markdown enrichment for HTML output
+            from_existing: Reuse existing markdown instead of regenerating from YAML
+        """
+        with self.profiler.span(f"{target_version}:{template}", category="target", mode=mode):
+            self._build_target(target_version, template, mode, no_enrich, from_existing)
 
-{self.generate_certifications_markdown(personal_info, target_version)}
-"""
+    def _build_target(
+        self, target_version: str, template: str, mode: str, no_enrich: bool, from_existing: bool
+    ) -> None:
+        if mode == "test":
+            self.test_version(target_version)
+        elif mode == "html":
+            if from_existing:
+                self.build_html_from_existing(target_version, template=template, no_enrich=no_enrich)
+            else:
+                self.build_html(target_version, template=template, no_enrich=no_enrich)
+        elif mode == "pdf":
+            if from_existing:
+                self.build_pdf_from_existing(target_version, template=template)
+            else:
+                self.build_all_formats(target_version, template=template)
+        else:
+            self.build_version(target_version, template)
+
+    def build_parallel(
+        self,
+        targets: List[Tuple[str, str]],
+        mode: str = "markdown",
+        jobs: int = 2,
+        no_enrich: bool = False,
+        from_existing: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Build version/template targets across worker processes.
+
+        Content is parsed once here and handed to every worker as a read-only
+        snapshot. Targets sharing a version share an output directory, so they
+        run sequentially inside the same job. Each job's console output is
+        captured and printed as one block when it finishes.
+
+        Returns:
+            One result dict per target with 'version', 'template', 'success',
+            'duration' and 'error' keys
+        """
+        jobs_by_version: Dict[str, List[Tuple[str, str]]] = {}
+        for version, template in targets:
+            jobs_by_version.setdefault(version, []).append((version, template))
+
+        options = {"no_enrich": no_enrich, "from_existing": from_existing}
+        snapshot = self.load_content_snapshot()
+        results = []
+        start = time.perf_counter()
+
+        print(f"🚀 Building {len(targets)} targets with {jobs} workers...")
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(jobs_by_version)),
+            initializer=_init_build_worker,
+            initargs=(
+                str(self.content_dir), str(self.output_dir), self.build_cache.force, snapshot,
+                self.font_subsetter is not None, self.profiler.enabled, self.person,
+                self.css_pruner is not None, self.single_file, self.hedge_delay,
+                str(self.cache_dir), str(self.asset_store.store_dir),
+            ),
+        ) as executor:
+            futures = {
+                executor.submit(_run_build_job, version_targets, mode, options): version
+                for version, version_targets in jobs_by_version.items()
+            }
+            for future in as_completed(futures):
+                try:
+                    job = future.result()
+                except Exception as e:
+                    # Worker process died before it could report
+                    job = {
+                        "output": "",
+                        "results": [
+                            {"version": version, "template": template, "success": False,
+                             "duration": 0.0, "error": f"Worker crashed: {e}"}
+                            for version, template in jobs_by_version[futures[future]]
+                        ],
+                        "cache": {},
+                        "profile": [],
+                        "backend_stats": [],
+                    }
 
-        # Save markdown file
-        output_path = self.output_dir / target_version / f"arthur-{target_version}.md"
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+                print(f"\n── {futures[future]} " + "─" * 40)
+                print(job["output"], end="")
+                self.build_cache.merge(job["cache"])
+                self.profiler.merge(job["profile"])
+                self.backend_stats.merge(job["backend_stats"])
+                results.extend(job["results"])
+
+        self.build_cache.save()
+        self.backend_stats.save()
+
+        failures = [result for result in results if not result["success"]]
+        elapsed = time.perf_counter() - start
+        print(f"\n📊 {len(results) - len(failures)}/{len(results)} targets built in {elapsed:.2f}s")
+        for failure in failures:
+            print(f"❌ {failure['version']} ({failure['template']}): {failure['error']}")
+
+        return results
+
+    async def abuild(
+        self,
+        targets: List[Tuple[str, str]],
+        mode: str = "pdf",
+        no_enrich: bool = False,
+        from_existing: bool = False,
+        timeout: Optional[float] = None,
+        limits: Optional[Dict[str, int]] = None,
+        max_tasks: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Build version/template targets concurrently on the running event loop.
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(markdown_content)
+        External tools run as asyncio subprocesses bounded per backend (see
+        async_build.default_limits); a target exceeding timeout seconds is
+        cancelled and its running tools killed. Cancelling the awaiting task
+        cancels every target.
 
-        print(f"✅ {target_version} version built successfully")
-        print(f"📄 Output: {output_path}")
+        Returns:
+            One result dict per target with 'version', 'template', 'success',
+            'duration' and 'error' keys
+        """
+        start = time.perf_counter()
+        print(f"🚀 Building {len(targets)} targets concurrently...")
+        results = await build_async(
+            self, targets, mode, no_enrich, from_existing, timeout=timeout, limits=limits, max_tasks=max_tasks
+        )
 
-    def build_all_versions(self, template_name: str = "francois") -> None:
-        """Build all CV versions using markdown generation"""
-        print("Building all CV versions...")
+        failures = [result for result in results if not result["success"]]
+        elapsed = time.perf_counter() - start
+        print(f"\n📊 {len(results) - len(failures)}/{len(results)} targets built in {elapsed:.2f}s")
+        for failure in failures:
+            print(f"❌ {failure['version']} ({failure['template']}): {failure['error']}")
+        return results
 
-        for version in self.versions.keys():
-            self.build_version(version, template_name)
+    def reload_config(self) -> None:
+        """Re-read versions.yaml and re-discover templates after they changed on disk"""
+        self.versions = self._load_version_config()
+        self.content_index = ContentIndex(self.versions)
+        self.available_templates = self.discover_templates()
 
-        print("🎉 All versions built successfully!")
+    def plan_rebuild(self, changed: Iterable[Path], template: str) -> Optional[str]:
+        """
+        Earliest build stage invalidated by a set of changed files.
+
+        Returns:
+            'markdown' for content YAML, 'html' for the active template, shared
+            stylesheets and fonts, or None if nothing built depends on them
+        """
+        template_css = self.available_templates.get(template)
+        template_dir = Path(template_css).parent if template_css else None
+
+        stages = set()
+        for path in changed:
+            if self.content_dir in path.parents:
+                if path.suffix in (".yaml", ".yml"):
+                    stages.add("markdown")
+            elif Path("templates") in path.parents:
+                if template_dir and (template_dir == path.parent or template_dir in path.parents):
+                    stages.add("html")
+            elif Path("fonts") in path.parents or path.suffix == ".css":
+                stages.add("html")
+
+        for stage in ("markdown", "html"):
+            if stage in stages:
+                return stage
+        return None
+
+    def rebuild_changed(
+        self,
+        changed: Iterable[Path],
+        versions: Optional[List[str]],
+        template: str = "francois",
+        mode: str = "markdown",
+        no_enrich: bool = False,
+    ) -> List[str]:
+        """
+        Rebuild only what a set of changed files affects.
+
+        For content changes every version's markdown is re-rendered in memory
+        (milliseconds), and only versions whose markdown actually changed go
+        on to the HTML/PDF stages.
+
+        Args:
+            changed: Paths reported by the watcher
+            versions: Versions to keep up to date (None for all)
+            template: CSS template name
+            mode: Last stage to build: 'markdown', 'html' or 'pdf'
+            no_enrich: Skip markdown enrichment for HTML output
+
+        Returns:
+            Versions that were rebuilt
+        """
+        changed = set(changed)
+        stage = self.plan_rebuild(changed, template)
+        if stage is None:
+            print("Nothing built depends on these files")
+            return []
+
+        # Half-saved YAML: keep the last good output and wait for the next save
+        for path in changed:
+            if path.suffix in (".yaml", ".yml") and path.exists():
+                try:
+                    self.content_cache.load(path)
+                except ContentParseError as e:
+                    print(f"❌ {path} is not valid YAML, waiting for the next save: {e}")
+                    return []
+
+        if self.content_dir / "versions.yaml" in changed or any(
+            Path("templates") in path.parents for path in changed
+        ):
+            self.reload_config()
+
+        targets = [v for v in (versions or self.versions) if v in self.versions]
+        if stage == "markdown":
+            affected = [version for version in targets if self._build_markdown(version)]
+        else:
+            affected = targets
+
+        if mode in ("html", "pdf"):
+            for version in affected:
+                self.build_html_from_existing(version, template=template, no_enrich=no_enrich)
+                if mode == "pdf":
+                    self._process_pdf_generation(version, template)
+
+        self.content_cache.save()
+        return affected
+
+    def watch(
+        self,
+        versions: Optional[List[str]],
+        template: str = "francois",
+        mode: str = "markdown",
+        no_enrich: bool = False,
+        interval: float = 0.2,
+        debounce: float = 0.3,
+    ) -> None:
+        """
+        Rebuild affected versions whenever content, templates, CSS or fonts change.
+
+        Runs until interrupted; the builder (content cache, Chrome session,
+        WeasyPrint fonts) stays warm between rebuilds.
+        """
+        watcher = ChangeWatcher(
+            [self.content_dir, Path("templates"), Path("fonts")],
+            globs=["css_*.css"],
+            interval=interval,
+            debounce=debounce,
+        )
+        print(f"\n👀 Watching {self.content_dir}/, templates/, fonts/ and css_*.css (Ctrl+C to stop)")
+
+        try:
+            while True:
+                changed = watcher.wait_for_changes()
+                print(f"\n🔄 Changed: {describe(changed)}")
+                start = time.perf_counter()
+                try:
+                    affected = self.rebuild_changed(changed, versions, template, mode, no_enrich)
+                except Exception:
+                    # A broken edit must not end the session
+                    traceback.print_exc()
+                    continue
+                elapsed = time.perf_counter() - start
+                print(f"⚡ Rebuilt {', '.join(affected) or 'no versions'} in {elapsed:.2f}s")
+        except KeyboardInterrupt:
+            print("\n👋 Stopped watching")
 
     def test_version(self, target_version: str) -> None:
         """Test a specific version for content validation"""
         print(f"Testing {target_version} version...")
 
         # Load content and test logic
-        skills_data = self.load_yaml_file("arthur-skills.yaml")
-        experience_data = self.load_yaml_file("arthur-experience.yaml")
-        projects_data = self.load_yaml_file("arthur-projects.yaml")
-        education_data = self.load_yaml_file("arthur-education.yaml")
+        skills_data = self.load_yaml_file(self.content_file("skills"))
+        experience_data = self.load_yaml_file(self.content_file("experience"))
+        projects_data = self.load_yaml_file(self.content_file("projects"))
+        education_data = self.load_yaml_file(self.content_file("education"))
 
         # Test personal data loading
         personal_info = self.load_personal_data(target_version)
@@ -1231,35 +1446,38 @@ _{personal_info['address']}_
 
         print(f"✅ {target_version} version tested successfully")
 
-    def _copy_assets(self, target_version: str, template: str = "francois") -> None:
-        """Copy assets to output directory for proper PDF generation"""
-        import shutil
-
-        output_assets_dir = self.output_dir / target_version / "assets"
-        output_assets_dir.mkdir(parents=True, exist_ok=True)
+    def _copy_assets(
+        self, target_version: str, template: str = "francois", include_fonts: bool = True
+    ) -> None:
+        """
+        Stage assets into the output directory for proper PDF generation.
 
-        # Copy profile image
-        profile_src = Path("assets/profile.jpeg")
-        if profile_src.exists():
-            shutil.copy2(profile_src, output_assets_dir / "profile.jpeg")
+        With include_fonts=False, css_fonts.css and fonts/ are left to the font
+        subsetting stage.
+        """
+        version_dir = self.output_dir / target_version
+        output_assets_dir = version_dir / "assets"
+        self.asset_store.reset_stats()
 
-        # Copy icons
-        icons_dir = output_assets_dir / "icons"
-        icons_dir.mkdir(exist_ok=True)
+        # Profile image, when the person has one
+        personal_info = self.load_personal_data(target_version)
+        if personal_info["profile_photo_source"] is not None:
+            self.asset_store.stage(personal_info["profile_photo_source"], version_dir / personal_info["profile_photo"])
 
+        # Icons
         for icon in ["phone.png", "email.png", "github.png", "linkedin.png"]:
             icon_src = Path(f"assets/icons/{icon}")
             if icon_src.exists():
-                shutil.copy2(icon_src, icons_dir / icon)
+                self.asset_store.stage(icon_src, output_assets_dir / "icons" / icon)
 
-        # Copy CSS files - use template discovery system
+        # CSS files - use template discovery system
         css_source = self.available_templates.get(template)
-        css_dest = self.output_dir / target_version / "css_styling.css"
-        fonts_dest = self.output_dir / target_version / "css_fonts.css"
+        css_dest = version_dir / "css_styling.css"
+        fonts_dest = version_dir / "css_fonts.css"
 
-        # Copy main CSS - use selected template
+        # Main CSS - use selected template
         if css_source and Path(css_source).exists():
-            shutil.copy2(css_source, css_dest)
+            self.asset_store.stage(Path(css_source), css_dest)
             print(f"Using CSS template: {css_source}")
         else:
             # Fallback to old system
@@ -1271,7 +1489,7 @@ _{personal_info['address']}_
             fallback_used = False
             for fallback in fallback_files:
                 if Path(fallback).exists():
-                    shutil.copy2(fallback, css_dest)
+                    self.asset_store.stage(Path(fallback), css_dest)
                     print(
                         f"Warning: Template '{template}' not found, using fallback: {fallback}"
                     )
@@ -1283,29 +1501,32 @@ _{personal_info['address']}_
                     f"Error: No CSS template found for '{template}' and no fallback available"
                 )
 
-        # Copy print CSS if exists
+        # Generated skills layout rules (identical for every version, stored once)
+        skills_stored = self.asset_store.put_bytes(skills_css().encode("utf-8"), ".css")
+        self.asset_store.stage_stored(skills_stored, version_dir / SKILLS_STYLESHEET)
+
+        # Print CSS if exists
         if Path("css_styling_print.css").exists():
-            css_print_dest = self.output_dir / target_version / "css_styling_print.css"
-            shutil.copy2("css_styling_print.css", css_print_dest)
+            self.asset_store.stage(Path("css_styling_print.css"), version_dir / "css_styling_print.css")
+
+        if include_fonts:
+            # Fonts CSS
+            if Path("css_fonts.css").exists():
+                self.asset_store.stage(Path("css_fonts.css"), fonts_dest)
 
-        # Copy fonts CSS
-        if Path("css_fonts.css").exists():
-            shutil.copy2("css_fonts.css", fonts_dest)
+            # Fonts directory (mirrored: fonts removed from the source are removed here)
+            fonts_src = Path("fonts")
+            if fonts_src.exists():
+                self.asset_store.stage_tree(fonts_src, version_dir / "fonts")
 
-        # Copy fonts directory
-        fonts_src = Path("fonts")
-        if fonts_src.exists():
-            fonts_output_dest = self.output_dir / target_version / "fonts"
-            if fonts_output_dest.exists():
-                shutil.rmtree(fonts_output_dest)
-            shutil.copytree(fonts_src, fonts_output_dest)
+        print(f"📦 Assets staged: {self.asset_store.summary()}")
 
     def build_html_from_existing(self, target_version: str, template: str = "francois", no_enrich: bool = False) -> None:
         """Build HTML version of CV from existing markdown file (no YAML regeneration)"""
         print(f"Building HTML from existing markdown for {target_version} version...")
 
         # Check if markdown file exists
-        md_path = self.output_dir / target_version / f"arthur-{target_version}.md"
+        md_path = self.output_path(target_version, ".md")
         if not md_path.exists():
             print(f"❌ Markdown file not found: {md_path}")
             print(f"   Run without --from-existing to generate markdown from YAML first")
@@ -1325,129 +1546,450 @@ _{personal_info['address']}_
         self.build_version(target_version)
 
         # Load clean markdown content
-        md_path = self.output_dir / target_version / f"arthur-{target_version}.md"
+        md_path = self.output_path(target_version, ".md")
         with open(md_path, 'r', encoding='utf-8') as f:
             clean_markdown = f.read()
 
-        self._process_markdown_to_html(clean_markdown, target_version, template, no_enrich)
+        self._process_markdown_to_html(
+            clean_markdown, target_version, template, no_enrich, from_document=True
+        )
 
-    def _process_markdown_to_html(self, clean_markdown: str, target_version: str, template: str = "francois", no_enrich: bool = False) -> None:
-        """Common HTML processing logic for both build methods"""
-        
-        md_path = self.output_dir / target_version / f"arthur-{target_version}.md"
+    def _process_markdown_to_html(
+        self,
+        clean_markdown: str,
+        target_version: str,
+        template: str = "francois",
+        no_enrich: bool = False,
+        from_document: bool = False,
+    ) -> None:
+        """
+        Common HTML processing logic for both build methods.
+
+        With from_document the semantic HTML is rendered straight from the
+        version's CVDocument; otherwise (--from-existing, where only the
+        markdown file is known) the markdown is enriched.
+        """
+        with self.profiler.span("html_stage", version=target_version, template=template) as span:
+            span["built"] = self._build_html_stage(
+                clean_markdown, target_version, template, no_enrich, from_document
+            )
+
+    def _build_html_stage(
+        self, clean_markdown: str, target_version: str, template: str, no_enrich: bool, from_document: bool
+    ) -> bool:
+        """Run the HTML stage; False if it was up to date or failed"""
+        md_path = self.output_path(target_version, ".md")
+        html_path = self.output_path(target_version, ".html")
+
+        # Skip when markdown, template, fonts, assets and enricher are unchanged
+        target = f"{target_version}:{template}"
+        with self.profiler.span("fingerprint", stage="html"):
+            fingerprint = self._html_stage_fingerprint(clean_markdown, target_version, template, no_enrich)
+        if self.build_cache.is_fresh(target, "html", fingerprint):
+            print(f"⏭️  {target_version} HTML up to date ({template})")
+            return False
+
+        # Copy assets for proper PDF generation (fonts are subset once the HTML exists)
+        subset_fonts = self.font_subsetter is not None and Path("css_fonts.css").exists()
+        with self.profiler.span("copy_assets", version=target_version):
+            self._copy_assets(target_version, template, include_fonts=not subset_fonts)
 
         if no_enrich:
-            # Use clean markdown directly (for debugging)
+            # Use clean markdown directly (for debugging) - pandoc converts it
             print("⚠️ Skipping enrichment - using clean markdown directly")
-            input_path = md_path
-            pandoc_format = "markdown"
+            if not self._run_pandoc_html(md_path, html_path):
+                return False
         else:
-            # Enrich markdown with HTML structure
+            if from_document:
+                enriched_html = self.render_html_body(target_version)
+            else:
+                # Enrich markdown with HTML structure, streamed into the file
+                enriched_html = self._get_enricher().iter_enriched_html(clean_markdown)
+            # When streaming, enrichment runs inside this span
+            with self.profiler.span("write_html", version=target_version, streamed=not from_document):
+                write_standalone_html(
+                    html_path,
+                    enriched_html,
+                    title=f"{self.person}-{target_version}",
+                    stylesheets=DEFAULT_STYLESHEETS,
+                )
+
+        print(f"✅ HTML generated: {html_path}")
+        if self.css_pruner is not None:
+            with self.profiler.span("css_prune", version=target_version):
+                self._prune_css(html_path)
+        if subset_fonts:
+            with self.profiler.span("font_subset", version=target_version):
+                self._subset_fonts(html_path)
+        if self.single_file:
+            # Last, so only pruned rules and subset fonts are embedded
+            with self.profiler.span("inline", version=target_version):
+                size = write_single_file(html_path)
+            print(f"📦 Single-file HTML: {size / 1024:.0f} KB")
+        self.build_cache.record(
+            target, "html", fingerprint, self._html_stage_outputs(target_version)
+        )
+        return True
+
+    @classmethod
+    def _get_enricher(cls):
+        """Markdown enricher shared by every builder in the process (patterns compiled once)"""
+        if cls._enricher is None:
             from markdown_enricher import MarkdownEnricher
-            enricher = MarkdownEnricher()
-            enriched_html = enricher.enrich_markdown(clean_markdown)
+            cls._enricher = MarkdownEnricher()
+        return cls._enricher
 
-            # Save enriched HTML to temporary file
-            temp_html_path = md_path.with_suffix('.enriched.html')
-            with open(temp_html_path, 'w', encoding='utf-8') as f:
-                f.write(enriched_html)
-            
-            input_path = temp_html_path
-            pandoc_format = "html"
+    def _prune_css(self, html_path: Path) -> None:
+        """Replace the output's template CSS with the rules its HTML can match, minified"""
+        css_path = html_path.parent / "css_styling.css"
+        if not css_path.exists():
+            return
+        self.css_pruner.reset_stats()
+        self.css_pruner.prune_output(html_path, css_path)
+        print(f"✂️  CSS pruned: {self.css_pruner.summary()}")
+
+    def _subset_fonts(self, html_path: Path) -> None:
+        """Replace the output's fonts with subsets covering the HTML's characters"""
+        version_dir = html_path.parent
+        self.font_subsetter.reset_stats()
+        self.font_subsetter.subset_output(
+            html_path,
+            Path("css_fonts.css"),
+            stylesheets=[version_dir / "css_styling.css", version_dir / "css_styling_print.css"],
+        )
+        print(f"🔤 Fonts subset: {self.font_subsetter.summary()}")
+
+    def _run_tool(self, tool: str, cmd: List[str], **kwargs: Any) -> subprocess.CompletedProcess:
+        """subprocess.run under a profiler span, so external tools show up in --profile"""
+        with self.profiler.span(tool, category="subprocess", command=Path(cmd[0]).name) as span:
+            if self.tool_runner is not None:
+                result = self.tool_runner.run(tool, cmd, **kwargs)
+            elif current_scope() is not None:
+                result = run_process(cmd, current_scope(), **kwargs)
+            else:
+                result = subprocess.run(cmd, **kwargs)
+            span["returncode"] = result.returncode
+            return result
 
-        # Copy assets for proper PDF generation
-        self._copy_assets(target_version, template)
+    def _tool_slot(self, backend: str):
+        """Hold a backend slot under abuild (in-process renderers count against its limit)"""
+        if self.tool_runner is None:
+            return contextlib.nullcontext()
+        return self.tool_runner.slot(backend)
 
-        # Convert to final HTML using pandoc
-        html_path = self.output_dir / target_version / f"arthur-{target_version}.html"
+    def _run_pandoc_html(self, md_path: Path, html_path: Path) -> bool:
+        """Convert clean markdown to standalone HTML with pandoc (--no-enrich path)"""
+        pandoc = self.backends.path("pandoc")
+        if not pandoc:
+            print("❌ pandoc not found. Please install pandoc first.")
+            return False
 
         try:
             cmd = [
-                "pandoc",
-                str(input_path),
+                pandoc,
+                str(md_path),
                 "-f",
-                pandoc_format,
+                "markdown",
                 "-t",
                 "html",
                 "--css",
                 "./css_fonts.css",  # Local fonts first
                 "--css",
                 "./css_styling.css",  # Main styling second
+                "--css",
+                f"./{SKILLS_STYLESHEET}",  # Skills layout rules last
                 "--standalone",
                 "-o",
                 str(html_path),
             ]
-            subprocess.run(cmd, check=True)
-            print(f"✅ HTML generated: {html_path}")
+            self._run_tool("pandoc_html", cmd, check=True)
+            return True
         except subprocess.CalledProcessError as e:
             print(f"❌ HTML generation failed: {e}")
         except FileNotFoundError:
             print("❌ pandoc not found. Please install pandoc first.")
-        finally:
-            # Clean up temporary file if it was created
-            if not no_enrich:
-                temp_html_path.unlink(missing_ok=True)
+        return False
+
+    def _html_stage_fingerprint(
+        self, clean_markdown: str, target_version: str, template: str, no_enrich: bool
+    ) -> str:
+        """Hash every input of the HTML stage for the incremental build cache"""
+        inputs = [
+            Path("css_fonts.css"),
+            Path("css_styling_print.css"),
+            Path("fonts"),
+            Path("assets"),
+            Path(__file__),
+            Path(__file__).with_name("markdown_enricher.py"),
+            Path(__file__).with_name("html_writer.py"),
+            Path(__file__).with_name("content_index.py"),
+            Path(__file__).with_name("asset_store.py"),
+            Path(__file__).with_name("cv_document.py"),
+            Path(__file__).with_name("cv_renderers.py"),
+            Path(__file__).with_name("font_subsetter.py"),
+            Path(__file__).with_name("skills_stylesheet.py"),
+            Path(__file__).with_name("css_pruner.py"),
+            Path(__file__).with_name("html_inliner.py"),
+        ]
+        css_source = self.available_templates.get(template)
+        if css_source:
+            inputs.append(Path(css_source))
+        photo_source = self.load_personal_data(target_version)["profile_photo_source"]
+        if photo_source is not None:
+            inputs.append(photo_source)
+
+        return self.build_cache.fingerprint(
+            inputs,
+            {
+                "template": template,
+                "no_enrich": no_enrich,
+                "subset_fonts": self.font_subsetter is not None,
+                "prune_css": self.css_pruner is not None,
+                "single_file": self.single_file,
+                "markdown": hashlib.sha256(clean_markdown.encode("utf-8")).hexdigest(),
+            },
+        )
+
+    def _html_stage_outputs(self, target_version: str) -> List[Path]:
+        """Files the HTML stage must leave behind for a cached build to be valid"""
+        version_dir = self.output_dir / target_version
+        return [
+            self.output_path(target_version, ".html"),
+            version_dir / "css_styling.css",
+            version_dir / "css_fonts.css",
+            version_dir / SKILLS_STYLESHEET,
+        ]
 
     def build_pdf_from_existing(self, target_version: str, template: str = "francois") -> None:
         """Attempt to build PDF version of CV from existing markdown (no YAML regeneration)"""
         print(f"Building PDF from existing markdown for {target_version} version...")
 
         # First ensure HTML exists, generate from existing markdown if needed
-        html_path = self.output_dir / target_version / f"arthur-{target_version}.html"
+        html_path = self.output_path(target_version, ".html")
         if not html_path.exists():
             self.build_html_from_existing(target_version, template)
 
-        self._process_pdf_generation(target_version)
+        self._process_pdf_generation(target_version, template)
 
     def build_pdf(self, target_version: str, template: str = "francois") -> None:
         """Attempt to build PDF version of CV"""
         print(f"Building PDF for {target_version} version...")
 
         # First ensure HTML exists
-        html_path = self.output_dir / target_version / f"arthur-{target_version}.html"
+        html_path = self.output_path(target_version, ".html")
         if not html_path.exists():
             self.build_html(target_version, template)
 
-        self._process_pdf_generation(target_version)
+        self._process_pdf_generation(target_version, template)
 
-    def _process_pdf_generation(self, target_version: str) -> None:
+    def _process_pdf_generation(self, target_version: str, template: str = "francois") -> None:
         """Common PDF generation logic for both build methods"""
-        
-        html_path = self.output_dir / target_version / f"arthur-{target_version}.html"
-        pdf_path = self.output_dir / target_version / f"arthur-{target_version}.pdf"
-
-        # Try different PDF generation methods
-        methods = [
-            self._try_chrome_headless_pdf,
-            self._try_weasyprint_pdf,
-            self._try_pandoc_pdf,
-            self._provide_manual_instructions,
-        ]
+        with self.profiler.span("pdf_stage", version=target_version, template=template):
+            html_path = self.output_path(target_version, ".html")
+            pdf_path = self.output_path(target_version, ".pdf")
+
+            # Skip when the rendered HTML and the stylesheets, images and fonts it uses are unchanged
+            target = f"{target_version}:{template}"
+            version_dir = self.output_dir / target_version
+            with self.profiler.span("fingerprint", stage="pdf"):
+                fingerprint = self.build_cache.fingerprint(
+                    [
+                        html_path,
+                        version_dir / "css_styling.css",
+                        version_dir / "css_styling_print.css",
+                        version_dir / "css_fonts.css",
+                        version_dir / SKILLS_STYLESHEET,
+                        version_dir / "assets",
+                        version_dir / "fonts",
+                    ],
+                    {"template": template},
+                )
+            if self.build_cache.is_fresh(target, "pdf", fingerprint):
+                print(f"⏭️  {target_version} PDF up to date ({template})")
+                return
+
+            # Try backends by past success and speed on this machine
+            backends = []
+            for backend in self.backend_stats.order(list(self.PDF_BACKENDS)):
+                if self.backend_stats.allowed(backend):
+                    backends.append(backend)
+                else:
+                    print(f"⏭️  Skipping {backend}: {self.backend_stats.describe(backend)}")
+
+            if self.hedge_delay is not None and len(backends) > 1:
+                winner, started = self._race_pdf_backends(backends[:2], html_path, pdf_path, target_version)
+                if winner is not None:
+                    self.build_cache.record(target, "pdf", fingerprint, [pdf_path])
+                    return
+                backends = [backend for backend in backends if backend not in started]
+
+            for backend in backends:
+                method = getattr(self, self.PDF_BACKENDS[backend])
+                # One span per attempt, so fallbacks show up in --profile
+                start = time.perf_counter()
+                with self.profiler.span(f"pdf:{backend}", version=target_version) as span:
+                    span["success"] = method(html_path, pdf_path, target_version)
+                self.backend_stats.record(backend, span["success"], time.perf_counter() - start)
+                if span["success"]:
+                    self.build_cache.record(target, "pdf", fingerprint, [pdf_path])
+                    return
+
+            # Manual instructions do not produce a PDF, so nothing to cache
+            with self.profiler.span("pdf:provide_manual_instructions", version=target_version):
+                self._provide_manual_instructions(html_path, pdf_path, target_version)
+
+    def _race_pdf_backends(
+        self, backends: List[str], html_path: Path, pdf_path: Path, target_version: str
+    ) -> Tuple[Optional[str], List[str]]:
+        """
+        Hedged PDF render: start backends[0], and backends[1] once the first has
+        run for hedge_delay seconds (or failed).
+
+        Each attempt renders into its own temp file; the first valid PDF is
+        renamed into place and the other attempt is cancelled. Cancelling kills
+        its subprocess; in-process renderers (WeasyPrint, the Chrome session)
+        cannot be interrupted, so they finish in the background and their
+        output is discarded. A cancelled loser is recorded as a lost race
+        taking the time it had run: a backend that hangs drops in the order,
+        but losing does not count toward opening its circuit.
+
+        Returns:
+            (winning backend or None, backends that were started)
+        """
+        parent = current_scope()  # Cancelling an async target cancels its attempts
+        results: "queue.Queue[Tuple[str, bool, bool, float]]" = queue.Queue()
+        scopes: Dict[str, CancelScope] = {}
+        started_at: Dict[str, float] = {}
+        finished: List[str] = []
+        race_lock = threading.Lock()
+        winner: List[str] = []
+
+        def attempt(backend: str, scope: CancelScope) -> None:
+            token = enter_scope(scope)
+            tmp_path = pdf_path.with_name(
+                f".{pdf_path.stem}.{backend}.{os.getpid()}.{threading.get_ident()}.pdf"
+            )
+            start = time.perf_counter()
+            success = cancelled = False
+            try:
+                scope.check()
+                method = getattr(self, self.PDF_BACKENDS[backend])
+                with self.profiler.span(f"pdf:{backend}", version=target_version, hedged=True) as span:
+                    success = method(html_path, tmp_path, target_version) and _is_pdf(tmp_path)
+                    span["success"] = success
+                with race_lock:
+                    if success and not winner and not scope.cancelled:
+                        tmp_path.replace(pdf_path)
+                        winner.append(backend)
+            except asyncio.CancelledError:
+                cancelled = True
+            except Exception as e:
+                print(f"{backend} failed: {e}")
+            finally:
+                exit_scope(token)
+                tmp_path.unlink(missing_ok=True)
+                results.put((backend, success, cancelled or scope.cancelled, time.perf_counter() - start))
+
+        def start(backend: str) -> None:
+            started_at[backend] = time.perf_counter()
+            scopes[backend] = CancelScope(f"pdf:{backend}", parent)
+            # Daemon: a loser stuck in an in-process renderer must not block exit
+            threading.Thread(target=attempt, args=(backend, scopes[backend]), daemon=True).start()
+
+        waiting = list(backends)
+        start(waiting.pop(0))
+        running = 1
+        while running:
+            try:
+                backend, success, cancelled, duration = results.get(
+                    timeout=self.hedge_delay if waiting else None
+                )
+            except queue.Empty:
+                print(f"⏱️  No PDF after {self.hedge_delay:g}s, racing {waiting[0]}")
+                start(waiting.pop(0))
+                running += 1
+                continue
 
-        for method in methods:
-            if method(html_path, pdf_path, target_version):
-                break
+            running -= 1
+            finished.append(backend)
+            if not cancelled:
+                self.backend_stats.record(backend, success, duration)
+            if winner and winner[0] == backend:
+                for other, scope in scopes.items():
+                    if other not in finished:
+                        scope.cancel()
+                        self.backend_stats.record(other, False, time.perf_counter() - started_at[other], lost=True)
+                print(f"🏁 {backend} won the PDF race for {target_version}")
+                return backend, list(scopes)
+            if waiting:
+                # Failed before the hedging delay: no reason to wait for it
+                start(waiting.pop(0))
+                running += 1
+
+        return None, list(scopes)
+
+    def warm_renderers(self) -> None:
+        """Start the long-lived PDF renderer now rather than on the first PDF"""
+        if self._get_chrome_session() is not None or self._weasyprint_renderer is not None:
+            return
+        if self.backends.available("weasyprint_python"):
+            renderer = WeasyPrintRenderer()
+            try:
+                renderer.load()  # Import WeasyPrint and load fonts up front
+            except Exception as e:
+                print(f"WeasyPrint unavailable ({e})")
+                return
+            self._weasyprint_renderer = renderer
+
+    def _get_chrome_session(self) -> Optional[ChromeSession]:
+        """Start (once) and return the shared DevTools Chrome session"""
+        with self._renderer_lock:
+            return self._start_chrome_session()
+
+    def _start_chrome_session(self) -> Optional[ChromeSession]:
+        if self._chrome_session is not None and self._chrome_session.is_running:
+            return self._chrome_session
+        if self._chrome_session_failed:
+            return None
+
+        chrome_path = self.backends.path("chrome")
+        if not chrome_path:
+            self._chrome_session_failed = True
+            return None
+
+        session = ChromeSession(chrome_path)
+        try:
+            with self.profiler.span("chrome_session_start", category="subprocess"):
+                session.start()
+        except (ChromeSessionError, OSError) as e:
+            print(f"Chrome DevTools session unavailable ({e}), using one process per PDF")
+            session.close()  # Never leave a half-started browser running
+            self._chrome_session_failed = True
+            return None
+
+        self._chrome_session = session
+        return session
 
     def _try_chrome_headless_pdf(
         self, html_path: Path, pdf_path: Path, target_version: str
     ) -> bool:
         """Try generating PDF using Chrome headless mode"""
-        chrome_commands = [
-            "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
-            "google-chrome",
-            "chromium",
-            "google-chrome-stable",
-            "/opt/homebrew/bin/chromium",
-            "/usr/local/bin/google-chrome",
-        ]
-
-        for chrome_cmd in chrome_commands:
+        # Preferred: print through the long-lived browser (no cold start per PDF)
+        session = self._get_chrome_session()
+        if session is not None:
             try:
-                # Check if the command exists
-                if chrome_cmd.startswith("/"):
-                    if not Path(chrome_cmd).exists():
-                        continue
+                with self._tool_slot("chrome"), self.profiler.span("chrome_session_print", category="subprocess"):
+                    session.print_to_pdf(html_path, pdf_path)
+                print(f"✅ PDF generated with Chrome session: {pdf_path}")
+                return True
+            except ChromeSessionError as e:
+                print(f"Chrome session failed: {e}")
+                session.close()
+                self._chrome_session = None
 
+        chrome_cmd = self.backends.path("chrome")
+        if chrome_cmd:
+            try:
                 cmd = [
                     chrome_cmd,
                     "--headless=new",  # Use new headless mode
@@ -1465,18 +2007,17 @@ _{personal_info['address']}_
                     "file://" + str(html_path.absolute()),
                 ]
 
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+                result = self._run_tool("chrome_cli", cmd, capture_output=True, text=True, timeout=60)
                 if result.returncode == 0 and pdf_path.exists():
                     print(f"✅ PDF generated with Chrome headless: {pdf_path}")
                     return True
-                else:
-                    print(f"Chrome failed with {chrome_cmd}: {result.stderr}")
-
+                print(f"Chrome failed with {chrome_cmd}: {result.stderr}")
             except FileNotFoundError:
-                continue
+                # Binary removed since it was probed
+                self.backends.invalidate("chrome")
             except Exception as e:
                 print(f"Chrome error with {chrome_cmd}: {e}")
-                continue
+            return False
 
         print("Chrome headless not available")
         return False
@@ -1485,57 +2026,33 @@ _{personal_info['address']}_
         self, html_path: Path, pdf_path: Path, target_version: str
     ) -> bool:
         """Try generating PDF using weasyprint with local fonts and print-optimized CSS"""
-        try:
-            # Set up environment for WeasyPrint
-            import os
-
-            old_env = {}
-
-            # Set required environment variables
-            env_vars = {
-                "PKG_CONFIG_PATH": "/opt/homebrew/lib/pkgconfig:/opt/homebrew/opt/libffi/lib/pkgconfig",
-                "DYLD_LIBRARY_PATH": "/opt/homebrew/lib:/opt/homebrew/Cellar/glib/2.84.3/lib",
-            }
-
-            for key, value in env_vars.items():
-                old_env[key] = os.environ.get(key)
-                os.environ[key] = value
-
-            try:
-                from weasyprint import HTML, CSS
-                from weasyprint.text.fonts import FontConfiguration
-
-                # Create font configuration with local fonts
-                font_config = FontConfiguration()
-
-                # Use the HTML file directly with print CSS
-                css_print_path = html_path.parent / "css_styling_print.css"
-                if not css_print_path.exists():
-                    css_print_path = html_path.parent / "css_styling.css"
-
-                # Load CSS files
-                css_files = []
-                if css_print_path.exists():
-                    css_files.append(
-                        CSS(filename=str(css_print_path), font_config=font_config)
-                    )
+        if not self.backends.available("weasyprint_python"):
+            return self._try_weasyprint_command_line(html_path, pdf_path, target_version)
 
-                # Generate PDF with font configuration
-                html_doc = HTML(filename=str(html_path))
-                html_doc.write_pdf(
-                    str(pdf_path), stylesheets=css_files, font_config=font_config
-                )
-
-                print(f"✅ PDF generated with weasyprint: {pdf_path}")
-                return True
+        try:
+            # Shared renderer keeps fonts and parsed stylesheets warm across versions
+            with self._renderer_lock:
+                if self._weasyprint_renderer is None:
+                    self._weasyprint_renderer = WeasyPrintRenderer()
+                renderer = self._weasyprint_renderer
+
+            # Use the HTML file directly with print CSS
+            css_print_path = html_path.parent / "css_styling_print.css"
+            if not css_print_path.exists():
+                css_print_path = html_path.parent / "css_styling.css"
+
+            extra_stylesheets = [css_print_path] if css_print_path.exists() else []
+            # One render at a time: the renderer's stylesheet cache is not thread-safe
+            with self._renderer_lock, self.profiler.span("weasyprint_render") as span:
+                timings = renderer.render_file(html_path, pdf_path, extra_stylesheets)
+                span.update(timings)
 
-            finally:
-                # Restore environment variables
-                for key, old_value in old_env.items():
-                    if old_value is None:
-                        os.environ.pop(key, None)
-                    else:
-                        os.environ[key] = old_value
+            print(
+                f"✅ PDF generated with weasyprint: {pdf_path} "
+                f"(parse {timings['parse']:.2f}s, layout {timings['layout']:.2f}s, "
+                f"write {timings['write']:.2f}s)"
+            )
+            return True
 
         except ImportError:
             print(
@@ -1554,6 +2071,11 @@ _{personal_info['address']}_
         self, html_path: Path, pdf_path: Path, target_version: str
     ) -> bool:
         """Fallback to WeasyPrint command line"""
+        weasyprint_cmd = self.backends.path("weasyprint_cmd")
+        if not weasyprint_cmd:
+            print("WeasyPrint not available")
+            return False
+
         try:
             # Set up environment for WeasyPrint
             env = subprocess.os.environ.copy()
@@ -1565,9 +2087,9 @@ _{personal_info['address']}_
                 + env.get("DYLD_LIBRARY_PATH", "")
             )
 
-            cmd = ["weasyprint", str(html_path), str(pdf_path)]
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, timeout=60, env=env
+            cmd = [weasyprint_cmd, str(html_path), str(pdf_path)]
+            result = self._run_tool(
+                "weasyprint_cli", cmd, capture_output=True, text=True, timeout=60, env=env
             )
 
             if result.returncode == 0:
@@ -1584,14 +2106,22 @@ _{personal_info['address']}_
         self, html_path: Path, pdf_path: Path, target_version: str
     ) -> bool:
         """Try generating PDF using pandoc with HTML-native engines"""
+        pandoc = self.backends.path("pandoc")
+        if not pandoc:
+            print("pandoc not available")
+            return False
 
-        # Try different PDF engines that preserve HTML/CSS
-        pdf_engines = ["weasyprint", "wkhtmltopdf", "prince", "pagedjs-cli"]
+        # Try the PDF engines that preserve HTML/CSS and were found on PATH
+        pdf_engines = [
+            capability.split(":", 1)[1]
+            for capability in self.backends.capabilities("pandoc")
+            if capability.startswith("pdf-engine:")
+        ]
 
         for engine in pdf_engines:
             try:
                 cmd = [
-                    "pandoc",
+                    pandoc,
                     str(html_path),
                     "-f",
                     "html",
@@ -1602,7 +2132,9 @@ _{personal_info['address']}_
                     "-o",
                     str(pdf_path),
                 ]
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+                result = self._run_tool(
+                    f"pandoc_pdf:{engine}", cmd, capture_output=True, text=True, timeout=60
+                )
 
                 if result.returncode == 0:
                     print(f"✅ PDF generated with pandoc using {engine}: {pdf_path}")
@@ -1620,7 +2152,7 @@ _{personal_info['address']}_
         # Fallback to default LaTeX engine
         try:
             cmd = [
-                "pandoc",
+                pandoc,
                 str(html_path),
                 "-f",
                 "html",
@@ -1629,7 +2161,7 @@ _{personal_info['address']}_
                 "-o",
                 str(pdf_path),
             ]
-            subprocess.run(cmd, check=True)
+            self._run_tool("pandoc_pdf:latex", cmd, check=True)
             print(f"✅ PDF generated with pandoc (LaTeX fallback): {pdf_path}")
             return True
         except Exception as e:
@@ -1665,6 +2197,57 @@ You can also use browser extensions or online converters.
         self.build_pdf(target_version, template)  # PDF
 
 
+# Per-process builder used by build_parallel workers
+_WORKER_BUILDER: Optional[CVBuilder] = None
+
+
+def _init_build_worker(
+    content_dir: str, output_dir: str, force: bool, content_snapshot: Dict[str, Any],
+    subset_fonts: bool = True, profile: bool = False, person: Optional[str] = None,
+    prune_css: bool = True, single_file: bool = False, hedge_delay: Optional[float] = None,
+    cache_dir: str = ".cv-cache", asset_dir: Optional[str] = None,
+) -> None:
+    """Create the worker's builder once from the parent's content snapshot"""
+    global _WORKER_BUILDER
+    with contextlib.redirect_stdout(io.StringIO()):
+        _WORKER_BUILDER = CVBuilder(
+            content_dir, output_dir, force=force, content_snapshot=content_snapshot,
+            subset_fonts=subset_fonts, profiler=Profiler(enabled=profile), person=person,
+            prune_css=prune_css, single_file=single_file, hedge_delay=hedge_delay,
+            cache_dir=cache_dir, asset_dir=asset_dir,
+        )
+    # The parent merges and saves the manifest to avoid concurrent writes
+    _WORKER_BUILDER.build_cache.autosave = False
+
+
+def _run_build_job(
+    targets: List[Tuple[str, str]], mode: str, options: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Build targets in a worker, capturing console output for ordered printing"""
+    builder = _WORKER_BUILDER
+    buffer = io.StringIO()
+    results = []
+
+    with contextlib.redirect_stdout(buffer):
+        for version, template in targets:
+            start = time.perf_counter()
+            try:
+                builder.build_target(version, template, mode, **options)
+                results.append({"version": version, "template": template, "success": True,
+                                "duration": time.perf_counter() - start, "error": None})
+            except Exception as e:
+                traceback.print_exc(file=buffer)
+                results.append({"version": version, "template": template, "success": False,
+                                "duration": time.perf_counter() - start, "error": str(e)})
+
+    return {
+        "output": buffer.getvalue(),
+        "results": results,
+        "cache": builder.build_cache.export_changes(),
+        "profile": builder.profiler.drain(),
+        "backend_stats": builder.backend_stats.export_changes(),
+    }
+
 
 def main():
     # Create a temporary builder to discover templates for argparse choices
@@ -1713,60 +2296,122 @@ def main():
     parser.add_argument(
         "--from-existing", action="store_true", help="Generate HTML/PDF from existing markdown (skip YAML regeneration)"
     )
+    parser.add_argument(
+        "--force", action="store_true", help="Rebuild every target even if its inputs are unchanged"
+    )
+    parser.add_argument(
+        "--no-subset-fonts", action="store_true", help="Ship full font files instead of per-version subsets"
+    )
+    parser.add_argument(
+        "--single-file", action="store_true",
+        help="Inline CSS, fonts and images into a self-contained HTML file",
+    )
+    parser.add_argument(
+        "--no-prune-css", action="store_true", help="Ship the full template CSS instead of per-version pruned CSS"
+    )
+    parser.add_argument(
+        "--watch", action="store_true", help="Keep running and rebuild affected versions when sources change"
+    )
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=1, help="Build versions in N parallel worker processes"
+    )
+    parser.add_argument(
+        "--async", dest="async_build", action="store_true",
+        help="Overlap versions on one event loop, running external tools as bounded async subprocesses",
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=None, help="With --async, cancel a target after this many seconds"
+    )
+    parser.add_argument(
+        "--hedge", nargs="?", type=float, const=2.0, default=None, metavar="DELAY",
+        help="Race the two most reliable PDF backends: start the second if the first has no PDF "
+        "after DELAY seconds (default 2), keep the first valid PDF and kill the other",
+    )
+    parser.add_argument(
+        "--profile", nargs="?", const="", default=None, metavar="TRACE_JSON",
+        help="Record stage timings as a trace-event file (default: <output-dir>/build-trace.json) "
+        "and print the stages with the most self time",
+    )
 
     args = parser.parse_args()
 
-    builder = CVBuilder(args.content_dir, args.output_dir)
-
+    profiler = Profiler(enabled=args.profile is not None)
+    builder = CVBuilder(
+        args.content_dir, args.output_dir, force=args.force, subset_fonts=not args.no_subset_fonts,
+        profiler=profiler, prune_css=not args.no_prune_css, single_file=args.single_file,
+        hedge_delay=args.hedge,
+    )
+    try:
+        run_cli(builder, args)
+    finally:
+        builder.close()
+        if profiler.enabled:
+            trace_path = Path(args.profile or Path(args.output_dir) / "build-trace.json")
+            profiler.write_trace(trace_path)
+            profiler.print_summary()
+            print(f"📈 Trace written: {trace_path} (open in ui.perfetto.dev or chrome://tracing)")
+
+
+def run_cli(builder: CVBuilder, args: argparse.Namespace) -> None:
+    """Dispatch parsed command line arguments to the builder"""
     # Standard build commands
     if args.check_deps:
-        builder.print_dependency_status()
+        builder.print_dependency_status(refresh=args.force)
         return
 
+    # Surface version-key typos before spending any build work
+    problems = builder.validate_content()
+    if problems:
+        print("⚠️  Content references versions not defined in versions.yaml:")
+        for problem in problems:
+            print(f"   - {problem}")
+
     if args.test:
-        if args.version == "all":
-            for version in builder.versions.keys():
-                builder.test_version(version)
-        else:
-            builder.test_version(args.version)
+        mode = "test"
     elif args.html:
-        # Build HTML only
-        if args.from_existing:
-            # Generate HTML from existing markdown files
-            if args.version == "all":
-                for version in builder.versions.keys():
-                    builder.build_html_from_existing(version, template=args.template, no_enrich=args.no_enrich)
-            else:
-                builder.build_html_from_existing(args.version, template=args.template, no_enrich=args.no_enrich)
-        else:
-            # Build markdown + HTML
-            if args.version == "all":
-                for version in builder.versions.keys():
-                    builder.build_html(version, template=args.template, no_enrich=args.no_enrich)
-            else:
-                builder.build_html(args.version, template=args.template, no_enrich=args.no_enrich)
+        mode = "html"
     elif args.pdf:
-        # Build PDF
-        if args.from_existing:
-            # Generate PDF from existing markdown files
-            if args.version == "all":
-                for version in builder.versions.keys():
-                    builder.build_pdf_from_existing(version, template=args.template)
-            else:
-                builder.build_pdf_from_existing(args.version, template=args.template)
-        else:
-            # Build markdown + HTML + PDF
-            if args.version == "all":
-                for version in builder.versions.keys():
-                    builder.build_all_formats(version, template=args.template)
-            else:
-                builder.build_all_formats(args.version, template=args.template)
+        mode = "pdf"  # markdown + HTML + PDF unless --from-existing
     else:
-        # Default: build markdown only
-        if args.version == "all":
-            builder.build_all_versions(args.template)
-        else:
-            builder.build_version(args.version, args.template)
+        mode = "markdown"
+
+    versions = list(builder.versions.keys()) if args.version == "all" else [args.version]
+
+    if args.async_build and mode != "test":
+        asyncio.run(builder.abuild(
+            [(version, args.template) for version in versions],
+            mode,
+            no_enrich=args.no_enrich,
+            from_existing=args.from_existing,
+            timeout=args.timeout,
+        ))
+    elif args.jobs > 1 and len(versions) > 1 and mode != "test":
+        builder.build_parallel(
+            [(version, args.template) for version in versions],
+            mode,
+            args.jobs,
+            no_enrich=args.no_enrich,
+            from_existing=args.from_existing,
+        )
+    elif mode == "markdown" and args.version == "all":
+        builder.build_all_versions(args.template)
+    else:
+        for version in versions:
+            builder.build_target(
+                version,
+                args.template,
+                mode,
+                no_enrich=args.no_enrich,
+                from_existing=args.from_existing,
+            )
+
+    if args.watch and mode != "test":
+        builder.watch(
+            None if args.version == "all" else [args.version],
+            args.template,
+            mode,
+            no_enrich=args.no_enrich,
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Cancel Scope - Kill the external tools started on behalf of one piece of work
+
+A scope is entered for a build target (async builds) or a single hedged PDF
+attempt, and is visible to every tool that work starts through
+CVBuilder._run_tool. Cancelling the scope kills the tools still running, and
+any tool the work would start next raises CancelledError (a BaseException,
+so backends' `except Exception` fallbacks do not swallow it) and the stage
+unwinds. Cancelling a scope also cancels the scopes opened inside it.
+"""
+
+import asyncio
+import contextvars
+import subprocess
+from typing import Any, Dict, List, Optional, Set
+
+
+class CancelScope:
+    """
+    Cancellable work, e.g. one target or one hedged backend attempt.
+
+    Args:
+        name: Label used in messages
+        parent: Enclosing scope; cancelling it cancels this one
+    """
+
+    def __init__(self, name: str, parent: Optional["CancelScope"] = None):
+        self.name = name
+        self.cancelled = False
+        self.running: Set[Any] = set()  # Handles with a cancel() method
+        self.children: List["CancelScope"] = []
+        if parent is not None:
+            parent.children.append(self)
+            self.cancelled = parent.cancelled
+
+    def cancel(self) -> None:
+        self.cancelled = True
+        for handle in list(self.running):
+            handle.cancel()
+        for child in list(self.children):
+            child.cancel()
+
+    def check(self) -> None:
+        """Raise CancelledError once the scope is cancelled"""
+        if self.cancelled:
+            raise asyncio.CancelledError()
+
+
+# Scope of the work running in the current thread/task; threads that run a
+# scope's stages get it through a copied context or by setting it themselves
+_CURRENT_SCOPE: contextvars.ContextVar[Optional[CancelScope]] = contextvars.ContextVar(
+    "cancel_scope", default=None
+)
+
+
+def current_scope() -> Optional[CancelScope]:
+    return _CURRENT_SCOPE.get()
+
+
+def enter_scope(scope: Optional[CancelScope]) -> contextvars.Token:
+    """Make scope current in this thread/task (undo with exit_scope)"""
+    return _CURRENT_SCOPE.set(scope)
+
+
+def exit_scope(token: contextvars.Token) -> None:
+    _CURRENT_SCOPE.reset(token)
+
+
+class _ProcessHandle:
+    def __init__(self, process: subprocess.Popen):
+        self.process = process
+
+    def cancel(self) -> None:
+        if self.process.poll() is None:
+            self.process.kill()
+
+
+def run_process(
+    cmd: List[str],
+    scope: CancelScope,
+    check: bool = False,
+    capture_output: bool = False,
+    text: bool = False,
+    timeout: Optional[float] = None,
+    env: Optional[Dict[str, str]] = None,
+) -> subprocess.CompletedProcess:
+    """subprocess.run that cancelling scope kills (same arguments and errors)"""
+    scope.check()
+    pipe = subprocess.PIPE if capture_output else None
+    process = subprocess.Popen(cmd, stdout=pipe, stderr=pipe, text=text, env=env)
+    handle = _ProcessHandle(process)
+    scope.running.add(handle)
+    if scope.cancelled:  # Cancelled between the check and registering
+        handle.cancel()
+    try:
+        try:
+            stdout, stderr = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+            raise
+    finally:
+        scope.running.discard(handle)
+
+    scope.check()
+    result = subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
+    if check:
+        result.check_returncode()
+    return result
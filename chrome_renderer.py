@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+Chrome Renderer - Persistent headless Chrome session for batch PDF printing
+
+Drives a single long-lived Chrome process over the DevTools protocol using the
+pipe transport (--remote-debugging-pipe), so no network port is opened and a
+batch of CVs pays the browser cold start only once.
+"""
+
+import atexit
+import base64
+import json
+import os
+import shutil
+import subprocess
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+
+CHROME_CANDIDATES = [
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+    "google-chrome",
+    "chromium",
+    "google-chrome-stable",
+    "/opt/homebrew/bin/chromium",
+    "/usr/local/bin/google-chrome",
+]
+
+CHROME_FLAGS = [
+    "--headless=new",
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-backgrounding-occluded-windows",
+    "--hide-scrollbars",
+    "--run-all-compositor-stages-before-draw",
+    "--no-first-run",
+    "--no-default-browser-check",
+]
+
+# Match the CLI --print-to-pdf behaviour (no header/footer, CSS page size)
+PRINT_OPTIONS = {
+    "printBackground": True,
+    "preferCSSPageSize": True,
+    "displayHeaderFooter": False,
+}
+
+
+class ChromeSessionError(RuntimeError):
+    """Raised when the DevTools session fails or Chrome exits"""
+
+
+def find_chrome() -> Optional[str]:
+    """Return the first Chrome/Chromium binary available on this machine"""
+    for candidate in CHROME_CANDIDATES:
+        if candidate.startswith("/"):
+            if Path(candidate).exists():
+                return candidate
+        elif shutil.which(candidate):
+            return shutil.which(candidate)
+    return None
+
+
+class ChromeSession:
+    """
+    Long-lived headless Chrome controlled through DevTools over pipes.
+
+    Chrome reads commands from fd 3 and writes replies/events to fd 4, each
+    message being a NUL-terminated JSON object. A reader thread routes replies
+    to waiting callers by message id, so several tabs can print concurrently.
+
+    Usage:
+        with ChromeSession() as chrome:
+            chrome.print_to_pdf(Path("cv.html"), Path("cv.pdf"))
+    """
+
+    def __init__(self, chrome_path: Optional[str] = None, timeout: float = 60):
+        self.chrome_path = chrome_path or find_chrome()
+        self.timeout = timeout
+        self.process: Optional[subprocess.Popen] = None
+
+        self._writer = None
+        self._reader = None
+        self._reader_thread: Optional[threading.Thread] = None
+        self._write_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self._next_id = 0
+        self._pending: Dict[int, Future] = {}
+        self._load_waiters: Dict[str, Future] = {}
+        self._atexit_registered = False
+
+    @property
+    def is_running(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    def start(self) -> None:
+        """Launch Chrome with the DevTools pipe transport"""
+        if self.is_running:
+            return
+        if not self.chrome_path:
+            raise ChromeSessionError("Chrome/Chromium not found")
+        if os.name != "posix":
+            raise ChromeSessionError("DevTools pipe transport requires a POSIX system")
+
+        command_read, command_write = os.pipe()
+        reply_read, reply_write = os.pipe()
+
+        def _map_pipe_fds():
+            # Chrome expects commands on fd 3 and writes replies to fd 4. Duplicate
+            # first so neither pipe end is clobbered if os.pipe() returned 3 or 4.
+            command_fd, reply_fd = os.dup(command_read), os.dup(reply_write)
+            os.dup2(command_fd, 3)
+            os.dup2(reply_fd, 4)
+            os.set_inheritable(3, True)
+            os.set_inheritable(4, True)
+
+        try:
+            self.process = subprocess.Popen(
+                [self.chrome_path, *CHROME_FLAGS, "--remote-debugging-pipe", "about:blank"],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=False,  # fds 3/4 must survive exec; Python's own fds are non-inheritable
+                preexec_fn=_map_pipe_fds,
+            )
+        except BaseException:
+            os.close(command_write)
+            os.close(reply_read)
+            raise
+        finally:
+            os.close(command_read)
+            os.close(reply_write)
+
+        self._writer = os.fdopen(command_write, "wb", buffering=0)
+        self._reader = os.fdopen(reply_read, "rb", buffering=0)
+        self._reader_thread = threading.Thread(target=self._read_loop, daemon=True)
+        self._reader_thread.start()
+        if not self._atexit_registered:
+            atexit.register(self.close)
+            self._atexit_registered = True
+
+        # Fail fast if the binary does not speak the pipe protocol, without
+        # leaving the browser running until exit
+        try:
+            self.send("Browser.getVersion")
+        except BaseException:
+            self.process.kill()  # Unresponsive: no point asking it to close
+            self.close()
+            raise
+
+    def close(self) -> None:
+        """Shut Chrome down and release the pipes"""
+        if self.process is None:
+            return
+        try:
+            if self.is_running:
+                self.send("Browser.close", timeout=5)
+        except ChromeSessionError:
+            pass
+        finally:
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+            for stream in (self._writer, self._reader):
+                try:
+                    stream.close()
+                except (OSError, AttributeError):
+                    pass
+            self.process = None
+            self._fail_pending(ChromeSessionError("Chrome session closed"))
+
+    def __enter__(self) -> "ChromeSession":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _read_loop(self) -> None:
+        """Route replies to pending futures and page-load events to tab waiters"""
+        buffer = b""
+        while True:
+            try:
+                chunk = self._reader.read(65536)
+            except (OSError, ValueError):
+                chunk = b""
+            if not chunk:
+                self._fail_pending(ChromeSessionError("Chrome exited unexpectedly"))
+                return
+
+            buffer += chunk
+            *messages, buffer = buffer.split(b"\0")
+            for raw in messages:
+                message = json.loads(raw)
+                if "id" in message:
+                    with self._state_lock:
+                        future = self._pending.pop(message["id"], None)
+                    if future is None:
+                        continue
+                    if "error" in message:
+                        future.set_exception(ChromeSessionError(message["error"].get("message", "DevTools error")))
+                    else:
+                        future.set_result(message.get("result", {}))
+                elif message.get("method") == "Page.loadEventFired":
+                    with self._state_lock:
+                        waiter = self._load_waiters.pop(message.get("sessionId"), None)
+                    if waiter is not None:
+                        waiter.set_result(True)
+
+    def _fail_pending(self, error: Exception) -> None:
+        with self._state_lock:
+            waiters = list(self._pending.values()) + list(self._load_waiters.values())
+            self._pending.clear()
+            self._load_waiters.clear()
+        for future in waiters:
+            if not future.done():
+                future.set_exception(error)
+
+    def send(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        session_id: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Send a DevTools command and block until its reply arrives"""
+        future: Future = Future()
+        with self._state_lock:
+            self._next_id += 1
+            message_id = self._next_id
+            self._pending[message_id] = future
+
+        message = {"id": message_id, "method": method, "params": params or {}}
+        if session_id:
+            message["sessionId"] = session_id
+
+        try:
+            with self._write_lock:
+                self._writer.write(json.dumps(message).encode("utf-8") + b"\0")
+        except (OSError, ValueError, AttributeError) as e:
+            with self._state_lock:
+                self._pending.pop(message_id, None)
+            raise ChromeSessionError(f"Cannot write to Chrome: {e}")
+
+        try:
+            return future.result(timeout=timeout or self.timeout)
+        except TimeoutError:
+            with self._state_lock:
+                self._pending.pop(message_id, None)
+            raise ChromeSessionError(f"{method} timed out")
+
+    def print_to_pdf(self, html_path: Path, pdf_path: Path) -> None:
+        """Open a tab for one HTML file, wait for load and fonts, and print it"""
+        if not self.is_running:
+            self.start()
+
+        target_id = self.send("Target.createTarget", {"url": "about:blank"})["targetId"]
+        session_id = None
+        try:
+            session_id = self.send(
+                "Target.attachToTarget", {"targetId": target_id, "flatten": True}
+            )["sessionId"]
+            self.send("Page.enable", session_id=session_id)
+
+            loaded: Future = Future()
+            with self._state_lock:
+                self._load_waiters[session_id] = loaded
+            self.send(
+                "Page.navigate",
+                {"url": Path(html_path).absolute().as_uri()},
+                session_id=session_id,
+            )
+            try:
+                loaded.result(timeout=self.timeout)
+            except TimeoutError:
+                raise ChromeSessionError(f"Timed out loading {html_path}")
+
+            # Local @font-face files load asynchronously after the load event
+            self.send(
+                "Runtime.evaluate",
+                {"expression": "document.fonts.ready.then(() => true)", "awaitPromise": True},
+                session_id=session_id,
+            )
+
+            result = self.send("Page.printToPDF", PRINT_OPTIONS, session_id=session_id)
+            pdf_bytes = base64.b64decode(result["data"])
+        finally:
+            with self._state_lock:
+                self._load_waiters.pop(session_id, None)
+            try:
+                self.send("Target.closeTarget", {"targetId": target_id}, timeout=5)
+            except ChromeSessionError:
+                pass
+
+        tmp_path = Path(pdf_path).with_suffix(".pdf.tmp")
+        tmp_path.write_bytes(pdf_bytes)
+        tmp_path.replace(pdf_path)
+
+    def print_many(
+        self, jobs: List[Tuple[Path, Path]], max_tabs: int = 4
+    ) -> List[Optional[Exception]]:
+        """
+        Print several HTML files concurrently, one tab each.
+
+        Args:
+            jobs: (html_path, pdf_path) pairs
+            max_tabs: Maximum number of tabs printing at the same time
+
+        Returns:
+            One entry per job: None on success, the exception otherwise
+        """
+        if not self.is_running:
+            self.start()
+
+        def _print(job: Tuple[Path, Path]) -> Optional[Exception]:
+            try:
+                self.print_to_pdf(*job)
+                return None
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=max(1, max_tabs)) as executor:
+            return list(executor.map(_print, jobs))
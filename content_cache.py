@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Content Cache - Parse each YAML content file once, with an on-disk snapshot
+
+Parsed files are kept per process and validated by (mtime, size), falling back
+to a content hash when the stat changed (e.g. after a checkout that rewrote an
+identical file). A pickled snapshot lets cold CLI starts reuse the parsed
+content without importing PyYAML when nothing changed.
+"""
+
+import atexit
+import hashlib
+import pickle
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+
+SNAPSHOT_VERSION = 1
+
+
+class ContentParseError(ValueError):
+    """Raised when a content file is not valid YAML"""
+
+
+class ContentCache:
+    """
+    Process-wide cache of parsed content files.
+
+    Returned objects are shared between callers and must be treated as
+    read-only.
+    """
+
+    def __init__(self, snapshot_path: Optional[Path] = None):
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._snapshot_loaded = False
+        self._dirty = False
+        self.hits = 0
+        self.parses = 0
+        atexit.register(self.save)
+
+    def _load_snapshot(self) -> None:
+        """Read the pickled snapshot once, ignoring it if unreadable or outdated"""
+        self._snapshot_loaded = True
+        if not self.snapshot_path or not self.snapshot_path.exists():
+            return
+        try:
+            with open(self.snapshot_path, "rb") as f:
+                snapshot = pickle.load(f)
+        except Exception:
+            return
+        if isinstance(snapshot, dict) and snapshot.get("version") == SNAPSHOT_VERSION:
+            for key, entry in snapshot.get("entries", {}).items():
+                self._entries.setdefault(key, entry)
+
+    def load(self, file_path: Path) -> Any:
+        """
+        Return parsed YAML for a file, parsing only if it changed.
+
+        Raises:
+            FileNotFoundError: File does not exist
+            ContentParseError: File is not valid YAML
+        """
+        if not self._snapshot_loaded:
+            self._load_snapshot()
+
+        file_path = Path(file_path)
+        stat = file_path.stat()
+        signature = [stat.st_mtime_ns, stat.st_size]
+        key = str(file_path.absolute())
+
+        entry = self._entries.get(key)
+        if entry and entry["stat"] == signature:
+            self.hits += 1
+            return entry["data"]
+
+        raw = file_path.read_bytes()
+        sha = hashlib.sha256(raw).hexdigest()
+        if entry and entry["sha256"] == sha:
+            # Touched but identical: refresh the stat so the next check is cheap
+            entry["stat"] = signature
+            self._dirty = True
+            self.hits += 1
+            return entry["data"]
+
+        import yaml  # Deferred so warm snapshot starts never import PyYAML
+
+        try:
+            data = yaml.safe_load(raw.decode("utf-8"))
+        except yaml.YAMLError as e:
+            raise ContentParseError(str(e)) from e
+
+        self._entries[key] = {"stat": signature, "sha256": sha, "data": data}
+        self._dirty = True
+        self.parses += 1
+        return data
+
+    def invalidate(self, file_path: Optional[Path] = None) -> None:
+        """Forget one file (or everything) so it is re-parsed on next load"""
+        if file_path is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(str(Path(file_path).absolute()), None)
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the snapshot if any entry changed since it was loaded"""
+        if not self._dirty or not self.snapshot_path:
+            return
+        try:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.snapshot_path.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump(
+                    {"version": SNAPSHOT_VERSION, "entries": self._entries},
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            tmp_path.replace(self.snapshot_path)
+            self._dirty = False
+        except OSError as e:
+            print(f"Warning: could not save content snapshot: {e}")
+
+
+_caches: Dict[str, ContentCache] = {}
+
+
+def get_content_cache(snapshot_path: Optional[Path] = None) -> ContentCache:
+    """Return the shared cache for a snapshot location (one per process)"""
+    key = str(Path(snapshot_path).absolute()) if snapshot_path else ""
+    if key not in _caches:
+        _caches[key] = ContentCache(snapshot_path)
+    return _caches[key]
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Content Index - Precomputed per-version inclusion lists for CV content
+
+Instead of re-checking every item's `versions` list for every version built,
+each content list is scanned once into an inverted index mapping version name
+to the positions of the items it includes (with priority filtering already
+applied). Selecting content for a version is then a dictionary lookup, and
+building many versions costs time proportional to the output, not to
+content size × number of versions.
+"""
+
+from collections import OrderedDict
+from typing import Dict, List, Any, Callable, Tuple
+
+
+# Key for items with no `versions` list or with "all": included everywhere
+UNIVERSAL = "*"
+
+# Indexes kept per ContentIndex; room for every list and version-keyed dict of
+# a few content revisions, so long-running builders (watch mode, the render
+# server) do not keep every revision they have seen alive
+MAX_CACHED_INDEXES = 512
+
+
+def split_version_key(key: str) -> List[str]:
+    """Split a multi-version content key ('ai,ds') into version names"""
+    return [v.strip() for v in str(key).split(",")]
+
+
+def resolve_version_keys(content_dict: Dict[str, Any]) -> Tuple[Dict[str, Any], Any]:
+    """
+    Normalize a version-keyed dict into a flat version → value table.
+
+    Returns:
+        (table, empty_value) where empty_value ([] or "") matches the value type
+        and is returned for versions without content
+    """
+    table: Dict[str, Any] = {}
+    for key, value in content_dict.items():
+        for version in split_version_key(key):
+            # First matching key wins, as in document order
+            table.setdefault(version, value)
+
+    sample_value = next(iter(content_dict.values()), "")
+    return table, [] if isinstance(sample_value, list) else ""
+
+
+class ContentIndex:
+    """
+    Lazily built, cached inclusion indexes over loaded content.
+
+    Indexes are cached per data object. The content cache hands out the same
+    object while a file is unchanged, so an index is built once per content
+    revision. The least recently used indexes are dropped beyond max_cached.
+    Item order always follows the YAML document order.
+    """
+
+    def __init__(self, versions: Dict[str, Dict[str, Any]], max_cached: int = MAX_CACHED_INDEXES):
+        self.versions = versions
+        self.max_cached = max_cached
+        self._indexes: "OrderedDict[Tuple[int, str], Tuple[Any, Any]]" = OrderedDict()
+
+    def _cached(self, data: Any, kind: str, build: Callable[[Any], Any]) -> Any:
+        """Return the index for a data object, building it on first use"""
+        key = (id(data), kind)
+        cached = self._indexes.get(key)
+        # Keep a reference to the data so its id cannot be reused while cached
+        if cached is None or cached[0] is not data:
+            cached = (data, build(data))
+            self._indexes[key] = cached
+            if len(self._indexes) > self.max_cached:
+                self._indexes.popitem(last=False)
+        self._indexes.move_to_end(key)
+        return cached[1]
+
+    def group_by_version(
+        self, items: List[Dict[str, Any]], apply_priority: bool = False
+    ) -> Dict[str, List[int]]:
+        """
+        Build the inverted index for one list of items.
+
+        Args:
+            items: Content items with optional `versions` and `priority` keys
+            apply_priority: Drop items above each version's max_priority
+
+        Returns:
+            Mapping of version name to item positions, plus UNIVERSAL for
+            versions not mentioned anywhere
+        """
+        names = set(self.versions)
+        for item in items:
+            names.update(v for v in item.get("versions", []) if v != "all")
+
+        groups: Dict[str, List[int]] = {name: [] for name in names}
+        groups[UNIVERSAL] = []
+
+        for position, item in enumerate(items):
+            item_versions = item.get("versions", [])
+            if not item_versions or "all" in item_versions:
+                groups[UNIVERSAL].append(position)
+                targets = names
+            else:
+                targets = dict.fromkeys(item_versions)
+
+            priority = item.get("priority", 1)
+            for name in targets:
+                if apply_priority and name in self.versions:
+                    if priority > self.versions[name]["max_priority"]:
+                        continue
+                groups[name].append(position)
+
+        return groups
+
+    @staticmethod
+    def lookup(groups: Dict[str, List[int]], target_version: str) -> List[int]:
+        """Positions included for a version"""
+        return groups.get(target_version, groups[UNIVERSAL])
+
+    def version_value(self, content_dict: Dict[str, Any], target_version: str) -> Any:
+        """O(1) lookup of a version's value in a (possibly multi-version keyed) dict"""
+        table, empty_value = self._cached(content_dict, "version_keys", resolve_version_keys)
+        if target_version in table:
+            return table[target_version]
+        # Fresh empty list per call so callers can't share-mutate it
+        return [] if isinstance(empty_value, list) else empty_value
+
+    def unknown_version_keys(self, content_dict: Any) -> List[str]:
+        """Version names used as keys that are not defined in versions.yaml"""
+        if not isinstance(content_dict, dict):
+            return []
+        unknown = []
+        for key in content_dict:
+            for version in split_version_key(key):
+                if version not in self.versions and version != "all" and version not in unknown:
+                    unknown.append(version)
+        return unknown
+
+    def experiences(
+        self, experience_data: Dict, target_version: str
+    ) -> List[Tuple[Dict, List[Dict]]]:
+        """Experiences for a version, each with its version/priority-filtered achievements"""
+
+        def build(data: Dict) -> Dict[str, Any]:
+            experiences = data.get("experiences", [])
+            return {
+                "experiences": self.group_by_version(experiences),
+                "achievements": [
+                    self.group_by_version(exp.get("achievements", []), apply_priority=True)
+                    for exp in experiences
+                ],
+            }
+
+        index = self._cached(experience_data, "experience", build)
+        experiences = experience_data.get("experiences", [])
+
+        selected = []
+        for position in self.lookup(index["experiences"], target_version):
+            exp = experiences[position]
+            achievements = exp.get("achievements", [])
+            selected.append((
+                exp,
+                [achievements[i] for i in self.lookup(index["achievements"][position], target_version)],
+            ))
+        return selected
+
+    def projects(self, projects_data: Dict, target_version: str) -> List[Dict]:
+        """Projects included for a version"""
+        index = self._cached(
+            projects_data, "projects",
+            lambda data: self.group_by_version(data.get("projects", [])),
+        )
+        projects = projects_data.get("projects", [])
+        return [projects[i] for i in self.lookup(index, target_version)]
+
+    def education_achievements(
+        self, education: Dict, target_version: str
+    ) -> List[str]:
+        """Notable achievements then practical experience of one education entry"""
+
+        def build(data: Dict) -> Dict[str, Any]:
+            return {
+                "notable_achievements": self.group_by_version(data.get("notable_achievements", [])),
+                "practical_experience": self.group_by_version(data.get("practical_experience", [])),
+            }
+
+        index = self._cached(education, "education", build)
+        notable = education.get("notable_achievements", [])
+        practical = education.get("practical_experience", [])
+
+        return (
+            [notable[i]["achievement"] for i in self.lookup(index["notable_achievements"], target_version)]
+            + [practical[i]["experience"] for i in self.lookup(index["practical_experience"], target_version)]
+        )
+
+    def certifications(self, personal_data: Dict, target_version: str) -> List[Dict]:
+        """Certifications included for a version (version and priority filtered)"""
+        index = self._cached(
+            personal_data, "certifications",
+            lambda data: self.group_by_version(data.get("certifications", []), apply_priority=True),
+        )
+        certifications = personal_data.get("certifications", [])
+        return [certifications[i] for i in self.lookup(index, target_version)]
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+CSS Pruner - Drop template rules that match nothing in a version's HTML
+
+Templates carry rules for markup the CV never contains (awesome-cv's
+.about-me__*, srt's resume classes, hover states of elements that do not
+exist), and every PDF backend parses and matches all of them. This stage
+collects the element names, classes and ids of a version's final HTML,
+removes the style rules whose selectors reference anything else, and
+minifies what is left.
+
+Matching is conservative: a selector is kept unless one of its type, class
+or id names is absent from the document. Pseudo-classes, pseudo-elements
+(including the insides of :not()) and attribute selectors are ignored, and
+at-rules other than @media/@supports (@page, @font-face, @import,
+@keyframes, ...) are always kept.
+
+Pruned stylesheets are cached by (template hash, selector set hash), so
+rebuilding a version whose markup did not change reuses the result.
+"""
+
+import hashlib
+import os
+import re
+import threading
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
+
+from asset_store import AssetStore, sha256_file
+
+
+COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+CSS_STRING = re.compile(r""""(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*'""")
+# Escaped identifier characters, e.g. '\/' in .w-1\/2 or '\31 ' (a hex escape)
+ESCAPE = r"\\(?:[0-9a-fA-F]{1,6}\s?|[^0-9a-fA-F\n])"
+CSS_ESCAPE = re.compile(ESCAPE)
+IDENTIFIER = rf"-?(?:[_a-zA-Z]|{ESCAPE})(?:[\w-]|{ESCAPE})*"
+
+# Parts of a compound selector that never name an element, class or id
+# (escaped ':' and '[' belong to class names, as in .md\:flex or .w-\[10px\])
+PSEUDO = re.compile(r"(?<!\\)::?[\w-]+(?:\((?:[^()]|\([^()]*\))*\))?")
+ATTRIBUTE = re.compile(r"(?<!\\)\[[^\]]*\]")
+TYPE_NAME = re.compile(r"(?:^|(?<=[\s>+~(,]))([a-zA-Z][\w-]*)")
+CLASS_NAME = re.compile(rf"(?<!\\)\.({IDENTIFIER})")
+ID_NAME = re.compile(rf"(?<!\\)#({IDENTIFIER})")
+
+# Bumped when pruning changes, so cached results from older rules are not reused
+PRUNE_VERSION = 2
+
+# At-rules holding style rules that are pruned like top-level ones
+CONDITIONAL_AT_RULES = ("@media", "@supports")
+
+# A parsed stylesheet item: a ';'-terminated statement, or (prelude, body)
+Item = Union[str, Tuple[str, str]]
+
+
+class SelectorCollector(HTMLParser):
+    """Element names, classes and ids present in an HTML document"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.tags: Set[str] = set()
+        self.classes: Set[str] = set()
+        self.ids: Set[str] = set()
+
+    def handle_starttag(self, tag, attrs):
+        self.tags.add(tag.lower())
+        for name, value in attrs:
+            if name == "class" and value:
+                self.classes.update(value.split())
+            elif name == "id" and value:
+                self.ids.add(value)
+
+    handle_startendtag = handle_starttag
+
+
+def collect_selectors(html_text: str) -> Dict[str, Set[str]]:
+    """
+    Names a stylesheet's selectors can match in a document.
+
+    Returns:
+        Dict with 'tags', 'classes' and 'ids' sets
+    """
+    collector = SelectorCollector()
+    collector.feed(html_text)
+    collector.close()
+    # Always present once the document is parsed, even if omitted from the markup
+    collector.tags.update({"html", "head", "body"})
+    return {"tags": collector.tags, "classes": collector.classes, "ids": collector.ids}
+
+
+def selector_set_hash(used: Dict[str, Set[str]]) -> str:
+    """Stable hash of a collected selector set"""
+    digest = hashlib.sha256()
+    for kind in ("tags", "classes", "ids"):
+        digest.update(f"{kind}:{' '.join(sorted(used[kind]))}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def split_items(css: str) -> List[Item]:
+    """
+    Split CSS (a stylesheet or a block body) into top-level items.
+
+    Comments are dropped; strings and nested parentheses/braces are respected,
+    so data URIs and nested at-rules survive intact.
+    """
+    items: List[Item] = []
+    start = 0
+    i = 0
+    depth = 0  # Parentheses, e.g. url(data:...;base64,...)
+    length = len(css)
+    pieces: List[str] = []
+
+    while i < length:
+        char = css[i]
+        if char == "/" and css.startswith("/*", i):
+            end = css.find("*/", i + 2)
+            end = length if end == -1 else end + 2
+            pieces.append(css[start:i])
+            start = i = end
+            continue
+        if char in "\"'":
+            match = CSS_STRING.match(css, i)
+            i = match.end() if match else length
+            continue
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth = max(0, depth - 1)
+        elif char == ";" and depth == 0:
+            pieces.append(css[start:i])
+            statement = "".join(pieces).strip()
+            if statement:
+                items.append(statement)
+            pieces, start = [], i + 1
+        elif char == "{" and depth == 0:
+            pieces.append(css[start:i])
+            prelude = "".join(pieces).strip()
+            end = _matching_brace(css, i)
+            items.append((prelude, css[i + 1:end]))
+            pieces, start = [], end + 1
+            i = end
+        i += 1
+
+    pieces.append(css[start:])
+    trailing = "".join(pieces).strip()
+    if trailing and trailing != "}":
+        items.append(trailing)
+    return items
+
+
+def _matching_brace(css: str, open_index: int) -> int:
+    depth = 0
+    i = open_index
+    while i < len(css):
+        char = css[i]
+        if char == "/" and css.startswith("/*", i):
+            end = css.find("*/", i + 2)
+            i = len(css) if end == -1 else end + 2
+            continue
+        if char in "\"'":
+            match = CSS_STRING.match(css, i)
+            i = match.end() if match else len(css)
+            continue
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return i
+        i += 1
+    return len(css)
+
+
+def unescape_identifier(name: str) -> str:
+    """A CSS identifier as written in HTML ('w-1\\/2' -> 'w-1/2', '\\31 0' -> '10')"""
+    def unescape(match: re.Match) -> str:
+        escaped = match.group(0)[1:]
+        if escaped[0] in "0123456789abcdefABCDEF":
+            return chr(int(escaped.strip(), 16))
+        return escaped
+
+    return CSS_ESCAPE.sub(unescape, name)
+
+
+def selector_matches(selector: str, used: Dict[str, Set[str]]) -> bool:
+    """False only if the selector names an element, class or id absent from the document"""
+    selector = PSEUDO.sub("", ATTRIBUTE.sub("", selector))
+    if any(unescape_identifier(name) not in used["classes"] for name in CLASS_NAME.findall(selector)):
+        return False
+    if any(unescape_identifier(name) not in used["ids"] for name in ID_NAME.findall(selector)):
+        return False
+    # Type names are what remains once classes and ids are gone
+    bare = ID_NAME.sub("", CLASS_NAME.sub("", selector))
+    return all(name.lower() in used["tags"] for name in TYPE_NAME.findall(bare))
+
+
+def split_selectors(prelude: str) -> List[str]:
+    """Split a selector list on top-level commas"""
+    selectors, depth, start = [], 0, 0
+    escaped = False
+    for i, char in enumerate(prelude):
+        if escaped:
+            escaped = False
+            continue
+        if char == "\\":
+            escaped = True
+        elif char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == "," and depth == 0:
+            selectors.append(prelude[start:i].strip())
+            start = i + 1
+    selectors.append(prelude[start:].strip())
+    return [selector for selector in selectors if selector]
+
+
+def _collapse(text: str, tight: str) -> str:
+    """Collapse whitespace outside strings and drop it around the `tight` characters"""
+    parts = []
+    last = 0
+    for match in CSS_STRING.finditer(text):
+        parts.append(_collapse_plain(text[last:match.start()], tight))
+        parts.append(match.group(0))
+        last = match.end()
+    parts.append(_collapse_plain(text[last:], tight))
+    return "".join(parts).strip()
+
+
+def _collapse_plain(text: str, tight: str) -> str:
+    text = re.sub(r"\s+", " ", text)
+    if tight:
+        text = re.sub(rf"\s*([{re.escape(tight)}])\s*", r"\1", text)
+    return text
+
+
+def minify_declarations(body: str) -> str:
+    """Minify a declaration block (nested blocks, as in @page, are minified too)"""
+    parts = []
+    for item in split_items(body):
+        if isinstance(item, tuple):
+            prelude, inner = item
+            parts.append(f"{_collapse(prelude, '')}{{{minify_declarations(inner)}}}")
+            continue
+        name, _, value = item.partition(":")
+        if not value:
+            parts.append(_collapse(item, ""))
+            continue
+        value = _collapse(value, ",")
+        value = re.sub(r"\(\s+", "(", re.sub(r"\s+\)", ")", value))
+        parts.append(f"{name.strip()}:{value}")
+    return ";".join(parts)
+
+
+def prune_css(css: str, used: Dict[str, Set[str]]) -> Tuple[str, Dict[str, int]]:
+    """
+    Remove unmatched style rules from a stylesheet and minify it.
+
+    Returns:
+        (minified CSS, {'kept': rules kept, 'removed': rules removed})
+    """
+    counts = {"kept": 0, "removed": 0}
+    return _prune_items(split_items(css), used, counts), counts
+
+
+def _prune_items(items: List[Item], used: Dict[str, Set[str]], counts: Dict[str, int]) -> str:
+    output = []
+    for item in items:
+        if isinstance(item, str):
+            output.append(_collapse(item, "") + ";")  # @import, @charset, ...
+            continue
+
+        prelude, body = item
+        if prelude.startswith("@"):
+            if prelude.lower().startswith(CONDITIONAL_AT_RULES):
+                inner = _prune_items(split_items(body), used, counts)
+                if inner:
+                    output.append(f"{_collapse(prelude, '')}{{{inner}}}")
+            else:
+                output.append(f"{_collapse(prelude, '')}{{{minify_declarations(body)}}}")
+            continue
+
+        selectors = [selector for selector in split_selectors(prelude) if selector_matches(selector, used)]
+        if not selectors:
+            counts["removed"] += 1
+            continue
+        counts["kept"] += 1
+        declarations = minify_declarations(body)
+        if declarations:
+            output.append(f"{','.join(_collapse(selector, '>+~') for selector in selectors)}{{{declarations}}}")
+    return "".join(output)
+
+
+class CSSPruner:
+    """
+    Prunes staged template CSS per version and caches the results.
+
+    Args:
+        cache_dir: Directory holding pruned stylesheets
+        asset_store: Store used to link pruned CSS into outputs
+        hash_file: Hash function for stylesheets (memoized one preferred)
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        asset_store: AssetStore,
+        hash_file: Optional[Callable[[Path], str]] = None,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.asset_store = asset_store
+        self.hash_file = hash_file or sha256_file
+        self.stats: Dict[str, int] = {"cached": 0, "pruned": 0, "original_bytes": 0, "pruned_bytes": 0}
+
+    def prune_file(self, css_path: Path, used: Dict[str, Set[str]]) -> Path:
+        """Return a cached pruned, minified copy of css_path for a selector set"""
+        css_sha = self.hash_file(css_path)
+        cached = self.cache_dir / f"{css_sha[:16]}-{selector_set_hash(used)[:16]}-v{PRUNE_VERSION}.css"
+
+        if cached.exists():
+            self.stats["cached"] += 1
+            return cached
+
+        pruned, _ = prune_css(css_path.read_text(encoding="utf-8"), used)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = cached.with_name(cached.name + f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(pruned, encoding="utf-8")
+        tmp_path.replace(cached)
+        self.stats["pruned"] += 1
+        return cached
+
+    def prune_output(self, html_path: Path, css_path: Path) -> None:
+        """
+        Replace a staged stylesheet with its version pruned to html_path.
+
+        The stylesheet is swapped through the asset store (never rewritten in
+        place: the staged file may be a hardlink into the store).
+        """
+        used = collect_selectors(Path(html_path).read_text(encoding="utf-8"))
+        original_size = css_path.stat().st_size
+        pruned = self.prune_file(css_path, used)
+        self.asset_store.stage(pruned, css_path)
+        self.stats["original_bytes"] += original_size
+        self.stats["pruned_bytes"] += pruned.stat().st_size
+
+    def summary(self) -> str:
+        """One-line size summary, e.g. '1 stylesheet (0 new), 42 KB → 9 KB'"""
+        sheets = self.stats["cached"] + self.stats["pruned"]
+        return (
+            f"{sheets} stylesheet{'s' if sheets != 1 else ''} ({self.stats['pruned']} new), "
+            f"{self.stats['original_bytes'] / 1024:.0f} KB → {self.stats['pruned_bytes'] / 1024:.0f} KB"
+        )
+
+    def reset_stats(self) -> None:
+        for key in self.stats:
+            self.stats[key] = 0
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+CV Document - Typed intermediate representation of one CV version
+
+The builder selects and filters content once into a CVDocument; the markdown
+and semantic-HTML renderers (cv_renderers.py) then serialize the same document
+independently, so HTML no longer has to be recovered from markdown with regexes.
+
+Text fields hold the content exactly as written in the YAML files, including
+inline markdown (**bold**, *italic*, `code`) where the YAML uses it.
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+@dataclass
+class Contact:
+    phone: str
+    email: str
+    github: str
+    linkedin: str
+
+
+@dataclass
+class Header:
+    name: str
+    profile_photo: str
+    tagline: str
+    address: str
+    contact: Contact
+    languages: str
+    executive_summary: str = ""
+
+
+@dataclass
+class SkillCategory:
+    name: str
+    skills: List[str] = field(default_factory=list)
+
+
+@dataclass
+class SkillsSection:
+    """
+    Skills of one version.
+
+    layout is the processed skills layout: 'executive' (category paragraphs),
+    'technical' (legacy three-column table) or 'technical_dynamic'
+    (2-6 column table, paragraphs beyond 6 columns).
+    """
+
+    layout: str
+    categories: List[SkillCategory] = field(default_factory=list)
+    column_count: int = 0
+    notice: str = ""
+
+    @property
+    def form(self) -> str:
+        """How the skills are laid out: 'table', 'paragraphs', 'notice' or 'empty'"""
+        if self.layout == "executive":
+            return "paragraphs"
+        if self.layout == "technical":
+            return "table" if any(category.skills for category in self.categories) else "empty"
+        if not self.categories:
+            return "notice"
+        return "table" if self.column_count <= 6 else "paragraphs"
+
+
+@dataclass
+class Link:
+    kind: str  # 'github', 'demo' or 'website'
+    label: str
+    url: str
+
+
+@dataclass
+class ExperienceEntry:
+    company: str
+    location: str
+    period: str
+    position: str
+    reference: str = ""
+    achievements: List[str] = field(default_factory=list)
+    tags: str = ""  # Comma-separated skill tags
+
+
+@dataclass
+class ProjectEntry:
+    name: str
+    period: str
+    links: List[Link] = field(default_factory=list)
+    descriptions: List[str] = field(default_factory=list)
+    tags: str = ""
+
+
+@dataclass
+class EducationEntry:
+    institution: str
+    location: str
+    period: str  # Empty when start or end date is missing
+    degree: str
+    highlight: str = ""
+
+
+@dataclass
+class CertificationEntry:
+    name: str
+    organization: str = ""
+    year: str = ""
+    description: str = ""
+
+
+@dataclass
+class CVDocument:
+    """One CV version; optional sections are None when the version omits them"""
+
+    version: str
+    header: Header
+    skills: SkillsSection
+    experience: List[ExperienceEntry] = field(default_factory=list)
+    projects: Optional[List[ProjectEntry]] = None
+    education: Optional[List[EducationEntry]] = None
+    certifications: Optional[List[CertificationEntry]] = None
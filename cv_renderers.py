@@ -0,0 +1,520 @@
+#!/usr/bin/env python3
+"""
+CV Renderers - Markdown and semantic HTML backends for CVDocument
+
+Both renderers walk the same document in a single pass. The HTML renderer
+produces exactly what MarkdownEnricher produces from the rendered markdown
+(including its handling of fields it cannot represent), so templates see the
+same structure whichever path built the page; the enricher remains for
+--from-existing builds that only have a markdown file.
+"""
+
+import re
+from typing import List, Optional
+
+from cv_document import (
+    CVDocument,
+    CertificationEntry,
+    Contact,
+    EducationEntry,
+    ExperienceEntry,
+    Header,
+    ProjectEntry,
+    SkillsSection,
+)
+
+
+CONTACT_ICONS = {
+    "phone": ("phone.png", "Phone"),
+    "email": ("email.png", "Email"),
+    "github": ("github.png", "GitHub"),
+    "linkedin": ("linkedin.png", "LinkedIn"),
+}
+
+# Languages line is only recognised in the "Lang (Level) • ..." form
+LANGUAGES_FORM = re.compile(r"^[^*]+\([^)]+\)[^*]*$")
+
+BOLD = re.compile(r"\*\*([^*]+)\*\*")
+ITALIC = re.compile(r"(?<!\*)\*([^*]+)\*(?!\*)")
+CODE = re.compile(r"`([^`]+)`")
+
+
+def format_inline(text: str) -> str:
+    """Convert inline markdown (**bold**, *italic*, `code`) to HTML"""
+    text = BOLD.sub(r"<strong>\1</strong>", text)
+    text = ITALIC.sub(r"<em>\1</em>", text)
+    return CODE.sub(r"<code>\1</code>", text)
+
+
+def _emphasizable(text: str) -> bool:
+    """True if text survives as _text_ in markdown (non-empty, no underscores)"""
+    return bool(text) and "_" not in text
+
+
+def _skill_cell(skill: str) -> str:
+    cell = f"✓ {skill}".strip()
+    return cell.replace("✓", '<span class="cv-skill-bullet">✓</span>')
+
+
+class MarkdownRenderer:
+    """Renders a CVDocument as the clean, human-readable markdown file"""
+
+    def render(self, document: CVDocument) -> str:
+        header = document.header
+        return f"""{self.header(header)}
+{self.executive_summary(header)}
+{self.skills(document.skills)}
+
+{self.experience(document.experience)}
+
+{self.projects(document.projects)}
+
+{self.education(document.education)}
+
+{self.certifications(document.certifications)}
+"""
+
+    def header(self, header: Header) -> str:
+        """Photo, name, tagline, address, contact and languages lines; empty fields are left out"""
+        blocks = []
+        if header.profile_photo:
+            blocks.append(f"![{header.name}]({header.profile_photo})")
+        blocks.append(f"# **{header.name}**\n### {header.tagline}")
+        if header.address:
+            blocks.append(f"_{header.address}_")
+        contact_line = self.contact(header.contact)
+        if contact_line:
+            blocks.append(contact_line)
+        if header.languages:
+            blocks.append(f"**{header.languages}**")
+        return "\n\n".join(blocks)
+
+    def contact(self, contact: Contact) -> str:
+        items = []
+        if contact.phone:
+            items.append(f"📞 {contact.phone}")
+        if contact.email:
+            items.append(f"✉️ [{contact.email}](mailto:{contact.email})")
+        if contact.github:
+            items.append(f"🔗 [GitHub](https://github.com/{contact.github})")
+        if contact.linkedin:
+            items.append(f"💼 [LinkedIn](https://linkedin.com/in/{contact.linkedin})")
+        return " | ".join(items)
+
+    def executive_summary(self, header: Header) -> str:
+        if not header.executive_summary:
+            return ""
+        return f"_{header.executive_summary}_\n\n"
+
+    def skills(self, skills: SkillsSection) -> str:
+        markdown = "## Skills\n\n"
+        form = skills.form
+
+        if form == "paragraphs":
+            for category in skills.categories:
+                markdown += f"**{category.name}**: {' • '.join(category.skills)}\n\n"
+            # The executive layout has always ended without the extra blank line
+            return markdown if skills.layout == "executive" else markdown + "\n"
+
+        if form == "table":
+            headers = [f"**{category.name}**" for category in skills.categories]
+            if skills.layout == "technical":
+                separators = [":" + "-" * (len(header) - 1) for header in headers]
+            else:
+                separators = [":--" for _ in headers]
+            markdown += "| " + " | ".join(headers) + " |\n"
+            markdown += "| " + " | ".join(separators) + " |\n"
+
+            rows = max(len(category.skills) for category in skills.categories)
+            for i in range(rows):
+                cells = [
+                    f"✓ {category.skills[i]}" if i < len(category.skills) else ""
+                    for category in skills.categories
+                ]
+                markdown += "| " + " | ".join(cells) + " |\n"
+        elif form == "notice":
+            markdown += f"*{skills.notice}*\n"
+
+        return markdown + "\n"
+
+    def experience(self, entries: List[ExperienceEntry]) -> str:
+        markdown = "## Work Experience\n\n"
+
+        for exp in entries:
+            markdown += f"### {exp.company}\n"
+            markdown += f"_{exp.location}_<br>\n"
+            markdown += f"_{exp.period}_\n\n"
+
+            position = f"**{exp.position}**"
+            if exp.reference:
+                position += f" · _{exp.reference}_"
+            markdown += f"{position}\n\n"
+
+            if exp.achievements:
+                for achievement in exp.achievements:
+                    markdown += f"* {achievement}\n"
+                markdown += "\n"
+
+            if exp.tags:
+                markdown += f"_{exp.tags}_\n\n"
+
+        return markdown
+
+    def projects(self, entries: Optional[List[ProjectEntry]]) -> str:
+        if not entries:
+            return ""
+
+        markdown = "## Projects\n\n"
+
+        for project in entries:
+            markdown += f"### {project.name}\n"
+            markdown += f"_{project.period}_\n\n"
+
+            if project.links:
+                markdown += " | ".join(f"[{link.label}]({link.url})" for link in project.links) + "\n\n"
+
+            if project.descriptions:
+                for description in project.descriptions:
+                    markdown += f"- {description}\n"
+                markdown += "\n"
+
+            if project.tags:
+                markdown += f"_{project.tags}_\n\n"
+
+        return markdown
+
+    def education(self, entries: Optional[List[EducationEntry]]) -> str:
+        if not entries:
+            return ""
+
+        markdown = "## Education\n\n"
+
+        for education in entries:
+            markdown += f"### {education.institution}\n"
+            markdown += f"_{education.location}_<br>\n"
+            if education.period:
+                markdown += f"_{education.period}_\n\n"
+            markdown += f"**{education.degree}**\n"
+            if education.highlight:
+                markdown += f"{education.highlight}\n"
+            markdown += "\n"
+
+        return markdown
+
+    def certifications(self, entries: Optional[List[CertificationEntry]]) -> str:
+        if not entries:
+            return ""
+
+        markdown = "## Training & Certifications\n\n"
+
+        for cert in entries:
+            markdown += f"### {cert.name}\n"
+
+            org_year_parts = [f"_{part}_" for part in (cert.organization, cert.year) if part]
+            if org_year_parts:
+                markdown += " | ".join(org_year_parts) + "\n\n"
+
+            if cert.description:
+                markdown += f"{cert.description}\n\n"
+
+        return markdown
+
+
+class HTMLRenderer:
+    """Renders a CVDocument as the enriched HTML body (header + main content)"""
+
+    def render(self, document: CVDocument) -> str:
+        sections = [self.skills(document.skills), self.experience(document.experience)]
+        if document.projects:
+            sections.append(self.projects(document.projects))
+        if document.education:
+            sections.append(self.education(document.education))
+        if document.certifications:
+            sections.append(self.certifications(document.certifications))
+
+        header_html = self.header(document.header)
+        main_html = "\n".join(sections).strip()
+        return f'{header_html}\n\n<div class="cv-main-content">\n{main_html}\n</div>'
+
+    def header(self, header: Header) -> str:
+        parts = ['<div class="cv-header">', '  <div class="cv-header-info">']
+
+        if header.name and "*" not in header.name:
+            parts.append(f'    <h1 class="cv-name" id="cv-name"><strong>{header.name}</strong></h1>')
+        if header.tagline:
+            parts.extend([f'    <h3 class="cv-tagline" id="cv-tagline">{header.tagline}</h3>', '    '])
+        if _emphasizable(header.address):
+            parts.extend([f'    <p class="cv-address" id="cv-address"><em>{header.address}</em></p>', '    '])
+
+        contact_html = self.contact(header)
+        if contact_html:
+            parts.extend([
+                '    <div class="cv-contact inline-contact" id="cv-contact">',
+                f'      {contact_html}',
+                '    </div>',
+                '    ',
+            ])
+
+        if LANGUAGES_FORM.match(header.languages):
+            parts.append(f'    <p class="cv-languages" id="cv-languages"><strong>{header.languages}</strong></p>')
+
+        # The summary has always been styled like the address line (same markup
+        # as the enricher gives the _summary_ paragraph), so templates keep their look
+        if _emphasizable(header.executive_summary):
+            parts.extend([f'    <p class="cv-address" id="cv-address"><em>{header.executive_summary}</em></p>', '    '])
+
+        parts.extend(['  </div>', '  '])
+
+        if header.name and header.profile_photo:
+            parts.extend([
+                '  <div class="cv-profile-container">',
+                f'    <img src="{header.profile_photo}" alt="{header.name}" class="cv-profile-pic profile-pic" />',
+                '  </div>',
+            ])
+
+        parts.append('</div>')
+        return '\n'.join(parts)
+
+    def contact(self, header: Header) -> str:
+        contact = header.contact
+        items = [
+            ("phone", contact.phone, contact.phone, None),
+            ("email", contact.email, contact.email, f"mailto:{contact.email}"),
+            ("github", contact.github, "GitHub", f"https://github.com/{contact.github}"),
+            ("linkedin", contact.linkedin, "LinkedIn", f"https://linkedin.com/in/{contact.linkedin}"),
+        ]
+
+        parts = []
+        for kind, value, text, url in items:
+            if not value:
+                continue
+            icon_file, alt_text = CONTACT_ICONS[kind]
+            icon = f'<img src="assets/icons/{icon_file}" class="cv-contact-icon icon" alt="{alt_text}" />'
+            if url:
+                parts.append(f'{icon} <a href="{url}">{text}</a>')
+            else:
+                parts.append(f'{icon} {str(text).strip()}')
+        return ' | '.join(parts)
+
+    def skills(self, skills: SkillsSection) -> str:
+        parts = [
+            '<section class="cv-section cv-skills">',
+            '<h2 class="cv-section-header" id="skills">Skills</h2>',
+            '',
+        ]
+
+        form = skills.form
+        if form == "paragraphs":
+            for category in skills.categories:
+                parts.extend([
+                    '<div class="cv-skill-category cv-executive-skills">',
+                    f'<p class="cv-skill-category-header"><strong>{category.name}</strong>: {" • ".join(category.skills)}</p>',
+                    '</div>',
+                    '',
+                ])
+        elif form == "table":
+            parts.append(self.skills_table(skills))
+
+        parts.extend(['</section>', ''])
+        return '\n'.join(parts)
+
+    def skills_table(self, skills: SkillsSection) -> str:
+        column_count = len(skills.categories)
+        column_width = f"{100 / column_count:.1f}%"
+
+        parts = [
+            '<div class="cv-skills-table-container">',
+            f'<table class="cv-skills-table cv-skills-dynamic" data-columns="{column_count}">',
+            '<thead>',
+            '<tr>',
+        ]
+        for category in skills.categories:
+            name = category.name.replace('**', '')
+            parts.append(f'<th class="cv-skills-header" style="width: {column_width};"><strong>{name}</strong></th>')
+        parts.extend(['</tr>', '</thead>', '<tbody>'])
+
+        rows = max(len(category.skills) for category in skills.categories)
+        for i in range(rows):
+            parts.append('<tr class="cv-skills-row">')
+            for category in skills.categories:
+                if i < len(category.skills):
+                    parts.append(f'<td class="cv-skill-item">{_skill_cell(category.skills[i])}</td>')
+                else:
+                    parts.append('<td class="cv-skill-item"></td>')
+            parts.append('</tr>')
+
+        parts.extend(['</tbody>', '</table>', '</div>', ''])
+        return '\n'.join(parts)
+
+    def experience(self, entries: List[ExperienceEntry]) -> str:
+        parts = [
+            '<section class="cv-section cv-experience">',
+            '<h2 class="cv-section-header" id="work-experience">Work Experience</h2>',
+            '',
+        ]
+
+        for exp in entries:
+            company_id = f"cv-exp-{exp.company.lower().replace(' ', '-')}"
+            has_dates = _emphasizable(exp.location) and _emphasizable(exp.period)
+
+            parts.extend([
+                f'<div class="cv-experience-item" id="{company_id}">',
+                '<div class="cv-entry-header">',
+                f'  <h3 class="cv-company-name">{exp.company}</h3>',
+            ])
+            if has_dates:
+                parts.append(f'  <span class="cv-company-location"><em>{exp.location}</em></span>')
+            parts.extend(['</div>', ''])
+
+            position_ok = (
+                exp.position and "*" not in exp.position
+                and (not exp.reference or "_" not in exp.reference)
+            )
+            if has_dates and position_ok:
+                parts.extend([
+                    '<div class="cv-position-header">',
+                    f'  <p class="cv-position-title"><strong>{exp.position}</strong>',
+                ])
+                if exp.reference:
+                    parts.append(f' <span class="cv-reference">· <em>{exp.reference}</em></span>')
+                parts.extend([
+                    '</p>',
+                    f'  <span class="cv-company-period"><em>{exp.period}</em></span>',
+                    '</div>',
+                    '',
+                ])
+
+            if exp.achievements:
+                parts.append('<ul class="cv-achievements">')
+                for achievement in exp.achievements:
+                    parts.append(f'<li class="cv-achievement">{format_inline(achievement)}</li>')
+                parts.extend(['</ul>', ''])
+
+            if exp.tags:
+                parts.extend([f'<div class="cv-skills-tags skills-tags">{self.tags(exp.tags)}</div>', ''])
+
+            parts.append('</div>')
+
+        parts.extend(['</section>', ''])
+        return '\n'.join(parts)
+
+    def projects(self, entries: List[ProjectEntry]) -> str:
+        parts = [
+            '<section class="cv-section cv-projects">',
+            '<h2 class="cv-section-header" id="projects">Projects</h2>',
+            '',
+        ]
+
+        for project in entries:
+            project_id = (
+                f"cv-project-{project.name.lower().replace(' ', '-').replace('(', '').replace(')', '')}"
+            )
+            parts.extend([
+                f'<div class="cv-project-item" id="{project_id}">',
+                '<div class="cv-entry-header">',
+                f'  <h3 class="cv-project-name">{project.name}</h3>',
+            ])
+            if project.period:
+                parts.append(f'  <span class="cv-project-period"><em>{project.period}</em></span>')
+            parts.extend(['</div>', ''])
+
+            if project.links:
+                links = " | ".join(
+                    f'<a href="{link.url}" class="cv-project-link cv-{link.kind}-link">{link.label}</a>'
+                    for link in project.links
+                )
+                parts.append(f'<p class="cv-project-links">{links}</p>')
+
+            if project.descriptions:
+                parts.append('<ul class="cv-project-descriptions">')
+                for description in project.descriptions:
+                    parts.append(f'<li class="cv-project-description">{format_inline(description.rstrip())}</li>')
+                parts.append('</ul>')
+
+            if project.tags:
+                parts.append(f'<div class="cv-skills-tags skills-tags">{self.tags(project.tags)}</div>')
+
+            parts.extend(['</div>', ''])
+
+        parts.extend(['</section>', ''])
+        return '\n'.join(parts)
+
+    def education(self, entries: List[EducationEntry]) -> str:
+        parts = [
+            '<section class="cv-section cv-education">',
+            '<h2 class="cv-section-header" id="education">Education</h2>',
+            '',
+        ]
+
+        for education in entries:
+            inst_id = f"cv-edu-{education.institution.lower().replace(' ', '-').replace('.', '')[:20]}"
+            parts.extend([
+                f'<div class="cv-education-item" id="{inst_id}">',
+                '<div class="cv-entry-header">',
+                f'  <h3 class="cv-institution-name">{education.institution}</h3>',
+                f'  <span class="cv-education-location"><em>{education.location.replace("_", "")}</em></span>',
+                '</div>',
+                '',
+            ])
+
+            # Degree and highlight are only shown alongside the study period
+            if education.period:
+                parts.extend([
+                    '<div class="cv-position-header">',
+                    f'  <p class="cv-degree-title"><strong>{education.degree.replace("**", "")}</strong></p>',
+                    f'  <span class="cv-education-period"><em>{education.period}</em></span>',
+                    '</div>',
+                    '',
+                ])
+                highlight = education.highlight.strip()
+                if highlight:
+                    parts.extend([f'<div class="cv-education-highlight">{highlight}</div>', ''])
+
+            parts.extend(['</div>', ''])
+
+        parts.extend(['</section>', ''])
+        return '\n'.join(parts)
+
+    def certifications(self, entries: List[CertificationEntry]) -> str:
+        parts = [
+            '<section class="cv-section cv-certifications">',
+            '<h2 class="cv-section-header" id="training-certifications">Training & Certifications</h2>',
+            '',
+        ]
+
+        for cert in entries:
+            cert_id = f"cv-cert-{cert.name.lower().replace(' ', '-').replace('/', '-')[:20]}"
+            parts.extend([
+                f'<div class="cv-certification-item" id="{cert_id}">',
+                '<div class="cv-entry-header">',
+                f'  <h3 class="cv-certification-name">{cert.name}</h3>',
+            ])
+
+            # The first present field takes the organization slot
+            org_year = [part for part in (cert.organization, cert.year) if part]
+            if org_year and all(_emphasizable(part) for part in org_year):
+                parts.append(f'  <span class="cv-certification-org"><em>{org_year[0]}</em></span>')
+                if len(org_year) > 1:
+                    parts.append(f'  <span class="cv-certification-year"><em>{org_year[1]}</em></span>')
+            parts.extend(['</div>', ''])
+
+            description = cert.description.strip()
+            if description:
+                parts.extend([
+                    '<div class="cv-certification-description">',
+                    f'  <p class="cv-certification-desc-text">{format_inline(description)}</p>',
+                    '</div>',
+                    '',
+                ])
+
+            parts.extend(['</div>', ''])
+
+        parts.extend(['</section>', ''])
+        return '\n'.join(parts)
+
+    @staticmethod
+    def tags(tags: str) -> str:
+        """Comma-separated skill tags as one span per tag"""
+        return '\n'.join(
+            f'<span class="cv-skill-tag skill-tag">{tag.strip()}</span>' for tag in tags.split(',')
+        )
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Font Subsetter - Ship only the glyphs a CV actually uses
+
+A CV renders a few hundred distinct characters, but every output directory
+carried the full Roboto and Source Sans 3 files (150-430 KB each) and every
+PDF backend loaded them. This stage scans the final HTML of a version, subsets
+each font referenced by css_fonts.css to that character set, and points the
+@font-face rules at the subsets.
+
+Subsets are cached by (font hash, glyph set hash), so rebuilding a version
+whose text did not change reuses them without touching fontTools.
+
+fontTools is optional: without it the full fonts are staged as before.
+"""
+
+import hashlib
+import html
+import importlib.util
+import os
+import re
+import string
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set
+
+from asset_store import AssetStore, sha256_file
+
+
+FONT_FACE = re.compile(r"@font-face\s*{[^}]*}", re.IGNORECASE)
+FONT_SRC = re.compile(r"(\bsrc\s*:\s*)([^;}]+)", re.IGNORECASE)
+SRC_ENTRY_SPLIT = re.compile(r",\s*(?=(?:local|url)\s*\()", re.IGNORECASE)
+URL = re.compile(r"""url\(\s*['"]?([^'")]+)['"]?\s*\)""", re.IGNORECASE)
+CSS_CONTENT = re.compile(r"""\bcontent\s*:\s*([^;}]+)""", re.IGNORECASE)
+CSS_STRING = re.compile(r""""([^"]*)"|'([^']*)'""")
+NON_RENDERED = re.compile(r"<(style|script|head)\b.*?</\1>", re.IGNORECASE | re.DOTALL)
+TAG = re.compile(r"<[^>]+>")
+
+# Always kept: text-transform, page counters and list markers can render
+# characters that never appear literally in the HTML
+BASELINE_CHARACTERS = string.printable.strip() + " \u00a0•–—…‘’“”·"
+
+
+def fonttools_available() -> bool:
+    """True if fontTools is installed (located without importing it: subset_font imports it when needed)"""
+    return importlib.util.find_spec("fontTools") is not None
+
+
+def collect_characters(html_text: str, stylesheets: Optional[List[Path]] = None) -> str:
+    """
+    Characters a document can render, as a sorted string.
+
+    Args:
+        html_text: Final HTML document
+        stylesheets: CSS files whose `content:` strings are rendered too
+
+    Returns:
+        Sorted unique characters, including upper/lower case variants
+    """
+    text = html.unescape(TAG.sub(" ", NON_RENDERED.sub(" ", html_text)))
+
+    for css_path in stylesheets or []:
+        if Path(css_path).exists():
+            css_text = Path(css_path).read_text(encoding="utf-8")
+            for declaration in CSS_CONTENT.findall(css_text):
+                for double, single in CSS_STRING.findall(declaration):
+                    text += double or single
+
+    characters: Set[str] = set(BASELINE_CHARACTERS)
+    for char in set(text):
+        if char.isprintable() or char == " ":
+            characters.update((char, char.upper(), char.lower()))
+    # Multi-character case mappings (e.g. 'ß'.upper() == 'SS') are split up
+    return "".join(sorted(set("".join(characters))))
+
+
+def font_references(css_text: str, css_dir: Path) -> Dict[str, Path]:
+    """Relative url() targets in @font-face rules that exist on disk"""
+    references = {}
+    for rule in FONT_FACE.findall(css_text):
+        for url in URL.findall(rule):
+            if "://" in url or url.startswith("data:"):
+                continue
+            font_path = css_dir / url
+            if font_path.is_file():
+                references[url] = font_path
+    return references
+
+
+def rewrite_font_urls(css_text: str, replacements: Dict[str, str]) -> str:
+    """
+    Point @font-face sources at subset files.
+
+    Relative URLs found in `replacements` are rewritten. Absolute file:// URLs
+    to a font with the same file name are dropped, since they would load the
+    full font ahead of the subset. local() sources are kept.
+    """
+    replaced_names = {Path(url).name for url in replacements}
+
+    def rewrite_src(match: re.Match) -> str:
+        entries = []
+        for entry in SRC_ENTRY_SPLIT.split(match.group(2).strip()):
+            url_match = URL.search(entry)
+            if url_match:
+                url = url_match.group(1)
+                if url in replacements:
+                    entry = entry.replace(url, replacements[url])
+                elif url.startswith("file://") and Path(url).name in replaced_names:
+                    continue
+            entries.append(entry)
+        return match.group(1) + ",\n         ".join(entries)
+
+    return FONT_FACE.sub(lambda rule: FONT_SRC.sub(rewrite_src, rule.group(0)), css_text)
+
+
+class FontSubsetter:
+    """
+    Subsets fonts per glyph set and stages them into output directories.
+
+    Args:
+        cache_dir: Directory holding cached subsets
+        asset_store: Store used to link subsets and rewritten CSS into outputs
+        hash_file: Hash function for source fonts (memoized one preferred)
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        asset_store: AssetStore,
+        hash_file: Optional[Callable[[Path], str]] = None,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.asset_store = asset_store
+        self.hash_file = hash_file or sha256_file
+        self.stats: Dict[str, int] = {"cached": 0, "subset": 0, "original_bytes": 0, "subset_bytes": 0}
+
+    def subset_font(self, font_path: Path, characters: str) -> Path:
+        """Return a cached subset of font_path covering characters"""
+        font_sha = self.hash_file(font_path)
+        glyph_sha = hashlib.sha256(characters.encode("utf-8")).hexdigest()
+        cached = self.cache_dir / f"{font_sha[:16]}-{glyph_sha[:16]}{font_path.suffix}"
+
+        if cached.exists():
+            self.stats["cached"] += 1
+            return cached
+
+        from fontTools import subset
+
+        options = subset.Options()
+        options.layout_features = ["*"]  # Keep kerning and ligatures
+        options.name_IDs = ["*"]
+        options.notdef_outline = True
+        options.glyph_names = False
+
+        font = subset.load_font(str(font_path), options)
+        subsetter = subset.Subsetter(options)
+        subsetter.populate(text=characters)
+        subsetter.subset(font)
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = cached.with_name(cached.name + f".{os.getpid()}.{threading.get_ident()}.tmp")
+        subset.save_font(font, str(tmp_path), options)
+        font.close()
+        tmp_path.replace(cached)
+        self.stats["subset"] += 1
+        return cached
+
+    def subset_output(
+        self,
+        html_path: Path,
+        fonts_css: Path,
+        stylesheets: Optional[List[Path]] = None,
+    ) -> str:
+        """
+        Subset the fonts of one output directory to its HTML.
+
+        The output's css_fonts.css and fonts/ directory are replaced with the
+        rewritten stylesheet and the subsets only; the source files are read
+        relative to `fonts_css`.
+
+        Args:
+            html_path: Final HTML document of the version
+            fonts_css: Source css_fonts.css
+            stylesheets: Staged CSS whose generated `content:` must render
+
+        Returns:
+            Glyph set hash (first 8 hex digits) used in the subset file names
+        """
+        html_path, fonts_css = Path(html_path), Path(fonts_css)
+        output_dir = html_path.parent
+        characters = collect_characters(html_path.read_text(encoding="utf-8"), stylesheets)
+        glyph_tag = hashlib.sha256(characters.encode("utf-8")).hexdigest()[:8]
+
+        css_text = fonts_css.read_text(encoding="utf-8")
+        replacements = {}
+        wanted = set()
+        for url, font_path in font_references(css_text, fonts_css.parent).items():
+            subset_path = self.subset_font(font_path, characters)
+            relative = Path("fonts") / f"{font_path.stem}-{glyph_tag}{font_path.suffix}"
+            self.asset_store.stage(subset_path, output_dir / relative)
+            replacements[url] = f"./{relative.as_posix()}"
+            wanted.add(output_dir / relative)
+            self.stats["original_bytes"] += font_path.stat().st_size
+            self.stats["subset_bytes"] += subset_path.stat().st_size
+
+        # Never rewrite in place: css_fonts.css may be a hardlink into the store
+        rewritten = rewrite_font_urls(css_text, replacements)
+        stored_css = self.asset_store.put_bytes(rewritten.encode("utf-8"), ".css")
+        self.asset_store.stage_stored(stored_css, output_dir / "css_fonts.css")
+
+        fonts_dir = output_dir / "fonts"
+        if fonts_dir.exists():
+            for stale in [p for p in fonts_dir.rglob("*") if p.is_file()]:
+                if stale not in wanted:
+                    stale.unlink()
+
+        return glyph_tag
+
+    def summary(self) -> str:
+        """One-line size summary, e.g. '12 fonts, 4.1 MB → 310 KB'"""
+        fonts = self.stats["cached"] + self.stats["subset"]
+        return (
+            f"{fonts} fonts ({self.stats['subset']} new), "
+            f"{self.stats['original_bytes'] / 1024:.0f} KB → {self.stats['subset_bytes'] / 1024:.0f} KB"
+        )
+
+    def reset_stats(self) -> None:
+        for key in self.stats:
+            self.stats[key] = 0
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+HTML Inliner - Self-contained single-file HTML output
+
+A built version is a directory: the HTML links css_fonts.css, css_styling.css
+and css_skills.css, which load fonts/ files, and the page shows the profile
+photo and contact icons from assets/. This stage folds all of it into the
+HTML file itself: stylesheets become <style> blocks and every local file they
+or the page reference becomes a data: URI. The result renders without any
+other file (hermetic PDF renders, one blob to cache or ship).
+
+Run it last, after CSS pruning and font subsetting, so only the pruned rules
+and the subset fonts are embedded. Remote URLs (e.g. a template's Google
+Fonts @import) are left as they are.
+"""
+
+import base64
+import mimetypes
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict
+
+from font_subsetter import URL, font_references, rewrite_font_urls
+from weasyprint_renderer import STYLESHEET_LINK
+
+
+IMAGE_SRC = re.compile(r'(<img\b[^>]*\bsrc=")([^"]+)(")')
+
+# Types mimetypes does not know on every platform
+MIME_TYPES = {
+    ".ttf": "font/ttf",
+    ".otf": "font/otf",
+    ".woff": "font/woff",
+    ".woff2": "font/woff2",
+    ".svg": "image/svg+xml",
+}
+
+
+def is_local(url: str) -> bool:
+    """True for URLs naming a file next to the document (not remote, not inline)"""
+    return not (url.startswith(("data:", "#")) or "://" in url)
+
+
+def data_uri(path: Path) -> str:
+    """File contents as a base64 data: URI"""
+    mime = MIME_TYPES.get(path.suffix.lower()) or mimetypes.guess_type(path.name)[0]
+    encoded = base64.b64encode(path.read_bytes()).decode("ascii")
+    return f"data:{mime or 'application/octet-stream'};base64,{encoded}"
+
+
+def inline_css(css_text: str, base_dir: Path) -> str:
+    """
+    Replace a stylesheet's local url() references with data: URIs.
+
+    Fonts go through the font subsetter's @font-face rewriting, which also
+    drops absolute file:// sources duplicating an embedded font.
+    """
+    fonts = {url: data_uri(path) for url, path in font_references(css_text, base_dir).items()}
+    css_text = rewrite_font_urls(css_text, fonts)
+
+    def embed(match: re.Match) -> str:
+        url = match.group(1)
+        path = base_dir / url
+        if not is_local(url) or not path.is_file():
+            return match.group(0)
+        return f'url("{data_uri(path)}")'
+
+    return URL.sub(embed, css_text)
+
+
+def inline_html(html_text: str, base_dir: Path) -> str:
+    """
+    Fold a document's local stylesheets and images into the HTML.
+
+    Args:
+        html_text: HTML document
+        base_dir: Directory its relative URLs resolve against
+
+    Returns:
+        The self-contained document. Remote or missing stylesheets keep
+        their <link>
+    """
+    data_uris: Dict[str, str] = {}
+
+    def embed_stylesheet(match: re.Match) -> str:
+        href = match.group(1) or match.group(2)
+        css_path = base_dir / href
+        if not is_local(href) or not css_path.is_file():
+            return match.group(0)
+        css_text = inline_css(css_path.read_text(encoding="utf-8"), css_path.parent)
+        return f"<style>\n{css_text.strip()}\n</style>"
+
+    def embed_image(match: re.Match) -> str:
+        src = match.group(2)
+        path = base_dir / src
+        if not is_local(src) or not path.is_file():
+            return match.group(0)
+        if src not in data_uris:  # Icons repeat; encode each file once
+            data_uris[src] = data_uri(path)
+        return f"{match.group(1)}{data_uris[src]}{match.group(3)}"
+
+    html_text = STYLESHEET_LINK.sub(embed_stylesheet, html_text)
+    return IMAGE_SRC.sub(embed_image, html_text)
+
+
+def write_single_file(html_path: Path) -> int:
+    """
+    Inline an HTML output in place (atomically).
+
+    Returns:
+        Size of the self-contained file in bytes
+    """
+    html_path = Path(html_path)
+    inlined = inline_html(html_path.read_text(encoding="utf-8"), html_path.parent)
+    tmp_path = html_path.with_name(f".{html_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_text(inlined, encoding="utf-8")
+    tmp_path.replace(html_path)
+    return len(inlined.encode("utf-8"))
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+HTML Writer - Standalone HTML document skeleton for enriched CV bodies
+
+Replaces the `pandoc -f html -t html --standalone` round-trip: the enriched
+body is already final HTML, so it only needs a head with meta tags, a title and
+the stylesheet links.
+"""
+
+from html import escape
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Union
+
+from skills_stylesheet import SKILLS_STYLESHEET
+
+
+# Same base rules pandoc's default HTML template injects, kept so templates
+# that were tuned against pandoc output render identically
+BASE_STYLE = """    code{white-space: pre-wrap;}
+    span.smallcaps{font-variant: small-caps;}
+    div.columns{display: flex; gap: min(4vw, 1.5em);}
+    div.column{flex: auto; overflow-x: auto;}
+    div.hanging-indent{margin-left: 1.5em; text-indent: -1.5em;}
+    ul.task-list[class]{list-style: none;}
+    ul.task-list li input[type="checkbox"] {
+      font-size: inherit;
+      width: 0.8em;
+      margin: 0 0.8em 0.2em -1.6em;
+      vertical-align: middle;
+    }
+    .display.math{display: block; text-align: center; margin: 0.5rem auto;}"""
+
+# Stylesheets linked by every CV page: local fonts first, main styling second,
+# generated skills layout rules last (they used to follow it inline in the body)
+DEFAULT_STYLESHEETS = ["./css_fonts.css", "./css_styling.css", f"./{SKILLS_STYLESHEET}"]
+
+
+def strip_chunks(chunks: Iterable[str]) -> Iterator[str]:
+    """Chunks of a stream without the stream's leading and trailing whitespace"""
+    started = False
+    pending = ""  # Whitespace held back until more content follows it
+    for chunk in chunks:
+        if not started:
+            chunk = chunk.lstrip()
+            if not chunk:
+                continue
+            started = True
+        content = chunk.rstrip()
+        if content:
+            yield pending + content
+            pending = chunk[len(content):]
+        else:
+            pending += chunk
+
+
+def iter_standalone_html(
+    body_chunks: Iterable[str],
+    title: str,
+    stylesheets: Optional[List[str]] = None,
+    lang: str = "en",
+) -> Iterator[str]:
+    """
+    Wrap a streamed HTML body in a complete standalone document.
+
+    Args:
+        body_chunks: Enriched HTML fragments (e.g. MarkdownEnricher.iter_enriched_html)
+        title: Document title
+        stylesheets: Stylesheet hrefs in cascade order
+        lang: Document language
+
+    Yields:
+        The document head, the body chunks and the closing tags
+    """
+    if stylesheets is None:
+        stylesheets = DEFAULT_STYLESHEETS
+
+    links = "\n".join(
+        f'  <link rel="stylesheet" href="{escape(href)}" />' for href in stylesheets
+    )
+
+    yield f"""<!DOCTYPE html>
+<html xmlns="http://www.w3.org/1999/xhtml" lang="{lang}" xml:lang="{lang}">
+<head>
+  <meta charset="utf-8" />
+  <meta name="viewport" content="width=device-width, initial-scale=1.0, user-scalable=yes" />
+  <title>{escape(title)}</title>
+  <style>
+{BASE_STYLE}
+  </style>
+{links}
+</head>
+<body>
+"""
+    yield from strip_chunks(body_chunks)
+    yield """
+</body>
+</html>
+"""
+
+
+def render_standalone_html(
+    body_html: str,
+    title: str,
+    stylesheets: Optional[List[str]] = None,
+    lang: str = "en",
+) -> str:
+    """
+    Wrap an HTML body fragment in a complete standalone document.
+
+    Args:
+        body_html: Enriched HTML fragment (output of MarkdownEnricher)
+        title: Document title
+        stylesheets: Stylesheet hrefs in cascade order
+        lang: Document language
+
+    Returns:
+        Complete HTML document as a string
+    """
+    return "".join(iter_standalone_html([body_html], title, stylesheets, lang))
+
+
+def write_standalone_html(
+    html_path: Path,
+    body: Union[str, Iterable[str]],
+    title: str,
+    stylesheets: Optional[List[str]] = None,
+) -> None:
+    """
+    Write a standalone HTML document atomically.
+
+    body is either the whole fragment or an iterable of chunks, which are
+    written as they are produced.
+    """
+    html_path = Path(html_path)
+    body_chunks = [body] if isinstance(body, str) else body
+    tmp_path = html_path.with_suffix(".html.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for chunk in iter_standalone_html(body_chunks, title, stylesheets):
+            f.write(chunk)
+    tmp_path.replace(html_path)
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Profiler - Nested build-stage spans exported as a trace-event timeline
+
+Spans are recorded as complete ('X') events of the Trace Event Format, so the
+JSON file opens directly in chrome://tracing, Perfetto (ui.perfetto.dev) or
+speedscope. Self time (a span's duration minus its direct children) is
+aggregated per span name for the console summary.
+
+A disabled profiler costs one attribute check per span, so stages are
+instrumented unconditionally.
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+
+class Profiler:
+    """
+    Records nested spans per process and thread.
+
+    Timestamps come from the monotonic perf counter, which is system-wide on
+    Linux, macOS and Windows, so spans recorded in build worker processes line
+    up with the parent's once merged.
+
+    Args:
+        enabled: Record spans (a disabled profiler records nothing)
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.events: List[Dict[str, Any]] = []
+        self._local = threading.local()
+
+    @contextmanager
+    def span(self, name: str, category: str = "build", **args: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Time a block as a span nested under the currently open one.
+
+        Yields the span's args dict, so results known only at the end (e.g.
+        whether a backend succeeded) can be attached.
+        """
+        if not self.enabled:
+            yield args
+            return
+
+        stack = self._stack()
+        frame = {"children": 0}
+        stack.append(frame)
+        start = time.perf_counter_ns()
+        try:
+            yield args
+        finally:
+            duration = time.perf_counter_ns() - start
+            stack.pop()
+            if stack:
+                stack[-1]["children"] += duration
+            self.events.append({
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": start / 1000,
+                "dur": duration / 1000,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": {key: str(value) for key, value in args.items()},
+                "self": (duration - frame["children"]) / 1000,
+            })
+
+    def _stack(self) -> List[Dict[str, int]]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def drain(self) -> List[Dict[str, Any]]:
+        """Return and forget the recorded events (e.g. to send them to the parent)"""
+        events, self.events = self.events, []
+        return events
+
+    def merge(self, events: List[Dict[str, Any]]) -> None:
+        """Add events recorded by another process"""
+        if self.enabled:
+            self.events.extend(events)
+
+    def summary(self, top: int = 10) -> List[Dict[str, Any]]:
+        """
+        Span names ranked by total self time.
+
+        Returns:
+            Dicts with 'name', 'count', 'self_ms' and 'total_ms'. Total time
+            double-counts spans nested under a span of the same name
+        """
+        stages: Dict[str, Dict[str, Any]] = {}
+        for event in self.events:
+            stage = stages.setdefault(
+                event["name"], {"name": event["name"], "count": 0, "self_ms": 0.0, "total_ms": 0.0}
+            )
+            stage["count"] += 1
+            stage["self_ms"] += event["self"] / 1000
+            stage["total_ms"] += event["dur"] / 1000
+        return sorted(stages.values(), key=lambda stage: stage["self_ms"], reverse=True)[:top]
+
+    def print_summary(self, top: int = 10) -> None:
+        total_self = sum(event["self"] for event in self.events) / 1000
+        print(f"\n⏱️  Top {top} stages by self time")
+        print(f"{'stage':<28} {'calls':>6} {'self ms':>10} {'total ms':>10} {'self %':>7}")
+        for stage in self.summary(top):
+            share = stage["self_ms"] / total_self * 100 if total_self else 0.0
+            print(
+                f"{stage['name']:<28} {stage['count']:>6} {stage['self_ms']:>10.1f} "
+                f"{stage['total_ms']:>10.1f} {share:>6.1f}%"
+            )
+
+    def write_trace(self, path: Path) -> None:
+        """Write the trace-event JSON file (timestamps relative to the first span)"""
+        origin = min((event["ts"] for event in self.events), default=0)
+        events = []
+        for event in sorted(self.events, key=lambda event: event["ts"]):
+            event = {key: value for key, value in event.items() if key != "self"}
+            event["ts"] -= origin
+            events.append(event)
+
+        # Name the rows: the main process and each build worker
+        main_pid = os.getpid()
+        for pid in sorted({event["pid"] for event in events}):
+            events.append({
+                "name": "process_name", "ph": "M", "pid": pid, "tid": 0,
+                "args": {"name": "build" if pid == main_pid else f"worker {pid}"},
+            })
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        tmp_path.replace(path)
+
+
+# Shared no-op profiler for builders created without one
+DISABLED = Profiler(enabled=False)
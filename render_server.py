@@ -0,0 +1,469 @@
+#!/usr/bin/env python3
+"""
+Render Server - Local HTTP service that renders CVs on demand
+
+A render through the command line pays for a Python start, YAML parsing,
+template discovery and a browser launch every time. This server keeps all of
+that warm: each worker thread owns one long-lived CVBuilder (its Chrome
+session or WeasyPrint fonts stay loaded), templates are discovered once, and
+the markdown enricher, font-subset cache and asset store are shared.
+
+Requests wait in a bounded queue; when it is full the server answers 503 with
+Retry-After instead of piling up work. Each response carries its latency
+(queue wait and render time) in Server-Timing and X-Render-* headers, and
+GET /metrics reports counters and latency percentiles per format.
+
+Endpoints:
+
+    POST /render    Body (JSON or YAML):
+                        version:  CV version to render (required)
+                        format:   'pdf', 'html' or 'markdown' (default: html)
+                        template: CSS template (default: francois)
+                        person:   Name used for content/output files
+                        content:  {versions: ..., personal: ..., skills: ...,
+                                   experience: ..., projects: ..., education: ...}
+                                  each holding what the matching YAML file
+                                  holds; omit to render the server's own
+                                  content directory
+    GET /metrics    Counters and latency percentiles (JSON)
+    GET /health     Liveness and queue depth (JSON)
+
+Person and version names (including the keys of content.versions) name
+output files, so they are limited to letters, digits, '_' and '-'.
+Request content is rendered from what the request holds only: fields it
+leaves out stay empty, and no file of the server's content directory (such
+as a profile photo) is used.
+
+HTML responses are single-file documents (stylesheets, fonts and images
+inlined), so they render anywhere without the server's output directory.
+
+Usage:
+    python render_server.py --port 8787 --workers 2 --queue 16
+    curl -s localhost:8787/render -d '{"version": "ai", "format": "pdf"}' -o cv.pdf
+"""
+
+import argparse
+import io
+import itertools
+import json
+import queue
+import re
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import yaml
+
+from benchmark_pipeline import percentile
+from build_system import CONTENT_SECTIONS, CVBuilder
+
+
+FORMATS = {
+    "pdf": ("application/pdf", ".pdf"),
+    "html": ("text/html; charset=utf-8", ".html"),
+    "markdown": ("text/markdown; charset=utf-8", ".md"),
+}
+
+# Largest accepted request body
+MAX_BODY_BYTES = 8 * 1024 * 1024
+
+# Requests kept for the latency percentiles in /metrics
+METRICS_WINDOW = 1000
+
+# Person and version names become output file and directory names
+SAFE_NAME = re.compile(r"^[A-Za-z0-9_-]+$")
+
+
+class RenderError(Exception):
+    """A request that cannot be rendered; carries the HTTP status to answer with"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class ThreadLocalStdout(io.TextIOBase):
+    """
+    sys.stdout replacement that sends each thread's output to its own buffer.
+
+    Builders print progress while rendering; with several worker threads
+    contextlib.redirect_stdout (a process-wide swap) would interleave and
+    lose their logs. Threads without a buffer write to the real stdout.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+
+    def capture(self) -> io.StringIO:
+        """Start capturing the calling thread's output"""
+        self._local.buffer = io.StringIO()
+        return self._local.buffer
+
+    def release(self) -> None:
+        self._local.buffer = None
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self._local, "buffer", None)
+        return (buffer or self.stream).write(text)
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+
+class RenderJob:
+    """One queued render request and, once done, its result"""
+
+    def __init__(self, request_id: int, params: Dict[str, Any]):
+        self.request_id = request_id
+        self.params = params
+        self.enqueued = time.perf_counter()
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.body = b""
+        self.error: Optional[RenderError] = None
+        self.log = ""
+        self.cancelled = False
+        self.done = threading.Event()
+
+
+class RenderService:
+    """
+    Worker threads rendering queued requests with warm builders.
+
+    Args:
+        content_dir: Content rendered when a request brings none
+        work_dir: Scratch output root (one subdirectory per worker)
+        workers: Concurrent renders
+        queue_size: Requests allowed to wait before new ones are rejected
+        cache_dir: Shared cache directory (font subsets, backend probes)
+        warm: Start each worker's PDF renderer before serving
+    """
+
+    def __init__(
+        self,
+        content_dir: str = "content",
+        work_dir: str = "output/.render-server",
+        workers: int = 2,
+        queue_size: int = 16,
+        cache_dir: str = ".cv-cache",
+        warm: bool = True,
+    ):
+        self.content_dir = content_dir
+        self.work_dir = Path(work_dir)
+        self.cache_dir = cache_dir
+        self.jobs: "queue.Queue[RenderJob]" = queue.Queue(maxsize=queue_size)
+        self.templates = CVBuilder.discover_templates()
+        self.stdout = ThreadLocalStdout(sys.stdout)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, Deque[Tuple[float, float]]] = {
+            name: deque(maxlen=METRICS_WINDOW) for name in FORMATS
+        }
+        self._counters = {"requests": 0, "succeeded": 0, "failed": 0, "rejected": 0, "timed_out": 0}
+        self._started = time.time()
+
+        sys.stdout = self.stdout
+        self.builders = [self._create_builder(index, warm) for index in range(workers)]
+        self.threads = []
+        for builder in self.builders:
+            thread = threading.Thread(
+                target=self._work, args=(builder,), name=f"render-worker-{len(self.threads)}", daemon=True
+            )
+            thread.start()
+            self.threads.append(thread)
+
+    def _create_builder(self, index: int, warm: bool) -> CVBuilder:
+        buffer = self.stdout.capture()
+        try:
+            builder = CVBuilder(
+                self.content_dir,
+                str(self.work_dir / f"worker-{index}"),
+                force=True,  # Request content differs each time; never trust the manifest
+                cache_dir=self.cache_dir,
+                asset_dir=str(self.work_dir / ".assets"),
+                templates=self.templates,
+                single_file=True,  # Responses must not depend on files next to them
+            )
+            builder.build_cache.autosave = False
+            if warm:
+                builder.warm_renderers()
+        finally:
+            self.stdout.release()
+        if buffer.getvalue().strip():
+            self.stdout.stream.write(buffer.getvalue())
+        return builder
+
+    def close(self) -> None:
+        sys.stdout = self.stdout.stream
+        for builder in self.builders:
+            builder.close()
+
+    # Request handling (HTTP threads)
+
+    def submit(self, params: Dict[str, Any], timeout: float) -> RenderJob:
+        """
+        Queue a render and wait for it.
+
+        Raises:
+            RenderError: 503 when the queue is full, 504 on timeout
+        """
+        job = RenderJob(next(self._ids), params)
+        with self._lock:
+            self._counters["requests"] += 1
+        try:
+            self.jobs.put_nowait(job)
+        except queue.Full:
+            with self._lock:
+                self._counters["rejected"] += 1
+            raise RenderError(503, "Render queue is full, retry shortly")
+
+        if not job.done.wait(timeout):
+            job.cancelled = True  # Dropped by the worker if not started yet
+            with self._lock:
+                self._counters["timed_out"] += 1
+            raise RenderError(504, f"Render did not finish within {timeout:.0f}s")
+        return job
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            latency = {}
+            for name, samples in self._latencies.items():
+                if not samples:
+                    continue
+                queue_ms = [sample[0] for sample in samples]
+                render_ms = [sample[1] for sample in samples]
+                latency[name] = {
+                    "count": len(samples),
+                    "queue_ms": {f"p{q}": round(percentile(queue_ms, q), 2) for q in (50, 90, 99)},
+                    "render_ms": {f"p{q}": round(percentile(render_ms, q), 2) for q in (50, 90, 99)},
+                }
+            return {
+                "uptime_s": round(time.time() - self._started, 1),
+                "workers": len(self.threads),
+                "queue_depth": self.jobs.qsize(),
+                "queue_size": self.jobs.maxsize,
+                **self._counters,
+                "latency": latency,
+            }
+
+    # Rendering (worker threads)
+
+    def _work(self, builder: CVBuilder) -> None:
+        while True:
+            job = self.jobs.get()
+            if job.cancelled:
+                continue
+            job.started = time.perf_counter()
+            buffer = self.stdout.capture()
+            try:
+                job.body = self.render(builder, job.params)
+            except RenderError as e:
+                job.error = e
+            except Exception as e:
+                traceback.print_exc()
+                job.error = RenderError(500, f"Render failed: {e}")
+            finally:
+                self.stdout.release()
+                job.log = buffer.getvalue()
+                job.finished = time.perf_counter()
+                self._record(job)
+                job.done.set()
+
+    def _record(self, job: RenderJob) -> None:
+        with self._lock:
+            self._counters["failed" if job.error else "succeeded"] += 1
+            if not job.error:
+                self._latencies[job.params["format"]].append(
+                    ((job.started - job.enqueued) * 1000, (job.finished - job.started) * 1000)
+                )
+
+    def render(self, builder: CVBuilder, params: Dict[str, Any]) -> bytes:
+        """Render one request with a worker's builder and return the output bytes"""
+        person = params.get("person")
+        content = params.get("content")
+        if content is None:
+            builder.use_content({}, person)
+        else:
+            builder.use_content(self._snapshot(content, person or "cv"), person or "cv", local=False)
+
+        version, output_format, template = params["version"], params["format"], params["template"]
+        if version not in builder.versions:
+            raise RenderError(400, f"Unknown version '{version}' (available: {', '.join(builder.versions)})")
+        if template not in builder.available_templates:
+            raise RenderError(400, f"Unknown template '{template}'")
+
+        if output_format == "markdown":
+            return builder.render_markdown(version).encode("utf-8")
+
+        output_path = builder.output_path(version, FORMATS[output_format][1])
+        if builder.output_dir.resolve() not in output_path.resolve().parents:
+            raise RenderError(400, f"Version '{version}' resolves outside the output directory")
+        output_path.unlink(missing_ok=True)  # Never answer with a previous request's file
+        if output_format == "html":
+            builder.build_html(version, template)
+        else:
+            builder.build_all_formats(version, template)
+
+        if not output_path.exists():
+            raise RenderError(503, "No PDF backend could render this document")
+        return output_path.read_bytes()
+
+    @staticmethod
+    def _snapshot(content: Dict[str, Any], person: str) -> Dict[str, Any]:
+        """Request content as the builder's parsed-file snapshot"""
+        if not isinstance(content, dict) or not isinstance(content.get("versions"), dict):
+            raise RenderError(400, "content must be a mapping with a 'versions' mapping")
+        versions = content["versions"]
+        version_file = versions if "versions" in versions else {"versions": versions}
+        if not isinstance(version_file["versions"], dict):
+            raise RenderError(400, "content.versions must be a mapping")
+        for name in version_file["versions"]:
+            _check_name("content.versions key", name)
+        snapshot = {"versions.yaml": version_file}
+        for section in CONTENT_SECTIONS:
+            # Missing sections are empty, never read from the server's content dir
+            snapshot[f"{person}-{section}.yaml"] = content.get(section) or {}
+        return snapshot
+
+
+def _check_name(field: str, value: Any) -> None:
+    """Reject names that could leave the output directory once used in a path"""
+    if not isinstance(value, str) or not SAFE_NAME.match(value):
+        raise RenderError(400, f"{field} must match {SAFE_NAME.pattern}, got {value!r}")
+
+
+def parse_request(body: bytes) -> Dict[str, Any]:
+    """
+    Validated render parameters from a JSON or YAML request body.
+
+    Raises:
+        RenderError: 400 for malformed bodies or parameters
+    """
+    try:
+        params = yaml.safe_load(body.decode("utf-8")) if body.strip() else {}
+    except (UnicodeDecodeError, yaml.YAMLError) as e:
+        raise RenderError(400, f"Body is not valid JSON/YAML: {e}")
+    if not isinstance(params, dict):
+        raise RenderError(400, "Body must be a mapping")
+
+    params.setdefault("format", "html")
+    params.setdefault("template", "francois")
+    if not params.get("version"):
+        raise RenderError(400, "'version' is required")
+    _check_name("'version'", params["version"])
+    if params.get("person") is not None:
+        _check_name("'person'", params["person"])
+    if params["format"] not in FORMATS:
+        raise RenderError(400, f"'format' must be one of {', '.join(FORMATS)}")
+    return params
+
+
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    """HTTP front end; the service and timeout are attached to the server"""
+
+    server_version = "CVRenderServer/1.0"
+
+    def do_GET(self) -> None:
+        service: RenderService = self.server.service
+        if self.path == "/metrics":
+            self._send_json(200, service.metrics())
+        elif self.path == "/health":
+            self._send_json(200, {"status": "ok", "queue_depth": service.jobs.qsize()})
+        else:
+            self._send_json(404, {"error": f"Unknown path {self.path}"})
+
+    def do_POST(self) -> None:
+        if self.path != "/render":
+            self._send_json(404, {"error": f"Unknown path {self.path}"})
+            return
+
+        received = time.perf_counter()
+        job = None
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            if length > MAX_BODY_BYTES:
+                raise RenderError(413, f"Body larger than {MAX_BODY_BYTES} bytes")
+            params = parse_request(self.rfile.read(length))
+            job = self.server.service.submit(params, self.server.timeout_s)
+            if job.error:
+                raise job.error
+        except RenderError as e:
+            headers = {"Retry-After": "1"} if e.status == 503 else {}
+            log = job.log[-4000:] if job is not None else ""
+            self._send_json(e.status, {"error": str(e), "log": log}, headers)
+            return
+
+        queue_ms = (job.started - job.enqueued) * 1000
+        render_ms = (job.finished - job.started) * 1000
+        total_ms = (time.perf_counter() - received) * 1000
+        content_type, suffix = FORMATS[params["format"]]
+        self._send(200, job.body, content_type, {
+            "X-Request-Id": str(job.request_id),
+            "X-Render-Queue-Ms": f"{queue_ms:.1f}",
+            "X-Render-Time-Ms": f"{render_ms:.1f}",
+            "Server-Timing": f"queue;dur={queue_ms:.1f}, render;dur={render_ms:.1f}, total;dur={total_ms:.1f}",
+            "Content-Disposition": f'inline; filename="{params.get("person") or "cv"}-{params["version"]}{suffix}"',
+        })
+
+    def _send_json(self, status: int, data: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> None:
+        self._send(status, json.dumps(data, indent=2).encode("utf-8"), "application/json", headers or {})
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: Dict[str, str]) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # Bypass the per-thread capture: access logs always go to the console
+        self.server.service.stdout.stream.write(f"{self.address_string()} {format % args}\n")
+
+
+def create_server(
+    service: RenderService, host: str = "127.0.0.1", port: int = 8787, timeout_s: float = 120.0
+) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer((host, port), RenderRequestHandler)
+    server.daemon_threads = True
+    server.service = service
+    server.timeout_s = timeout_s
+    return server
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Serve CV renders over local HTTP")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8787, help="Port (default: 8787)")
+    parser.add_argument("--workers", type=int, default=2, help="Concurrent renders (default: 2)")
+    parser.add_argument("--queue", type=int, default=16, help="Requests allowed to wait (default: 16)")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Seconds a request may take (default: 120)")
+    parser.add_argument("--content-dir", default="content", help="Content rendered when a request brings none")
+    parser.add_argument("--work-dir", default="output/.render-server", help="Scratch output directory")
+    parser.add_argument("--no-warm", action="store_true", help="Start PDF renderers on first use")
+    args = parser.parse_args(argv)
+
+    print(f"🔥 Starting {args.workers} render workers...")
+    service = RenderService(
+        args.content_dir, args.work_dir, args.workers, args.queue, warm=not args.no_warm
+    )
+    server = create_server(service, args.host, args.port, args.timeout)
+    print(f"🌐 Serving on http://{args.host}:{args.port} (POST /render, GET /metrics)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Stopping")
+    finally:
+        server.server_close()
+        service.close()
+
+
+if __name__ == "__main__":
+    main()
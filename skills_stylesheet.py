@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Skills Stylesheet - Generated CSS for the dynamic skills layouts
+
+The skills section is a fixed-layout table for 2-6 categories and a list of
+category blocks beyond that; column widths and font sizes depend on the
+column count. These rules used to be emitted as a <style> block inside every
+document body. They now live in one generated stylesheet, linked from the
+head like the template CSS, with each column count's rules scoped by the
+table's data-columns attribute.
+
+Every version and person therefore links byte-identical CSS: the asset store
+keeps a single copy, browsers and WeasyPrint parse it once per render rather
+than once per body, and document bodies carry content only.
+"""
+
+from functools import lru_cache
+from typing import List
+
+
+# File name of the generated stylesheet in each output directory
+SKILLS_STYLESHEET = "css_skills.css"
+
+# Column counts rendered as a table; more categories use the list layout
+TABLE_COLUMNS = range(2, 7)
+
+# (print table, print item, screen table, screen item) font sizes per column
+# count; 2-3 columns keep the template's screen sizes
+FONT_SIZES = {
+    2: ("10pt", "9pt", None, None),
+    3: ("10pt", "9pt", None, None),
+    4: ("9pt", "8pt", "0.85rem", "0.8rem"),
+    5: ("8pt", "7pt", "0.8rem", "0.75rem"),
+    6: ("8pt", "7pt", "0.8rem", "0.75rem"),
+}
+
+TABLE_CSS = """/* Dynamic skills table (2-6 columns) */
+.cv-skills-dynamic {
+    table-layout: fixed;
+    width: 100%;
+    border-collapse: collapse;
+}
+
+.cv-skills-dynamic th,
+.cv-skills-dynamic td {
+    overflow-wrap: break-word;
+    vertical-align: top;
+    padding: 0.3rem 0.5rem;
+}
+
+.cv-skills-dynamic th {
+    background-color: var(--color-accent, #e53e3e);
+    color: white;
+    font-weight: bold;
+    text-align: center;
+}
+
+.cv-skill-bullet {
+    color: var(--color-accent, #e53e3e);
+    font-weight: bold;
+    margin-right: 0.3rem;
+}
+"""
+
+# Scoped to the list container: the other layouts share these class names and
+# keep the template's styling for them
+LIST_CSS = """/* List layout (7+ columns) */
+.cv-skills-list-container {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
+    gap: 1rem;
+    margin: 1rem 0;
+}
+
+.cv-skills-list-container .cv-skill-category {
+    margin-bottom: 1rem;
+}
+
+.cv-skills-list-container .cv-skill-category-header {
+    font-size: 1rem;
+    font-weight: bold;
+    color: var(--color-accent, #e53e3e);
+    margin-bottom: 0.5rem;
+    border-bottom: 1px solid var(--color-accent, #e53e3e);
+    padding-bottom: 0.2rem;
+}
+
+.cv-skills-list-container .cv-skill-items {
+    display: flex;
+    flex-wrap: wrap;
+    gap: 0.3rem;
+}
+
+.cv-skills-list-container .cv-skill-tag {
+    background-color: var(--color-light-gray, #f5f5f5);
+    color: var(--color-text, #2d3748);
+    padding: 0.2rem 0.5rem;
+    border-radius: 3px;
+    font-size: 0.8rem;
+    border: 1px solid var(--color-border, #e2e8f0);
+}
+
+@media print {
+    .cv-skills-list-container .cv-skill-tag {
+        background-color: transparent;
+        border: 1px solid #ccc;
+    }
+}
+"""
+
+
+def column_css(column_count: int) -> str:
+    """Width and font-size rules of a table with column_count columns"""
+    table = f'.cv-skills-dynamic[data-columns="{column_count}"]'
+    print_table, print_item, screen_table, screen_item = FONT_SIZES[column_count]
+    rules: List[str] = [
+        f"/* {column_count} columns */",
+        f"{table} th,\n{table} td {{\n    width: {100 / column_count:.2f}%;\n}}",
+        f"@media print {{\n    {table} {{\n        font-size: {print_table};\n    }}\n"
+        f"    {table} .cv-skill-item {{\n        font-size: {print_item};\n    }}\n}}",
+    ]
+    if screen_table:
+        rules.append(
+            f"@media screen {{\n    {table} {{\n        font-size: {screen_table};\n    }}\n"
+            f"    {table} .cv-skill-item {{\n        font-size: {screen_item};\n    }}\n}}"
+        )
+    return "\n\n".join(rules) + "\n"
+
+
+@lru_cache(maxsize=None)
+def skills_css() -> str:
+    """The generated stylesheet (built once per process)"""
+    return "\n".join([TABLE_CSS, *(column_css(count) for count in TABLE_COLUMNS), LIST_CSS])
@@ -8,9 +8,47 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from build_system import CVBuilder
+from build_system import CONTENT_SECTIONS, CVBuilder, detect_person
+from build_cache import BuildCache
+from asset_store import AssetStore
+from content_index import ContentIndex
+from content_cache import ContentCache
+from backend_registry import BackendRegistry
+from backend_stats import BackendStats, get_backend_stats
+from watch import ChangeWatcher
+from profiler import Profiler
+from cv_renderers import HTMLRenderer, MarkdownRenderer
+from markdown_enricher import MarkdownEnricher, classify_line
+from benchmark_enricher import generate_cv_markdown, time_enrichment
+from benchmark_pipeline import (
+    STAGES, ContentScale, PipelineBenchmark, StubPdfBuilder, compare, generate_content, percentile,
+)
+import batch_build
+from batch_build import build_batch, resolve_people
+from render_server import RenderService, create_server
+from html_writer import render_standalone_html, write_standalone_html
+from skills_stylesheet import LIST_CSS, SKILLS_STYLESHEET, skills_css
+from font_subsetter import collect_characters, rewrite_font_urls
+from css_pruner import collect_selectors, prune_css
+from html_inliner import inline_html
+from weasyprint_renderer import WeasyPrintRenderer
+from chrome_renderer import ChromeSession, ChromeSessionError
+import asyncio
+import contextlib
+import io
+import json
+import re
+import threading
+import shutil
+import subprocess
+import time
+import urllib.error
+import urllib.request
 import yaml
+import tempfile
 from pathlib import Path
+from typing import List
+from unittest import mock
 
 
 class CVSystemTester:
@@ -310,6 +348,76 @@ class CVSystemTester:
             "Should return True for empty versions list"
         )
     
+    def test_content_index(self):
+        """Test precomputed per-version inclusion index"""
+        print("\n=== Testing Content Index ===")
+        
+        items = [
+            {'text': 'Firmware only', 'versions': ['firmware'], 'priority': 1},
+            {'text': 'Everyone', 'versions': ['all'], 'priority': 1},
+            {'text': 'No versions list', 'priority': 3},
+            {'text': 'Custom version', 'versions': ['custom'], 'priority': 1},
+        ]
+        groups = self.builder.content_index.group_by_version(items, apply_priority=True)
+        
+        firmware = [items[i]['text'] for i in self.builder.content_index.lookup(groups, 'firmware')]
+        self.log_test(
+            "Index keeps document order",
+            firmware == ['Firmware only', 'Everyone', 'No versions list'],
+            f"Firmware items: {firmware}"
+        )
+        
+        executive = [items[i]['text'] for i in self.builder.content_index.lookup(groups, 'executive')]
+        self.log_test(
+            "Index applies version max_priority",
+            executive == ['Everyone'],
+            f"Executive items: {executive}"
+        )
+        
+        custom = [items[i]['text'] for i in self.builder.content_index.lookup(groups, 'custom')]
+        unknown = [items[i]['text'] for i in self.builder.content_index.lookup(groups, 'unknown')]
+        self.log_test(
+            "Index handles versions outside versions.yaml",
+            custom == ['Everyone', 'No versions list', 'Custom version']
+            and unknown == ['Everyone', 'No versions list'],
+            f"Custom: {custom}, Unknown: {unknown}"
+        )
+        
+        index = ContentIndex(self.builder.versions, max_cached=2)
+        revisions = [{"ai": f"Summary {n}"} for n in range(5)]
+        values = [index.version_value(revision, "ai") for revision in revisions]
+        self.log_test(
+            "Index cache bounded, least recently used revisions dropped",
+            values == [f"Summary {n}" for n in range(5)] and len(index._indexes) == 2
+            and all(cached[0] is not revisions[0] for cached in index._indexes.values())
+        )
+    
+    def test_version_keys(self):
+        """Test multi-version key resolution and validation"""
+        print("\n=== Testing Version Keys ===")
+        
+        tags = {'ai,ds': 'Python, PyTorch', 'firmware': 'C, RTOS', 'ds': 'Ignored duplicate'}
+        self.log_test(
+            "Multi-version key lookup",
+            self.builder._get_content_for_version(tags, 'ds') == 'Python, PyTorch',
+            "First key naming the version should win"
+        )
+        
+        descriptions = {'firmware': ['Firmware description']}
+        self.log_test(
+            "Missing version returns typed empty value",
+            self.builder._get_content_for_version(descriptions, 'ai') == []
+            and self.builder._get_content_for_version(tags, 'general') == '',
+            "Lists should yield [] and strings ''"
+        )
+        
+        unknown = self.builder.content_index.unknown_version_keys({'ai, fimware': 'x', 'all': 'y'})
+        self.log_test(
+            "Unknown version key detected",
+            unknown == ['fimware'],
+            f"Unknown: {unknown}"
+        )
+    
     def test_markdown_generation(self):
         """Test markdown generation for different sections"""
         print("\n=== Testing Markdown Generation ===")
@@ -356,6 +464,1101 @@ class CVSystemTester:
             "Generated markdown should contain section header and company"
         )
     
+    def test_build_cache(self):
+        """Test incremental build manifest freshness checks"""
+        print("\n=== Testing Build Cache ===")
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            source = tmp_path / "source.yaml"
+            output = tmp_path / "output.md"
+            source.write_text("name: test\n", encoding="utf-8")
+            output.write_text("# test\n", encoding="utf-8")
+            
+            cache = BuildCache(tmp_path / "manifest.json")
+            fingerprint = cache.fingerprint([source], {"version": "ai"})
+            cache.record("ai", "markdown", fingerprint, [output])
+            
+            # A fresh cache instance must see the persisted manifest
+            cache = BuildCache(tmp_path / "manifest.json")
+            self.log_test(
+                "Unchanged inputs are fresh",
+                cache.is_fresh("ai", "markdown", cache.fingerprint([source], {"version": "ai"})),
+                "Stage should be skipped when nothing changed"
+            )
+            
+            self.log_test(
+                "Different parameters are stale",
+                not cache.is_fresh("ai", "markdown", cache.fingerprint([source], {"version": "ds"})),
+                "Stage should rebuild when extra inputs change"
+            )
+            
+            source.write_text("name: changed content\n", encoding="utf-8")
+            self.log_test(
+                "Changed input file is stale",
+                not cache.is_fresh("ai", "markdown", cache.fingerprint([source], {"version": "ai"})),
+                "Stage should rebuild when an input file changes"
+            )
+            
+            fingerprint = cache.fingerprint([source], {"version": "ai"})
+            cache.record("ai", "markdown", fingerprint, [output])
+            output.unlink()
+            self.log_test(
+                "Missing output is stale",
+                not cache.is_fresh("ai", "markdown", fingerprint),
+                "Stage should rebuild when its output was deleted"
+            )
+            
+            forced = BuildCache(tmp_path / "manifest.json", force=True)
+            self.log_test(
+                "Force disables skipping",
+                not forced.is_fresh("ai", "markdown", fingerprint),
+                "--force should rebuild every stage"
+            )
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            builder = StubPdfBuilder(output_dir=tmp, cache_dir=str(Path(tmp) / "cache"), subset_fonts=False)
+            builder.build_all_formats("ai")
+            # A new photo staged under an unchanged HTML file must still reach the PDF
+            photo = Path(tmp) / "ai" / "assets" / "profile.jpeg"
+            photo.unlink()  # Staged files may be links into the asset store
+            photo.write_bytes(b"new photo")
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                builder._process_pdf_generation("ai")
+                builder._process_pdf_generation("ai")
+            self.log_test(
+                "PDF rebuilt when a staged image changes",
+                output.getvalue().count("PDF up to date") == 1,
+                f"Output: {output.getvalue()!r}"
+            )
+    
+    def test_content_cache(self):
+        """Test parsed content cache invalidation and on-disk snapshot"""
+        print("\n=== Testing Content Cache ===")
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            content_file = tmp_path / "versions.yaml"
+            content_file.write_text("versions:\n  ai: {}\n", encoding="utf-8")
+            
+            cache = ContentCache(tmp_path / "content.pickle")
+            first = cache.load(content_file)
+            second = cache.load(content_file)
+            self.log_test(
+                "Content parsed once per process",
+                first is second and cache.parses == 1,
+                f"Parses: {cache.parses}"
+            )
+            
+            content_file.write_text("versions:\n  ai: {}\n  ds: {}\n", encoding="utf-8")
+            changed = cache.load(content_file)
+            self.log_test(
+                "Changed content is re-parsed",
+                'ds' in changed['versions'] and cache.parses == 2,
+                f"Loaded: {changed}"
+            )
+            
+            cache.save()
+            cold_cache = ContentCache(tmp_path / "content.pickle")
+            restored = cold_cache.load(content_file)
+            self.log_test(
+                "Snapshot reused on cold start",
+                restored == changed and cold_cache.parses == 0,
+                f"Parses after snapshot load: {cold_cache.parses}"
+            )
+    
+    def test_font_subsetting(self):
+        """Test glyph collection and @font-face rewriting for font subsets"""
+        print("\n=== Testing Font Subsetting ===")
+        
+        characters = collect_characters(
+            '<html><head><title>Ω</title><style>p{}</style></head>'
+            '<body><h2>Expérience</h2><p>R&amp;D → ML</p></body></html>'
+        )
+        self.log_test(
+            "Rendered text and case variants collected",
+            all(c in characters for c in "éÉ→&") and "Ω" not in characters,
+            f"Non-ASCII characters: {[c for c in characters if ord(c) > 127]}"
+        )
+        
+        css = (
+            "@font-face {\n    font-family: 'Roboto';\n"
+            "    src: local('Roboto-Regular'),\n"
+            "         url('file:///Users/me/fonts/Roboto-Regular.ttf') format('truetype'),\n"
+            "         url('./fonts/Roboto-Regular.ttf') format('truetype');\n}"
+        )
+        rewritten = rewrite_font_urls(css, {'./fonts/Roboto-Regular.ttf': './fonts/Roboto-Regular-abc.ttf'})
+        self.log_test(
+            "Font URLs point at subsets",
+            "./fonts/Roboto-Regular-abc.ttf" in rewritten
+            and "file://" not in rewritten
+            and "local('Roboto-Regular')" in rewritten,
+            f"Rewritten: {rewritten}"
+        )
+        
+        # Builders check for fontTools on start-up; only subsetting may pay for importing it
+        probe = subprocess.run(
+            [sys.executable, "-c", "import sys; from font_subsetter import fonttools_available; "
+             "fonttools_available(); print('fontTools' in sys.modules)"],
+            capture_output=True, text=True, cwd=Path(__file__).parent
+        )
+        self.log_test(
+            "fontTools located without importing it",
+            probe.stdout.strip() == "False",
+            f"Output: {probe.stdout!r} {probe.stderr!r}"
+        )
+    
+    def test_backend_registry(self):
+        """Test lazy, disk-cached backend probing"""
+        print("\n=== Testing Backend Registry ===")
+        
+        calls = []
+        
+        def probe_fake():
+            calls.append('fake')
+            return {'available': True, 'path': None, 'version': '1.0', 'capabilities': ['pdf']}
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_path = Path(tmp) / "backends.json"
+            registry = BackendRegistry(cache_path, probes={'fake': probe_fake, 'unused': probe_fake})
+            registry.get('fake')
+            registry.get('fake')
+            self.log_test(
+                "Backend probed lazily and once",
+                calls == ['fake'] and registry.available('fake'),
+                f"Probe calls: {calls}"
+            )
+            
+            warm = BackendRegistry(cache_path, probes={'fake': probe_fake})
+            entry = warm.get('fake')
+            self.log_test(
+                "Probe result reused from disk",
+                entry['cached'] and entry['version'] == '1.0' and len(calls) == 1,
+                f"Probe calls: {len(calls)}"
+            )
+            
+            old_path = os.environ.get('PATH', '')
+            os.environ['PATH'] = old_path + os.pathsep + tmp
+            try:
+                BackendRegistry(cache_path, probes={'fake': probe_fake}).get('fake')
+            finally:
+                os.environ['PATH'] = old_path
+            self.log_test(
+                "PATH change triggers re-probe",
+                len(calls) == 2,
+                f"Probe calls: {len(calls)}"
+            )
+    
+    def test_watch_planning(self):
+        """Test change detection and affected-stage planning for --watch"""
+        print("\n=== Testing Watch Planning ===")
+        
+        content_dir = self.builder.content_dir
+        plans = {
+            'content': self.builder.plan_rebuild([content_dir / "arthur-experience.yaml"], 'francois'),
+            'template': self.builder.plan_rebuild([Path("templates/francois/style.css")], 'francois'),
+            'other_template': self.builder.plan_rebuild([Path("templates/srt/resume.css")], 'francois'),
+            'fonts': self.builder.plan_rebuild([Path("fonts/Roboto-Bold.ttf")], 'francois'),
+        }
+        self.log_test(
+            "Changed files mapped to earliest stage",
+            plans == {'content': 'markdown', 'template': 'html', 'other_template': None, 'fonts': 'html'},
+            f"Plans: {plans}"
+        )
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            watched = Path(tmp) / "a.yaml"
+            watched.write_text("a: 1\n", encoding="utf-8")
+            watcher = ChangeWatcher([Path(tmp)], interval=0.01, debounce=0.05)
+            watched.write_text("a: 12\n", encoding="utf-8")
+            (Path(tmp) / ".a.yaml.swp").write_text("swap", encoding="utf-8")
+            changed = watcher.wait_for_changes(timeout=2)
+            self.log_test(
+                "Debounced change detected, editor files ignored",
+                changed == {watched},
+                f"Changed: {changed}"
+            )
+    
+    def test_document_renderers(self):
+        """Test that both renderers of the document model agree with the legacy paths"""
+        print("\n=== Testing Document Renderers ===")
+        
+        for version in ['ai', 'executive']:
+            document = self.builder.build_document(version)
+            markdown = MarkdownRenderer().render(document)
+            self.log_test(
+                f"Markdown rendered from document ({version})",
+                markdown == self.builder.render_markdown(version) and markdown.startswith("![")
+            )
+            self.log_test(
+                f"Direct HTML matches enriched markdown ({version})",
+                HTMLRenderer().render(document) == MarkdownEnricher().enrich_markdown(markdown)
+            )
+    
+    def test_enricher_tokenizer(self):
+        """Test line classification and linear scaling of the enricher"""
+        print("\n=== Testing Enricher Tokenizer ===")
+        
+        kinds = [classify_line(line).kind for line in
+                 ["## Skills", "### Company", "  ", "* Shipped", "**Lead**", "- Built", "_Tags_", "| a |", "Text"]]
+        self.log_test(
+            "Lines classified by prefix",
+            kinds == ['section', 'heading', 'blank', 'bullet', 'bold', 'dash', 'italic', 'table', 'text'],
+            f"Kinds: {kinds}"
+        )
+        
+        # Headerless documents used to be wrapped in quadratic time
+        small = generate_cv_markdown(1000, header=False)
+        large = generate_cv_markdown(10000, header=False)
+        ratio = time_enrichment(large, 2) / time_enrichment(small, 2)
+        self.log_test(
+            "Enrichment scales linearly (10x lines)",
+            ratio < 25,
+            f"Time ratio: {ratio:.1f}x"
+        )
+    
+    def test_streaming_enrichment(self):
+        """Test that streamed HTML chunks match the whole-string output"""
+        print("\n=== Testing Streaming Enrichment ===")
+        
+        enricher = MarkdownEnricher()
+        for header in (True, False):
+            markdown = generate_cv_markdown(1000, header=header)
+            chunks = list(enricher.iter_enriched_html(markdown))
+            self.log_test(
+                f"Streamed chunks join to enriched HTML ({'full' if header else 'headerless'})",
+                ''.join(chunks) == enricher.enrich_markdown(markdown) and len(chunks) > 1,
+                f"Chunks: {len(chunks)}"
+            )
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            html_path = Path(tmp) / "cv.html"
+            write_standalone_html(html_path, enricher.iter_enriched_html(markdown), "Streamed")
+            expected = render_standalone_html(enricher.enrich_markdown(markdown), "Streamed")
+            self.log_test(
+                "Streamed file matches rendered document",
+                html_path.read_text(encoding="utf-8") == expected
+            )
+    
+    def test_pipeline_benchmark(self):
+        """Test the stage benchmark on small synthetic content"""
+        print("\n=== Testing Pipeline Benchmark ===")
+        
+        self.log_test(
+            "Percentiles interpolate between samples",
+            percentile([1, 2, 3, 4], 50) == 2.5 and percentile([5], 99) == 5
+        )
+        
+        scale = ContentScale(experiences=3, achievements=3, versions=4, skills=5,
+                             projects=2, education=1, certifications=2)
+        with tempfile.TemporaryDirectory() as tmp:
+            benchmark = PipelineBenchmark(Path(tmp), scale)
+            results = benchmark.run(repeat=2, warmup=0)
+            outputs = [benchmark.builder.output_path(version, ".pdf") for version in benchmark.version_names]
+            self.log_test(
+                "Every stage timed and traced",
+                list(results) == STAGES
+                and all(stage["p50"] > 0 and stage["peak_kb"] > 0 for stage in results.values()),
+                f"Stages: {list(results)}"
+            )
+            self.log_test(
+                "Synthetic content built through the stub PDF stage",
+                all(path.exists() for path in outputs)
+            )
+        
+        slower = {name: dict(stage, p50=stage["p50"] * 2 + 1) for name, stage in results.items()}
+        regressions = compare(slower, results, threshold=1.25)
+        self.log_test(
+            "Regressions against a baseline reported",
+            len(regressions) == len(STAGES) and not compare(results, results, threshold=1.25),
+            f"Regressions: {len(regressions)}"
+        )
+    
+    def test_profiler(self):
+        """Test nested stage spans, self time and the trace-event export"""
+        print("\n=== Testing Profiler ===")
+        
+        profiler = Profiler()
+        with profiler.span("outer"):
+            with profiler.span("inner", version="ai") as span:
+                span["success"] = True
+        outer, = [event for event in profiler.events if event["name"] == "outer"]
+        inner, = [event for event in profiler.events if event["name"] == "inner"]
+        self.log_test(
+            "Self time excludes nested spans",
+            abs(outer["self"] - (outer["dur"] - inner["dur"])) < 1e-6
+            and inner["args"] == {"version": "ai", "success": "True"},
+            f"Outer: {outer['dur']:.1f}µs, self {outer['self']:.1f}µs"
+        )
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            profiler = Profiler()
+            builder = CVBuilder(output_dir=tmp, cache_dir=str(Path(tmp) / "cache"), profiler=profiler)
+            builder.build_target("ai", mode="markdown")
+            names = {stage["name"] for stage in profiler.summary(top=50)}
+            self.log_test(
+                "Build stages recorded per target",
+                {"ai:francois", "markdown_stage", "build_document", "yaml_load"} <= names,
+                f"Stages: {sorted(names)}"
+            )
+            
+            trace_path = Path(tmp) / "trace.json"
+            profiler.write_trace(trace_path)
+            with open(trace_path, encoding="utf-8") as f:
+                events = json.load(f)["traceEvents"]
+            spans = [event for event in events if event["ph"] == "X"]
+            self.log_test(
+                "Trace-event file written",
+                len(spans) == len(profiler.events) and min(event["ts"] for event in spans) == 0
+                and any(event["ph"] == "M" for event in events)
+            )
+    
+    def test_batch_build(self):
+        """Test building several people's CVs from their own content directories"""
+        print("\n=== Testing Batch Build ===")
+        
+        self.log_test(
+            "Person detected from the personal content file",
+            detect_person(Path("content")) == "arthur" and self.builder.content_file("skills") == "arthur-skills.yaml"
+        )
+        
+        scale = ContentScale(experiences=2, achievements=2, versions=2, skills=3,
+                             projects=1, education=1, certifications=1)
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            for directory, person in [("jane", "jane"), ("bob", "bob"), ("bob-again", "bob")]:
+                generate_content(tmp_path / "people" / directory, scale, person=person)
+            
+            people = resolve_people([str(tmp_path / "people" / "*"), {"content_dir": str(tmp_path / "missing")}])
+            self.log_test(
+                "Globs expanded, duplicate people renamed",
+                sorted(person["name"] for person in people) == ["bob", "bob-2", "jane"],
+                f"People: {[person['name'] for person in people]}"
+            )
+            
+            results = build_batch(people, tmp_path / "out", cache_dir=str(tmp_path / "cache"))
+            expected = [tmp_path / "out" / "jane" / "v1" / "jane-v1.md", tmp_path / "out" / "bob-2" / "v0" / "bob-v0.md"]
+            self.log_test(
+                "Every person built into their own output tree",
+                all(result["success"] and len(result["versions"]) == 2 for result in results)
+                and all(path.exists() for path in expected),
+                f"Results: {[(result['name'], result['error']) for result in results]}"
+            )
+            
+            # One warm builder per worker, switched from person to person
+            # Bob gives only his name; Jane keeps a photo beside her content
+            bob_personal = tmp_path / "people" / "bob" / "bob-personal.yaml"
+            bob_personal.write_text(yaml.safe_dump({"personal": {"name": {"full": "Bob BUILDER"}}}))
+            shutil.copy("assets/icons/phone.png", tmp_path / "people" / "jane" / "jane-profile.png")
+            batch_build._init_batch_worker(str(tmp_path / "warm"), str(tmp_path / "cache"), False, False)
+            try:
+                jane, bob = [person for person in people if person["name"] in ("jane", "bob")]
+                first = batch_build._build_person(jane, "html", "francois", False)
+                builder = batch_build._WORKER_SHARED["builder"]
+                second = batch_build._build_person(bob, "html", "francois", False)
+                reused = batch_build._WORKER_SHARED["builder"] is builder
+            finally:
+                batch_build._close_worker_builder()
+            outputs = [tmp_path / "warm" / "jane" / "v0" / "jane-v0.html", tmp_path / "warm" / "bob" / "v0" / "bob-v0.html",
+                       tmp_path / "warm" / "jane" / ".build-manifest.json", tmp_path / "warm" / "bob" / ".build-manifest.json"]
+            self.log_test(
+                "Worker builder reused across people, outputs and manifests kept apart",
+                first["success"] and second["success"] and reused and all(path.exists() for path in outputs)
+                and "Bob BUILDER" in outputs[1].read_text(encoding="utf-8")
+                and "Bob BUILDER" not in outputs[0].read_text(encoding="utf-8"),
+                f"Errors: {first['error']}, {second['error']}"
+            )
+            
+            jane_html, bob_html = outputs[0].read_text(encoding="utf-8"), outputs[1].read_text(encoding="utf-8")
+            bob_markdown = (tmp_path / "warm" / "bob" / "v0" / "bob-v0.md").read_text(encoding="utf-8")
+            self.log_test(
+                "Missing personal fields left out, never filled with the default person's",
+                not any(text in bob_html + bob_markdown for text in ("apassuello", "79 176", "Valency", "profile.jpeg"))
+                and 'id="cv-contact"' not in bob_html and "cv-profile-pic" not in bob_html
+                and not (tmp_path / "warm" / "bob" / "v0" / "assets" / "profile.jpeg").exists()
+                and 'src="assets/profile.png"' in jane_html
+                and (tmp_path / "warm" / "jane" / "v0" / "assets" / "profile.png").exists()
+            )
+    
+    def test_render_server(self):
+        """Test rendering over HTTP with warm worker builders"""
+        print("\n=== Testing Render Server ===")
+        
+        scale = ContentScale(experiences=2, achievements=2, versions=2, skills=3,
+                             projects=1, education=1, certifications=1)
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            generate_content(tmp_path / "content", scale, person="jane")
+            content = {"versions": yaml.safe_load((tmp_path / "content" / "versions.yaml").read_text())}
+            for section in CONTENT_SECTIONS:
+                content[section] = yaml.safe_load((tmp_path / "content" / f"jane-{section}.yaml").read_text())
+            
+            service = RenderService("content", str(tmp_path / "work"), workers=1, queue_size=2,
+                                    cache_dir=str(tmp_path / "cache"), warm=False)
+            server = create_server(service, port=0, timeout_s=60)
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            url = f"http://127.0.0.1:{server.server_address[1]}"
+            
+            def post(params):
+                request = urllib.request.Request(f"{url}/render", data=json.dumps(params).encode("utf-8"))
+                try:
+                    with urllib.request.urlopen(request, timeout=60) as response:
+                        return response.status, response.headers, response.read()
+                except urllib.error.HTTPError as e:
+                    return e.code, e.headers, e.read()
+            
+            try:
+                status, headers, body = post({"version": "v1", "format": "html", "person": "jane", "content": content})
+                self.log_test(
+                    "HTML rendered from request content",
+                    status == 200 and b"<html" in body and "render;dur=" in headers["Server-Timing"]
+                    and b'rel="stylesheet"' not in body,
+                    f"Status: {status}"
+                )
+                
+                status, _, body = post({"version": "ai", "format": "markdown"})
+                self.log_test(
+                    "Server content rendered when the request brings none",
+                    status == 200 and body.decode("utf-8") == self.builder.render_markdown("ai"),
+                    f"Status: {status}"
+                )
+                
+                status, _, body = post({"version": "nope", "format": "markdown"})
+                self.log_test("Unknown version rejected", status == 400, f"Status: {status}")
+                
+                with urllib.request.urlopen(f"{url}/metrics", timeout=10) as response:
+                    metrics = json.loads(response.read())
+                self.log_test(
+                    "Metrics count requests and latencies",
+                    metrics["succeeded"] == 2 and metrics["failed"] == 1
+                    and metrics["latency"]["html"]["count"] == 1,
+                    f"Metrics: {metrics}"
+                )
+                
+                v1 = content["versions"]["versions"]["v1"]
+                escape = dict(content, versions={"v1": v1, "../../escaped": v1})
+                statuses = [
+                    post({"version": "v1", "format": "html", "person": "../../x", "content": content})[0],
+                    post({"version": "../../escaped", "format": "html"})[0],
+                    post({"version": "v1", "format": "html", "person": "jane", "content": escape})[0],
+                ]
+                self.log_test(
+                    "Person and version names that leave the output directory rejected",
+                    statuses == [400, 400, 400] and not list(tmp_path.glob("**/*escaped*")),
+                    f"Statuses: {statuses}"
+                )
+                
+                # Only a name: nothing of the server's own person or photo may fill the gaps
+                minimal = {"versions": content["versions"], "personal": {"personal": {"name": {"full": "Jane Doe"}}}}
+                photo = {"versions": content["versions"],
+                         "personal": {"personal": {"name": {"full": "Jane Doe"}, "photo": "../assets/profile.jpeg"}}}
+                responses = [
+                    post({"version": "v1", "format": "html", "content": minimal}),
+                    post({"version": "v1", "format": "markdown", "content": minimal}),
+                    post({"version": "v1", "format": "html", "person": "arthur", "content": photo}),
+                ]
+                self.log_test(
+                    "Request content never takes the server's identity or photo",
+                    all(status == 200 and b"Jane Doe" in body for status, _, body in responses)
+                    and not any(text in body for _, _, body in responses
+                                for text in (b"apassuello", b"79 176", b"Valency", b"data:image/jpeg", b"profile.jpeg")),
+                    f"Statuses: {[status for status, _, _ in responses]}"
+                )
+            finally:
+                server.shutdown()
+                server.server_close()
+                service.close()
+    
+    def test_async_build(self):
+        """Test overlapping targets on an event loop with per-target timeouts"""
+        print("\n=== Testing Async Build ===")
+        
+        class SlowPdfBuilder(CVBuilder):
+            """Chrome stand-in that hangs, to exercise timeouts"""
+            def _try_chrome_headless_pdf(self, html_path, pdf_path, target_version):
+                self._run_tool("chrome_cli", [sys.executable, "-c", "import time; time.sleep(30)"], timeout=60)
+                return True
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            builder = CVBuilder(output_dir=tmp, cache_dir=str(Path(tmp) / "cache"), subset_fonts=False)
+            targets = [("ai", "francois"), ("general", "francois"), ("ai", "original")]
+            results = asyncio.run(builder.abuild(targets, "html"))
+            self.log_test(
+                "Every target built, results in target order",
+                [(result["version"], result["template"]) for result in results] == targets
+                and all(result["success"] for result in results)
+                and builder.output_path("general", ".html").exists(),
+                f"Results: {results}"
+            )
+            
+            slow_builder = SlowPdfBuilder(output_dir=tmp, cache_dir=str(Path(tmp) / "cache"), subset_fonts=False)
+            start = time.perf_counter()
+            results = asyncio.run(slow_builder.abuild([("ai", "francois")], "pdf", timeout=2))
+            self.log_test(
+                "Hung tool killed when its target times out",
+                not results[0]["success"] and "Timed out" in results[0]["error"]
+                and time.perf_counter() - start < 15,
+                f"Result: {results[0]}"
+            )
+    
+    def test_skills_stylesheet(self):
+        """Test the generated skills stylesheet replacing inline style blocks"""
+        print("\n=== Testing Skills Stylesheet ===")
+        
+        css = skills_css()
+        self.log_test(
+            "Rules generated for every table column count and the list layout",
+            all(f'[data-columns="{count}"]' in css for count in range(2, 7)) and ".cv-skill-tag" in css
+        )
+        
+        # Shared class names (.cv-skill-tag, .cv-skill-category) are only restyled inside the list layout
+        list_selectors = [selector.strip() for selector in re.findall(r"^\s*([^@/{}\s][^{}]*?)\s*\{", LIST_CSS, re.M)]
+        self.log_test(
+            "List layout rules scoped to the list container",
+            len(list_selectors) == 6
+            and all(selector.startswith(".cv-skills-list-container") for selector in list_selectors),
+            f"Selectors: {list_selectors}"
+        )
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            builder = CVBuilder(output_dir=tmp, cache_dir=str(Path(tmp) / "cache"), subset_fonts=False)
+            for version in ("ai", "executive"):
+                builder.build_html(version)
+            sheets = [Path(tmp) / version / SKILLS_STYLESHEET for version in ("ai", "executive")]
+            html = builder.output_path("ai", ".html").read_text(encoding="utf-8")
+            body = html.split("<body>", 1)[-1]
+            self.log_test(
+                "One stored stylesheet linked from the head, none inline in the body",
+                all(sheet.exists() for sheet in sheets)
+                and os.path.samefile(sheets[0], sheets[1])
+                and f'href="./{SKILLS_STYLESHEET}"' in html and "<style" not in body
+            )
+    
+    def test_css_pruning(self):
+        """Test pruning template CSS to the selectors a version's HTML uses"""
+        print("\n=== Testing CSS Pruning ===")
+        
+        used = collect_selectors('<div class="cv-a cv-b" id="top"><p>x</p></div>')
+        css = """
+        /* comment */
+        @import url("fonts.css");
+        .cv-a > p, .missing { color: red ; }
+        #top:hover, div:not(.gone)::after { content: "a  ;  b"; }
+        table td { width: 1px }
+        @media print { .cv-b { margin : 0 } .gone { margin: 0 } }
+        @media screen { .gone { margin: 0 } }
+        @page { size: A4; @bottom-right { content: counter(page); } }
+        """
+        pruned, counts = prune_css(css, used)
+        self.log_test(
+            "Unmatched rules dropped, matched ones minified",
+            pruned == '@import url("fonts.css");.cv-a>p{color:red}#top:hover,div:not(.gone)::after{content:"a  ;  b"}'
+            '@media print{.cv-b{margin:0}}@page{size:A4;@bottom-right{content:counter(page)}}'
+            and counts == {"kept": 3, "removed": 3},
+            f"Pruned: {pruned} {counts}"
+        )
+        
+        used = collect_selectors('<div class="w-1/2 md:flex w-[10px]" id="a.b"><p>x</p></div>')
+        css = r".w-1\/2{width:50%}.w-1\/3{width:33%}.md\:flex:hover{display:flex}.w-\[10px\]{width:10px}" \
+              r"#a\.b{color:red}.\77 -1\/2{margin:0}.md\:grid{display:grid}"
+        pruned, counts = prune_css(css, used)
+        self.log_test(
+            "Escaped class and id names matched against the HTML",
+            pruned == r".w-1\/2{width:50%}.md\:flex:hover{display:flex}.w-\[10px\]{width:10px}"
+            r"#a\.b{color:red}.\77 -1\/2{margin:0}" and counts == {"kept": 5, "removed": 2},
+            f"Pruned: {pruned} {counts}"
+        )
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            builder = CVBuilder(output_dir=tmp, cache_dir=str(Path(tmp) / "cache"), subset_fonts=False)
+            builder.build_html("ai")
+            staged = Path(tmp) / "ai" / "css_styling.css"
+            template = Path(builder.available_templates["francois"])
+            self.log_test(
+                "Staged template CSS pruned and cached",
+                staged.stat().st_size < template.stat().st_size / 2
+                and ".cv-section-header" in staged.read_text(encoding="utf-8")
+                and len(list((Path(tmp) / "cache" / "pruned-css").glob("*.css"))) == 1,
+                f"Staged size: {staged.stat().st_size}"
+            )
+    
+    def test_single_file_html(self):
+        """Test inlining stylesheets, fonts and images into one HTML file"""
+        print("\n=== Testing Single-File HTML ===")
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            (tmp_path / "fonts").mkdir()
+            (tmp_path / "fonts" / "A.ttf").write_bytes(b"font")
+            (tmp_path / "icon.png").write_bytes(b"png")
+            (tmp_path / "fonts.css").write_text(
+                "@font-face { font-family: A; src: url('file:///nowhere/A.ttf') format('truetype'),\n"
+                "         url('./fonts/A.ttf') format('truetype'); }\n"
+                "p { background: url(icon.png); }", encoding="utf-8"
+            )
+            html = ('<head><link rel="stylesheet" href="./fonts.css" />'
+                    '<link rel="stylesheet" href="https://example.com/x.css" /></head>'
+                    '<body><img src="icon.png" /><img src="icon.png" /></body>')
+            inlined = inline_html(html, tmp_path)
+            self.log_test(
+                "Local stylesheets, fonts and images inlined, remote links kept",
+                "data:font/ttf;base64,Zm9udA==" in inlined and "file:///" not in inlined
+                and inlined.count('src="data:image/png;base64,cG5n"') == 2
+                and 'url("data:image/png;base64,cG5n")' in inlined
+                and 'href="https://example.com/x.css"' in inlined and "fonts.css" not in inlined,
+                f"Inlined: {inlined[:300]}"
+            )
+            
+            builder = CVBuilder(output_dir=tmp, cache_dir=str(tmp_path / "cache"), single_file=True)
+            builder.build_html("ai")
+            built = builder.output_path("ai", ".html").read_text(encoding="utf-8")
+            self.log_test(
+                "Single-file build references no files next to it",
+                'rel="stylesheet"' not in built and 'src="assets/' not in built and "<style>" in built
+            )
+    
+    def test_backend_stats(self):
+        """Test adaptive PDF backend ordering and the circuit breaker"""
+        print("\n=== Testing Backend Stats ===")
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            stats_path = Path(tmp) / "backend-stats.json"
+            stats = BackendStats(stats_path, failure_threshold=2, cooldown=60)
+            default = ["chrome_headless", "weasyprint", "pandoc"]
+            self.log_test("Default order without history", stats.order(default) == default)
+            
+            for _ in range(4):
+                stats.record("weasyprint", True, 0.5)
+                stats.record("pandoc", True, 0.2)
+            stats.record("chrome_headless", False, 0.1, at=1000.0)
+            stats.record("chrome_headless", False, 0.1, at=1001.0)
+            self.log_test(
+                "Reliable backends first, faster one ahead at equal reliability",
+                stats.order(default) == ["pandoc", "weasyprint", "chrome_headless"],
+                f"Order: {stats.order(default)}"
+            )
+            self.log_test(
+                "Circuit opens after repeated failures and closes after the cooldown",
+                not stats.allowed("chrome_headless", now=1030.0) and stats.allowed("chrome_headless", now=1062.0)
+            )
+            
+            # Losing hedged races: slower in the order, but never a circuit-breaker failure
+            racing = BackendStats(Path(tmp) / "racing.json", failure_threshold=2)
+            for _ in range(2):
+                racing.record("chrome_headless", True, 0.1)
+                racing.record("weasyprint", True, 0.2)
+            for _ in range(3):
+                racing.record("chrome_headless", False, 1.0, lost=True)
+            self.log_test(
+                "Lost races lower the rank without opening the circuit",
+                racing.order(default)[:2] == ["weasyprint", "chrome_headless"] and racing.allowed("chrome_headless")
+                and racing.success_rate("chrome_headless") == racing.success_rate("weasyprint"),
+                f"Order: {racing.order(default)}, {racing.describe('chrome_headless')}"
+            )
+            
+            stats.save()
+            reloaded = BackendStats(stats_path)
+            worker = BackendStats(Path(tmp) / "worker.json")
+            worker.record("chrome_headless", True, 0.3, at=1100.0)
+            reloaded.merge(worker.export_changes())
+            self.log_test(
+                "History persisted and worker outcomes merged",
+                reloaded.median_latency("pandoc") == 0.2 and reloaded.allowed("chrome_headless", now=1101.0)
+                and reloaded.backends["chrome_headless"]["consecutive_failures"] == 0
+            )
+            
+            # Two writers on one file (e.g. two processes) keep each other's outcomes
+            first, second = BackendStats(stats_path, window=1000), BackendStats(stats_path, window=1000)
+            first.record("pandoc", True, 0.1)
+            second.record("weasyprint", False, 0.1)
+            first.save()
+            second.save()
+            saved = BackendStats(stats_path, window=1000)
+            self.log_test(
+                "Saving keeps outcomes saved meanwhile by another writer",
+                len(saved.backends["pandoc"]["outcomes"]) == 5 and len(saved.backends["weasyprint"]["outcomes"]) == 5,
+                f"Outcomes: { {name: len(entry['outcomes']) for name, entry in saved.backends.items()} }"
+            )
+            
+            shared = BackendStats(Path(tmp) / "threads.json", window=10000)
+            threads = [
+                threading.Thread(target=lambda: [shared.record("pandoc", True, 0.1) for _ in range(500)])
+                for _ in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.log_test(
+                "Concurrent records from threads all kept",
+                len(shared.backends["pandoc"]["outcomes"]) == 4000 and len(shared.export_changes()) == 4000
+            )
+            self.log_test(
+                "Builders in one process share one history per file",
+                get_backend_stats(stats_path) is get_backend_stats(Path(tmp) / "." / "backend-stats.json")
+            )
+        
+        class FlakyChromeBuilder(StubPdfBuilder):
+            """Chrome that always fails; WeasyPrint stand-in that always works"""
+            attempts: List[str] = []
+            def _try_chrome_headless_pdf(self, html_path, pdf_path, target_version):
+                self.attempts.append("chrome_headless")
+                return False
+            def _try_weasyprint_pdf(self, html_path, pdf_path, target_version):
+                self.attempts.append("weasyprint")
+                pdf_path.write_bytes(b"%PDF-1.4 stub")
+                return True
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            builder = FlakyChromeBuilder(output_dir=tmp, cache_dir=str(Path(tmp) / "cache"),
+                                         subset_fonts=False, force=True)
+            for _ in range(4):
+                builder.build_all_formats("ai")
+            self.log_test(
+                "Backend that failed is tried after the one that worked",
+                FlakyChromeBuilder.attempts == ["chrome_headless"] + ["weasyprint"] * 4,
+                f"Attempts: {FlakyChromeBuilder.attempts}"
+            )
+    
+    def test_hedged_pdf(self):
+        """Test racing PDF backends: first valid PDF wins, the slower attempt is killed"""
+        print("\n🏁 Testing Hedged PDF Backends...")
+        
+        class HungChromeBuilder(StubPdfBuilder):
+            """Chrome whose subprocess hangs; WeasyPrint stand-in that works"""
+            outcomes: List[str] = []
+            def _try_chrome_headless_pdf(self, html_path, pdf_path, target_version):
+                try:
+                    self._run_tool("chrome_cli", [sys.executable, "-c", "import time; time.sleep(30)"])
+                except BaseException as e:
+                    self.outcomes.append(type(e).__name__)
+                    raise
+                return False
+            def _try_weasyprint_pdf(self, html_path, pdf_path, target_version):
+                pdf_path.write_bytes(b"%PDF-1.4 weasyprint")
+                return True
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            builder = HungChromeBuilder(output_dir=tmp, cache_dir=str(Path(tmp) / "cache"),
+                                        subset_fonts=False, force=True, hedge_delay=0.2)
+            start = time.perf_counter()
+            builder.build_all_formats("ai")
+            elapsed = time.perf_counter() - start
+            pdf_path = builder.output_path("ai", ".pdf")
+            self.log_test(
+                "Second backend wins once the first exceeds the hedging delay",
+                pdf_path.read_bytes() == b"%PDF-1.4 weasyprint" and elapsed < 15,
+                f"Build took {elapsed:.1f}s"
+            )
+            
+            # The loser's thread unwinds once its subprocess is killed
+            deadline = time.time() + 5
+            while not HungChromeBuilder.outcomes and time.time() < deadline:
+                time.sleep(0.05)
+            leftovers = list(pdf_path.parent.glob(".*.pdf"))
+            self.log_test(
+                "Losing backend is cancelled and its temp file removed",
+                HungChromeBuilder.outcomes == ["CancelledError"] and not leftovers,
+                f"Outcomes: {HungChromeBuilder.outcomes}, leftovers: {leftovers}"
+            )
+            chrome = builder.backend_stats.backends.get("chrome_headless", {}).get("outcomes", [])
+            self.log_test(
+                "Cancelled loser recorded as a lost race with its elapsed time, and demoted",
+                len(chrome) == 1 and chrome[0][0] is None and chrome[0][1] >= 0.2
+                and builder.backend_stats.backends["chrome_headless"]["consecutive_failures"] == 0
+                and builder.backend_stats.order(list(builder.PDF_BACKENDS))[0] == "weasyprint",
+                f"Chrome outcomes: {chrome}"
+            )
+        
+        class FailingChromeBuilder(HungChromeBuilder):
+            def _try_chrome_headless_pdf(self, html_path, pdf_path, target_version):
+                return False
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            builder = FailingChromeBuilder(output_dir=tmp, cache_dir=str(Path(tmp) / "cache"),
+                                           subset_fonts=False, force=True, hedge_delay=30)
+            start = time.perf_counter()
+            builder.build_all_formats("ai")
+            elapsed = time.perf_counter() - start
+            self.log_test(
+                "Early failure starts the next backend without waiting for the delay",
+                builder.output_path("ai", ".pdf").read_bytes().startswith(b"%PDF-") and elapsed < 15,
+                f"Build took {elapsed:.1f}s"
+            )
+    
+    def test_weasyprint_renderer(self):
+        """Test that linked stylesheets stay author CSS and cached sheets keep their base URL"""
+        print("\n🖨️  Testing WeasyPrint Renderer...")
+        
+        class FakeWeasyPrint:
+            """Records what the renderer hands WeasyPrint (the library is optional)"""
+            def __init__(self):
+                self.documents, self.stylesheets, self.parsed = [], [], []
+                fake = self
+                class CSS:
+                    def __init__(self, string, base_url, font_config):
+                        self.base_url = base_url
+                        fake.parsed.append(base_url)
+                class HTML:
+                    def __init__(self, string, base_url):
+                        fake.documents.append(string)
+                    def render(self, stylesheets, font_config):
+                        fake.stylesheets.append(stylesheets)
+                        return self
+                    def write_pdf(self, path):
+                        Path(path).write_bytes(b"%PDF-1.4 fake")
+                self.CSS, self.HTML = CSS, HTML
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            fake = FakeWeasyPrint()
+            renderer = WeasyPrintRenderer()
+            renderer._weasyprint, renderer.font_config = fake, object()
+            
+            for name in ("a", "b"):
+                version_dir = Path(tmp) / name
+                version_dir.mkdir()
+                (version_dir / "css_fonts.css").write_text("@font-face { src: url(fonts/x.ttf) }")
+                (version_dir / "css_styling.css").write_text("h1 { color: red }")
+                (version_dir / "print.css").write_text("@page { size: A4 }")
+                (version_dir / "cv.html").write_text(
+                    '<html><head><link rel="stylesheet" href="./css_fonts.css" />'
+                    '<style>h1 { color: blue }</style>'
+                    '<link rel="stylesheet" href="./css_styling.css" />'
+                    '<link rel="stylesheet" href="https://example.com/remote.css" /></head>'
+                    '<body><h1>Jane</h1></body></html>'
+                )
+                renderer.render_file(version_dir / "cv.html", version_dir / "cv.pdf", [version_dir / "print.css"])
+                renderer.render_file(version_dir / "cv.html", version_dir / "cv.pdf", [version_dir / "print.css"])
+            
+            document = fake.documents[0]
+            self.log_test(
+                "Local linked stylesheets inlined as author CSS in document order",
+                document.index("@font-face") < document.index("color: blue") < document.index("color: red")
+                and 'href="./css_styling.css"' not in document and "remote.css" in document
+            )
+            self.log_test(
+                "Only extra stylesheets passed as user stylesheets",
+                all(len(sheets) == 1 for sheets in fake.stylesheets)
+            )
+            self.log_test(
+                "Cached stylesheets parsed once per directory, each with its own base URL",
+                fake.parsed == [(Path(tmp) / name).absolute().as_uri() + "/" for name in ("a", "b")],
+                f"Parsed: {fake.parsed}"
+            )
+    
+    def test_html_writer(self):
+        """Test the standalone HTML skeleton against a golden document"""
+        print("\n📝 Testing HTML Writer...")
+        
+        # pandoc's standalone HTML5 skeleton, as the templates were tuned against
+        golden = """<!DOCTYPE html>
+<html xmlns="http://www.w3.org/1999/xhtml" lang="en" xml:lang="en">
+<head>
+  <meta charset="utf-8" />
+  <meta name="viewport" content="width=device-width, initial-scale=1.0, user-scalable=yes" />
+  <title>Jane &lt;CV&gt;</title>
+  <style>
+    code{white-space: pre-wrap;}
+    span.smallcaps{font-variant: small-caps;}
+    div.columns{display: flex; gap: min(4vw, 1.5em);}
+    div.column{flex: auto; overflow-x: auto;}
+    div.hanging-indent{margin-left: 1.5em; text-indent: -1.5em;}
+    ul.task-list[class]{list-style: none;}
+    ul.task-list li input[type="checkbox"] {
+      font-size: inherit;
+      width: 0.8em;
+      margin: 0 0.8em 0.2em -1.6em;
+      vertical-align: middle;
+    }
+    .display.math{display: block; text-align: center; margin: 0.5rem auto;}
+  </style>
+  <link rel="stylesheet" href="./css_fonts.css" />
+  <link rel="stylesheet" href="./css_styling.css" />
+  <link rel="stylesheet" href="./css_skills.css" />
+</head>
+<body>
+<h1>Jane &amp; Co</h1>
+<p>Body</p>
+</body>
+</html>
+"""
+        body = "\n  <h1>Jane &amp; Co</h1>\n<p>Body</p>\n\n"
+        rendered = render_standalone_html(body, "Jane <CV>")
+        self.log_test("Standalone document matches the golden skeleton", rendered == golden)
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            html_path = Path(tmp) / "cv.html"
+            write_standalone_html(html_path, iter(["\n  ", "<h1>Jane &amp; Co</h1>", "\n", "<p>Body</p>", "\n\n"]),
+                                  "Jane <CV>")
+            self.log_test(
+                "Streamed body written identically, without temp files left",
+                html_path.read_text(encoding="utf-8") == golden and os.listdir(tmp) == ["cv.html"]
+            )
+    
+    def test_chrome_session(self):
+        """Test the DevTools pipe session against a stand-in browser"""
+        print("\n🌐 Testing Chrome Session...")
+        
+        # Speaks the DevTools pipe protocol: NUL-terminated JSON on fds 3 (in) and 4 (out)
+        fake_chrome = f"""#!{sys.executable}
+import json, os, sys
+buffer = b""
+while True:
+    chunk = os.read(3, 65536)
+    if not chunk:
+        break
+    buffer += chunk
+    *messages, buffer = buffer.split(b"\\0")
+    for raw in messages:
+        message = json.loads(raw)
+        os.write(4, json.dumps({{"id": message["id"], "result": {{"product": "Fake"}}}}).encode() + b"\\0")
+        if message["method"] == "Browser.close":
+            sys.exit(0)
+"""
+        hung_chrome = f"#!{sys.executable}\nimport time\ntime.sleep(60)\n"
+        
+        def open_fds():
+            return len(os.listdir("/proc/self/fd")) if os.path.isdir("/proc/self/fd") else 0
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = {}
+            for name, script in [("fake", fake_chrome), ("hung", hung_chrome)]:
+                paths[name] = Path(tmp) / name
+                paths[name].write_text(script)
+                paths[name].chmod(0o755)
+            
+            session = ChromeSession(str(paths["fake"]), timeout=10)
+            session.start()
+            process = session.process
+            version = session.send("Browser.getVersion")
+            session.close()
+            self.log_test(
+                "Session starts, answers commands and shuts the browser down",
+                version == {"product": "Fake"} and process.poll() is not None and session.process is None
+            )
+            
+            session = ChromeSession(str(paths["hung"]), timeout=1)
+            fds = open_fds()
+            try:
+                session.start()
+                started = True
+            except ChromeSessionError:
+                started = False
+            self.log_test(
+                "Unresponsive browser killed and its pipes closed when start fails",
+                not started and session.process is None and open_fds() == fds,
+                f"Open fds: {fds} -> {open_fds()}"
+            )
+            
+            fds = open_fds()
+            try:
+                ChromeSession(str(Path(tmp) / "missing")).start()
+                launched = True
+            except OSError:
+                launched = False
+            self.log_test(
+                "Pipes closed when the browser cannot be launched",
+                not launched and open_fds() == fds,
+                f"Open fds: {fds} -> {open_fds()}"
+            )
+    
+    def test_parallel_build(self):
+        """Test building targets across worker processes (--jobs)"""
+        print("\n⚙️  Testing Parallel Build...")
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_dir = Path(tmp) / "cache"
+            builder = CVBuilder(output_dir=tmp, cache_dir=str(cache_dir), subset_fonts=False)
+            targets = [("ai", "francois"), ("general", "francois"), ("ai", "original")]
+            with contextlib.redirect_stdout(io.StringIO()):
+                results = builder.build_parallel(targets, "html", jobs=2)
+            manifest = json.loads((Path(tmp) / ".build-manifest.json").read_text(encoding="utf-8"))
+            self.log_test(
+                "Every target built by the workers, their manifests merged by the parent",
+                sorted((result["version"], result["template"]) for result in results) == sorted(targets)
+                and all(result["success"] for result in results)
+                and builder.output_path("general", ".html").exists()
+                and all(f"{version}:{template}" in manifest["targets"] for version, template in targets),
+                f"Results: {results}"
+            )
+            self.log_test(
+                "Workers use the parent's cache directory",
+                any((cache_dir / "pruned-css").glob("*.css")),
+            )
+            
+            # One template per version: a version's templates share its HTML file
+            targets = [("ai", "francois"), ("general", "francois")]
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                builder.build_parallel(targets, "html", jobs=2)
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                results = builder.build_parallel(targets, "html", jobs=2)
+            self.log_test(
+                "Unchanged targets skipped on the next parallel run",
+                all(result["success"] for result in results)
+                and output.getvalue().count("HTML up to date") == len(targets),
+                f"Skipped: {output.getvalue().count('HTML up to date')}"
+            )
+    
+    def test_asset_store(self):
+        """Test content-addressed staging of shared assets"""
+        print("\n📦 Testing Asset Store...")
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            store = AssetStore(tmp_path / "store")
+            source = tmp_path / "icon.svg"
+            source.write_text("<svg/>")
+            
+            first, second = tmp_path / "a" / "icon.svg", tmp_path / "b" / "icon.svg"
+            methods = [store.stage(source, first), store.stage(source, second), store.stage(source, first)]
+            self.log_test(
+                "Identical files stored once and hardlinked into every output",
+                methods == ["hardlink", "hardlink", "unchanged"]
+                and os.path.samefile(first, second)
+                and len([path for path in (tmp_path / "store").rglob("*") if path.is_file()]) == 1,
+                f"Methods: {methods}"
+            )
+            
+            stored = store.put_bytes(b"h1{}", ".css")
+            self.log_test(
+                "Generated content addressed by its hash",
+                store.put_bytes(b"h1{}", ".css") == stored and stored.name.endswith(".css")
+                and stored.read_bytes() == b"h1{}" and store.put_bytes(b"h2{}", ".css") != stored
+            )
+            
+            # Restaging replaces the link instead of writing through it
+            source.write_text("<svg>v2</svg>")
+            store.stage(source, first)
+            self.log_test(
+                "Changed source restaged without touching other outputs",
+                first.read_text() == "<svg>v2</svg>" and second.read_text() == "<svg/>"
+            )
+            
+            copied = tmp_path / "c" / "icon.svg"
+            # Filesystem without hardlinks (e.g. outputs on another device)
+            with mock.patch("os.link", side_effect=OSError("hardlinks not supported")):
+                method = store.stage(source, copied)
+            self.log_test(
+                "Falls back to copies when links are unavailable",
+                method in ("reflink", "copy") and copied.read_text() == "<svg>v2</svg>"
+                and not os.path.samefile(copied, first),
+                f"Method: {method}"
+            )
+            
+            (tmp_path / "tree" / "sub").mkdir(parents=True)
+            (tmp_path / "tree" / "sub" / "kept.txt").write_text("kept")
+            stale = tmp_path / "mirror" / "stale.txt"
+            stale.parent.mkdir()
+            stale.write_text("stale")
+            store.stage_tree(tmp_path / "tree", tmp_path / "mirror")
+            self.log_test(
+                "Tree mirrored, files gone from the source removed",
+                (tmp_path / "mirror" / "sub" / "kept.txt").read_text() == "kept" and not stale.exists()
+            )
+    
     def run_all_tests(self):
         """Run all tests"""
         print("🧪 Running Arthur Passuello CV System Tests")
@@ -367,7 +1570,32 @@ class CVSystemTester:
         self.test_projects_processing()
         self.test_priority_filtering()
         self.test_version_conditions()
+        self.test_content_index()
+        self.test_version_keys()
         self.test_markdown_generation()
+        self.test_build_cache()
+        self.test_content_cache()
+        self.test_font_subsetting()
+        self.test_backend_registry()
+        self.test_watch_planning()
+        self.test_document_renderers()
+        self.test_enricher_tokenizer()
+        self.test_streaming_enrichment()
+        self.test_pipeline_benchmark()
+        self.test_profiler()
+        self.test_batch_build()
+        self.test_render_server()
+        self.test_async_build()
+        self.test_skills_stylesheet()
+        self.test_css_pruning()
+        self.test_single_file_html()
+        self.test_backend_stats()
+        self.test_hedged_pdf()
+        self.test_weasyprint_renderer()
+        self.test_html_writer()
+        self.test_chrome_session()
+        self.test_parallel_build()
+        self.test_asset_store()
         
         # Summary
         print("\n" + "=" * 50)
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Watch - Polling file watcher with debouncing for --watch rebuilds
+
+Polling (stat only) keeps this dependency-free and portable. Editors often
+save in bursts (temp file, rename, backup), so a change is reported only once
+the watched tree has been quiet for the debounce window.
+"""
+
+import fnmatch
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+# Editor swap/backup files and atomic-write temporaries never trigger builds
+IGNORED_PATTERNS = [".*", "*~", "*.tmp", "*.swp", "*.swx", "4913"]
+
+
+def _ignored(name: str) -> bool:
+    return any(fnmatch.fnmatch(name, pattern) for pattern in IGNORED_PATTERNS)
+
+
+class ChangeWatcher:
+    """
+    Detects changed, added and removed files under a set of paths.
+
+    Args:
+        roots: Files or directories to watch (directories recursively)
+        globs: Patterns matched in the current directory on every scan
+            (e.g. 'css_*.css'), so new matching files are picked up
+        interval: Seconds between polls
+        debounce: Seconds the tree must stay unchanged before reporting
+    """
+
+    def __init__(
+        self,
+        roots: Iterable[Path],
+        globs: Iterable[str] = (),
+        interval: float = 0.2,
+        debounce: float = 0.3,
+    ):
+        self.roots = [Path(root) for root in roots]
+        self.globs = list(globs)
+        self.interval = interval
+        self.debounce = debounce
+        self._state = self.scan()
+
+    def _files(self) -> Iterable[Path]:
+        for root in self.roots:
+            if root.is_dir():
+                for dirpath, dirnames, filenames in os.walk(root):
+                    dirnames[:] = [d for d in dirnames if not _ignored(d)]
+                    for filename in filenames:
+                        if not _ignored(filename):
+                            yield Path(dirpath) / filename
+            elif root.exists():
+                yield root
+        for pattern in self.globs:
+            for path in Path(".").glob(pattern):
+                if not _ignored(path.name):
+                    yield path
+
+    def scan(self) -> Dict[Path, Tuple[int, int]]:
+        """Current (mtime_ns, size) of every watched file"""
+        state = {}
+        for path in self._files():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue  # Removed between listing and stat
+            state[path] = (stat.st_mtime_ns, stat.st_size)
+        return state
+
+    @staticmethod
+    def diff(old: Dict[Path, Tuple[int, int]], new: Dict[Path, Tuple[int, int]]) -> Set[Path]:
+        """Paths added, removed or modified between two scans"""
+        return {path for path in old.keys() | new.keys() if old.get(path) != new.get(path)}
+
+    def poll(self) -> Set[Path]:
+        """Changes since the last poll (not debounced)"""
+        state = self.scan()
+        changed = self.diff(self._state, state)
+        self._state = state
+        return changed
+
+    def wait_for_changes(self, timeout: Optional[float] = None) -> Set[Path]:
+        """
+        Block until files changed and the tree has been quiet for `debounce`.
+
+        Returns:
+            Every path changed during the burst (empty on timeout)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        changed: Set[Path] = set()
+        quiet_since = None
+
+        while True:
+            burst = self.poll()
+            now = time.monotonic()
+            if burst:
+                changed |= burst
+                quiet_since = now
+            elif changed and now - quiet_since >= self.debounce:
+                return changed
+
+            if deadline is not None and now >= deadline and not changed:
+                return changed
+            time.sleep(self.interval)
+
+
+def describe(paths: Iterable[Path], limit: int = 3) -> str:
+    """Short human summary of changed paths, e.g. 'a.yaml, b.css (+2 more)'"""
+    names: List[str] = sorted(str(path) for path in paths)
+    summary = ", ".join(names[:limit])
+    if len(names) > limit:
+        summary += f" (+{len(names) - limit} more)"
+    return summary
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+WeasyPrint Renderer - Reusable in-process PDF renderer with warm font and CSS caches
+"""
+
+import hashlib
+import os
+import re
+import time
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+
+# Library paths WeasyPrint needs on Homebrew installs (only used during import)
+WEASYPRINT_ENV = {
+    "PKG_CONFIG_PATH": "/opt/homebrew/lib/pkgconfig:/opt/homebrew/opt/libffi/lib/pkgconfig",
+    "DYLD_LIBRARY_PATH": "/opt/homebrew/lib:/opt/homebrew/Cellar/glib/2.84.3/lib",
+}
+
+STYLESHEET_LINK = re.compile(
+    r'<link\s+[^>]*rel="stylesheet"[^>]*href="([^"]+)"[^>]*/?>|'
+    r'<link\s+[^>]*href="([^"]+)"[^>]*rel="stylesheet"[^>]*/?>'
+)
+
+
+def import_weasyprint():
+    """Import WeasyPrint with the Homebrew library environment temporarily set"""
+    old_env = {}
+    for key, value in WEASYPRINT_ENV.items():
+        old_env[key] = os.environ.get(key)
+        os.environ[key] = value
+
+    try:
+        import weasyprint
+        from weasyprint.text.fonts import FontConfiguration
+
+        return weasyprint, FontConfiguration
+    finally:
+        for key, old_value in old_env.items():
+            if old_value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = old_value
+
+
+class WeasyPrintRenderer:
+    """
+    In-process WeasyPrint renderer that stays warm across versions and templates.
+
+    One FontConfiguration is shared by every render, and parsed extra (print)
+    stylesheets are cached by path and content, so their relative url()
+    references keep resolving against their own directory.
+
+    Stylesheets linked from the HTML are author CSS and must stay so: passing
+    them to render(stylesheets=...) would make them user CSS, which loses to
+    the document's <style> blocks and style= attributes and flips !important.
+    Local ones are inlined as <style> blocks where their <link> was (document
+    order kept) instead of being fetched by WeasyPrint.
+    """
+
+    def __init__(self):
+        self._weasyprint = None
+        self.font_config = None
+        self._stylesheets: Dict[Tuple[str, str], Any] = {}
+        self.last_timings: Dict[str, float] = {}
+
+    def load(self) -> None:
+        """Import WeasyPrint and create the shared font configuration (once)"""
+        self._ensure_loaded()
+
+    def _ensure_loaded(self) -> None:
+        """Import WeasyPrint and create the shared font configuration once"""
+        if self._weasyprint is None:
+            self._weasyprint, font_configuration = import_weasyprint()
+            self.font_config = font_configuration()
+
+    def stylesheet(self, css_path: Path) -> Any:
+        """Return a parsed CSS object, reusing the cached one for the same file and content"""
+        self._ensure_loaded()
+        css_path = Path(css_path).absolute()
+        css_text = css_path.read_text(encoding="utf-8")
+        key = (str(css_path), hashlib.sha256(css_text.encode("utf-8")).hexdigest())
+
+        if key not in self._stylesheets:
+            self._stylesheets[key] = self._weasyprint.CSS(
+                string=css_text,
+                base_url=css_path.absolute().parent.as_uri() + "/",
+                font_config=self.font_config,
+            )
+        return self._stylesheets[key]
+
+    def render(
+        self,
+        html: str,
+        pdf_path: Path,
+        base_url: str,
+        stylesheets: Optional[List[Path]] = None,
+    ) -> Dict[str, float]:
+        """
+        Render an in-memory HTML document to PDF.
+
+        Args:
+            html: Complete HTML document
+            pdf_path: Destination PDF file
+            base_url: Base URL for relative image/asset references
+            stylesheets: CSS files applied as user stylesheets (after the
+                document's own author styles, as WeasyPrint's stylesheets= does)
+
+        Returns:
+            Seconds spent in the parse, layout and write phases
+        """
+        self._ensure_loaded()
+        timings = {}
+
+        start = time.perf_counter()
+        css_objects = [self.stylesheet(path) for path in stylesheets or []]
+        document = self._weasyprint.HTML(string=html, base_url=base_url)
+        timings["parse"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        rendered = document.render(stylesheets=css_objects, font_config=self.font_config)
+        timings["layout"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        rendered.write_pdf(str(pdf_path))
+        timings["write"] = time.perf_counter() - start
+
+        self.last_timings = timings
+        return timings
+
+    def render_file(
+        self,
+        html_path: Path,
+        pdf_path: Path,
+        extra_stylesheets: Optional[List[Path]] = None,
+    ) -> Dict[str, float]:
+        """
+        Render an HTML file with its local linked stylesheets inlined.
+
+        Args:
+            html_path: HTML document on disk
+            pdf_path: Destination PDF file
+            extra_stylesheets: CSS files applied as user stylesheets (e.g. print CSS)
+
+        Returns:
+            Seconds spent in the parse, layout and write phases
+        """
+        html_path = Path(html_path)
+        html = html_path.read_text(encoding="utf-8")
+
+        def _inline_link(match: re.Match) -> str:
+            href = match.group(1) or match.group(2)
+            css_path = html_path.parent / href
+            # Inlined url()s resolve against the document, so only sheets next to it
+            if "://" in href or css_path.parent != html_path.parent or not css_path.exists():
+                return match.group(0)  # Leave remote/missing/other stylesheets to WeasyPrint
+            return f"<style>\n{css_path.read_text(encoding='utf-8')}\n</style>"
+
+        html = STYLESHEET_LINK.sub(_inline_link, html)
+
+        return self.render(
+            html,
+            pdf_path,
+            base_url=html_path.absolute().parent.as_uri() + "/",
+            stylesheets=extra_stylesheets,
+        )